@@ -0,0 +1,44 @@
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+
+from analysis.src.python.data_analysis.model.column_name import IssuesColumns, StepColumns, SubmissionColumns, \
+    TopicColumns
+from analysis.src.python.utils.arrow_utils import Filters
+from analysis.src.python.utils.df_utils import read_df
+
+# Compact types of columns which are read by pipeline scripts.
+# Only columns without missing values can be integer.
+COLUMN_DTYPES: Dict[Enum, str] = {
+    SubmissionColumns.ID: 'int32',
+    SubmissionColumns.USER_ID: 'int32',
+    SubmissionColumns.GROUP: 'int32',
+    SubmissionColumns.ATTEMPT: 'int32',
+    SubmissionColumns.TOTAL_ATTEMPTS: 'int32',
+    SubmissionColumns.STEP_ID: 'int32',
+    SubmissionColumns.LANG: 'category',
+    SubmissionColumns.CLIENT: 'category',
+    SubmissionColumns.BASE_CLIENT: 'category',
+
+    StepColumns.ID: 'int32',
+    StepColumns.TOPIC_ID: 'int32',
+
+    TopicColumns.ID: 'int32',
+
+    IssuesColumns.CATEGORY: 'category',
+}
+
+
+def get_column_dtypes(columns: List[Enum]) -> Dict[str, str]:
+    """ Types of given `columns` from registry. Columns without registered type are parsed as usual. """
+
+    return {column.value: COLUMN_DTYPES[column] for column in columns if column in COLUMN_DTYPES}
+
+
+def read_df_columns(path: Union[str, Path], columns: List[Enum], filters: Optional[Filters] = None) -> pd.DataFrame:
+    """ Read only given `columns` from dataframe file with compact types from registry. """
+
+    return read_df(path, columns=[column.value for column in columns], filters=filters,
+                   dtype=get_column_dtypes(columns))
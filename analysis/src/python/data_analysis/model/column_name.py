@@ -159,6 +159,17 @@ class IssuesColumns(Enum):
     POSITION = 'position'
 
 
+@unique
+class IssueTableColumns(Enum):
+    SUBMISSION_ID = 'submission_id'
+    ISSUE_NAME = 'issue_name'
+    LINE = 'line'
+    COLUMN = 'column'
+    CATEGORY = 'category'
+    DIFFICULTY = 'difficulty'
+    INFLUENCE = 'influence'
+
+
 @unique
 class Client(Enum):
     WEB = 'web'
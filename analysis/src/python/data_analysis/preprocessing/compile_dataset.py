@@ -1,36 +1,65 @@
 import argparse
 import logging
 import sys
+from enum import Enum
+from pathlib import Path
+from typing import List, Union
 
+import pandas as pd
+
+from analysis.src.python.data_analysis.model.column_dtypes import get_column_dtypes, read_df_columns
 from analysis.src.python.data_analysis.model.column_name import StepColumns, SubmissionColumns, TopicColumns
-from analysis.src.python.utils.df_utils import merge_dfs, read_df, write_df
+from analysis.src.python.utils.df_utils import ARROW_EXTENSIONS, filter_df, merge_dfs, read_df, write_df
+from analysis.src.python.utils.extension_utils import AnalysisExtension
 from analysis.src.python.utils.file_utils import create_directory, get_output_filename
 from analysis.src.python.utils.logging_utils import configure_logger
 
 
+def read_dataset(path: Union[str, Path], id_columns: List[Enum]) -> pd.DataFrame:
+    """
+    Read dataset to join by `id_columns`. Columnar files are read by id columns only and selected rows are read
+    later with pushed down filters. Other files are read once with all columns, rows are selected in memory.
+    """
+
+    if AnalysisExtension.get_extension_from_file(path) in ARROW_EXTENSIONS:
+        return read_df_columns(path, id_columns)
+    return read_df(path, dtype=get_column_dtypes(id_columns))
+
+
+def select_rows(path: Union[str, Path], df: pd.DataFrame, id_column: Enum, ids: List[int]) -> pd.DataFrame:
+    if AnalysisExtension.get_extension_from_file(path) in ARROW_EXTENSIONS:
+        return read_df(path, filters=[(id_column.value, 'in', ids)])
+    return filter_df(df, [(id_column.value, 'in', ids)])
+
+
 def compile_dataset(submissions_path: str, steps_path: str, topics_path: str, result_path: str):
     """ Create directory with result dataset to analyse: select data which present in all datasets. """
 
-    df_submissions = read_df(submissions_path)
+    df_submissions = read_dataset(submissions_path, [SubmissionColumns.ID, SubmissionColumns.STEP_ID])
     logging.info(f'Submissions initial count: {df_submissions.shape[0]}')
-    df_steps = read_df(steps_path)
+    df_steps = read_dataset(steps_path, [StepColumns.ID, StepColumns.TOPIC_ID])
     logging.info(f'Steps initial count: {df_steps.shape[0]}')
-    df_topics = read_df(topics_path)
+    df_topics = read_dataset(topics_path, [TopicColumns.ID])
     logging.info(f'Topics initial size: {df_topics.shape[0]}')
 
-    df_compile = merge_dfs(df_submissions, df_steps, SubmissionColumns.STEP_ID.value, StepColumns.ID.value)
-    df_compile = merge_dfs(df_compile, df_topics, StepColumns.TOPIC_ID.value, TopicColumns.ID.value)
+    df_compile = merge_dfs(df_submissions[[SubmissionColumns.ID.value, SubmissionColumns.STEP_ID.value]],
+                           df_steps[[StepColumns.ID.value, StepColumns.TOPIC_ID.value]],
+                           SubmissionColumns.STEP_ID.value, StepColumns.ID.value)
+    df_compile = merge_dfs(df_compile, df_topics[[TopicColumns.ID.value]],
+                           StepColumns.TOPIC_ID.value, TopicColumns.ID.value)
 
     logging.info(f'Compiled dataset shape: {df_compile.shape}')
 
-    df_submissions = df_submissions[
-        df_submissions[SubmissionColumns.ID.value].isin(df_compile[SubmissionColumns.ID.value])]
+    submission_ids = df_compile[SubmissionColumns.ID.value].unique().tolist()
+    df_submissions = select_rows(submissions_path, df_submissions, SubmissionColumns.ID, submission_ids)
     logging.info(f'Select {df_submissions.shape[0]} submissions which presented in compile dataset')
 
-    df_steps = df_steps[df_steps[StepColumns.ID.value].isin(df_compile[SubmissionColumns.STEP_ID.value])]
+    step_ids = df_compile[SubmissionColumns.STEP_ID.value].unique().tolist()
+    df_steps = select_rows(steps_path, df_steps, StepColumns.ID, step_ids)
     logging.info(f'Select {df_steps.shape[0]} steps which presented in compile dataset')
 
-    df_topics = df_topics[df_topics[TopicColumns.ID.value].isin(df_compile[StepColumns.TOPIC_ID.value])]
+    topic_ids = df_compile[StepColumns.TOPIC_ID.value].unique().tolist()
+    df_topics = select_rows(topics_path, df_topics, TopicColumns.ID, topic_ids)
     logging.info(f'Select {df_topics.shape[0]} topics which presented in compile dataset')
 
     result_path = create_directory(result_path)
@@ -0,0 +1,50 @@
+import argparse
+import logging
+import sys
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.data_analysis.utils.chunk_stats_utils import save_chunk
+from analysis.src.python.data_analysis.utils.report_utils import explode_reports
+from analysis.src.python.utils.df_utils import read_df_in_chunks
+from analysis.src.python.utils.logging_utils import configure_logger
+
+
+def explode_issues(submissions_path: str, issues_table_path: str, issues_column: str, chunk_size: int):
+    """
+    Convert reports of submissions to the issues table with a row for every issue, so next stages
+    read issues from the table and do not parse reports again.
+    """
+
+    k = 0
+    df_issues_table = None
+    for i, df_submissions in enumerate(read_df_in_chunks(submissions_path, chunk_size)):
+        logging.info(f'Processing chunk: {i}')
+        df_issues_table = explode_reports(df_submissions, issues_column)
+        # Types of columns of empty chunk are unknown, and the first chunk defines types of the table
+        if df_issues_table.empty:
+            continue
+        save_chunk(df_issues_table, issues_table_path, k)
+        k += 1
+
+    if k == 0 and df_issues_table is not None:
+        save_chunk(df_issues_table, issues_table_path, k)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('submissions_path', type=str, help='Path to file with submissions with issues.')
+    parser.add_argument('issues_table_path', type=str,
+                        help='Path to file where issues table will be saved (.parquet is recommended).')
+    parser.add_argument('issues_column', type=str,
+                        help='Column where issues stored (can be hyperstyle_issues or qodana_issues).',
+                        choices=[SubmissionColumns.HYPERSTYLE_ISSUES.value, SubmissionColumns.QODANA_ISSUES.value])
+    parser.add_argument('--chunk-size', '-c', default=50000, type=int,
+                        help='Number of submissions which will be processed simultaneously')
+    parser.add_argument('--log-path', type=str, default=None, help='Path to directory for log.')
+
+    args = parser.parse_args(sys.argv[1:])
+
+    configure_logger(args.issues_table_path, 'preprocess', args.log_path)
+
+    explode_issues(args.submissions_path, args.issues_table_path, args.issues_column, args.chunk_size)
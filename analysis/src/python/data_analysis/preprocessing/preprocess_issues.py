@@ -7,7 +7,8 @@ import pandas as pd
 
 from analysis.src.python.data_analysis.model.column_name import IssuesColumns, SubmissionColumns
 from analysis.src.python.data_analysis.utils.code_utils import get_code_with_issue_comment
-from analysis.src.python.data_analysis.utils.report_utils import parse_report, parse_str_report
+from analysis.src.python.data_analysis.utils.report_utils import log_report_cache_info, parse_report, \
+    parse_str_report
 from analysis.src.python.utils.df_utils import read_df, write_df
 from analysis.src.python.utils.logging_utils import configure_logger
 
@@ -70,6 +71,7 @@ def preprocess_issues(submissions_path: str,
         df_submissions = filter_issues(df_submissions, issues_column, ignore_issue_names)
 
     df_issues_info = get_issues_info(df_submissions, issues_column)
+    log_report_cache_info()
 
     write_df(df_issues_info, issues_info_path)
 
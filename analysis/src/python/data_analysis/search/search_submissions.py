@@ -7,7 +7,7 @@ import pandas as pd
 
 from analysis.src.python.data_analysis.model.column_name import StepsStatsColumns, SubmissionColumns
 from analysis.src.python.data_analysis.utils.code_utils import get_code_with_issue_comment
-from analysis.src.python.data_analysis.utils.report_utils import parse_report
+from analysis.src.python.data_analysis.utils.report_utils import log_report_cache_info, parse_report
 from analysis.src.python.evaluation.tools.utils.saving_utils import save_solution_to_file
 from analysis.src.python.utils.df_utils import read_df, write_df
 from analysis.src.python.utils.file_utils import AnalysisExtension, create_directory
@@ -72,6 +72,8 @@ def search_submissions(submissions_path: str, issues_column: str, steps_issues_p
                                                                            count,
                                                                            output_dir), axis=1)
 
+    log_report_cache_info()
+
 
 if __name__ == '__main__':
     log = logging.getLogger()
@@ -1,39 +1,39 @@
 import argparse
+import logging
 import sys
 from typing import List
 
+import numpy as np
 import pandas as pd
 
+from analysis.src.python.data_analysis.model.column_dtypes import read_df_columns
 from analysis.src.python.data_analysis.model.column_name import IssuesColumns, SubmissionColumns
-from analysis.src.python.utils.df_utils import merge_dfs
+from analysis.src.python.data_analysis.utils.chunk_stats_utils import save_chunk
+from analysis.src.python.utils.df_utils import merge_dfs, read_df
 from analysis.src.python.utils.logging_utils import configure_logger
-from analysis.src.python.data_analysis.utils.chunk_stats_utils import get_statistics_by_chunk
 
 
 def calculate_issues_change_statistics(df_issues_statistics: pd.DataFrame,
-                                       issue_names: List[str]):
-    """ Calculate issues count diff between previous and current attempt in one submissions series. """
+                                       issue_names: List[str]) -> pd.DataFrame:
+    """
+    Calculate issues count diff between previous and current attempt in submissions series.
+    Diffs are calculated for all series at once: counts of submissions sorted by series and attempt
+    are subtracted from counts of the next submission of the same series. Diff of the first attempt is its count.
+    """
 
-    df_issues_statistics = df_issues_statistics.sort_values([SubmissionColumns.ATTEMPT.value])
+    df_issues_statistics = df_issues_statistics.sort_values([SubmissionColumns.GROUP.value,
+                                                             SubmissionColumns.ATTEMPT.value], kind='mergesort')
 
-    issues_change_statistics = {
-        SubmissionColumns.ID.value: df_issues_statistics[SubmissionColumns.ID.value].values,
-    }
+    counts = df_issues_statistics[list(issue_names)].to_numpy()
+    groups = df_issues_statistics[SubmissionColumns.GROUP.value].to_numpy()
+    diffs = counts.copy()
+    is_next_attempt = groups[1:] == groups[:-1]
+    diffs[1:][is_next_attempt] -= counts[:-1][is_next_attempt]
 
-    for issue_name in issue_names:
-        issues_change_statistics[issue_name] = []
-
-    previous_submission_issues_statistics = None
-    for _, submission_issues_statistics in df_issues_statistics.iterrows():
-        for issue_name in issue_names:
-            if previous_submission_issues_statistics is None:
-                diff = submission_issues_statistics[issue_name]
-            else:
-                diff = submission_issues_statistics[issue_name] - previous_submission_issues_statistics[issue_name]
-
-            issues_change_statistics[issue_name].append(diff)
-        previous_submission_issues_statistics = submission_issues_statistics
-    return pd.DataFrame.from_dict(issues_change_statistics)
+    df_issues_change_statistics = pd.DataFrame(diffs, columns=list(issue_names))
+    df_issues_change_statistics.insert(0, SubmissionColumns.ID.value,
+                                       df_issues_statistics[SubmissionColumns.ID.value].to_numpy())
+    return df_issues_change_statistics
 
 
 def get_submissions_issues_change_statistics(submissions_path: str,
@@ -41,24 +41,37 @@ def get_submissions_issues_change_statistics(submissions_path: str,
                                              issues_change_statistics_path: str,
                                              issues_path: str,
                                              chunk_size=20000):
-    """ Calculate issues count diff between previous and current attempt in all submissions series. """
+    """
+    Calculate issues count diff between previous and current attempt in all submissions series.
+    Submissions are sorted by series once, and every chunk of `chunk_size` series is a slice of sorted submissions.
+    """
 
-    df_submissions = pd.read_csv(submissions_path)
-    df_issues_statistics = pd.read_csv(issues_statistics_path)
-    df_issues = pd.read_csv(issues_path)
+    df_submissions = read_df_columns(submissions_path,
+                                     [SubmissionColumns.ID, SubmissionColumns.GROUP, SubmissionColumns.ATTEMPT])
+    df_issues_statistics = read_df(issues_statistics_path)
+    df_issues = read_df_columns(issues_path, [IssuesColumns.NAME])
 
     issue_names = df_issues[IssuesColumns.NAME.value].values
 
     df_submissions = merge_dfs(
-        df_submissions[[SubmissionColumns.ID.value, SubmissionColumns.GROUP.value, SubmissionColumns.ATTEMPT.value]],
+        df_submissions,
         df_issues_statistics,
         SubmissionColumns.ID.value,
         SubmissionColumns.ID.value,
     )
-
-    get_statistics_by_chunk(df_submissions, issues_change_statistics_path, chunk_size,
-                            lambda submission_series:
-                            calculate_issues_change_statistics(submission_series, issue_names))
+    df_submissions = df_submissions.sort_values([SubmissionColumns.GROUP.value, SubmissionColumns.ATTEMPT.value],
+                                                kind='mergesort')
+
+    groups = df_submissions[SubmissionColumns.GROUP.value].to_numpy()
+    group_starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(groups) else np.array([], dtype=int)
+    logging.info(f'Number of series: {len(group_starts)}')
+
+    for k, first_group in enumerate(range(0, len(group_starts), chunk_size)):
+        start = group_starts[first_group]
+        end = group_starts[first_group + chunk_size] if first_group + chunk_size < len(group_starts) else len(groups)
+        logging.info(f'Processing {k}-th chunk with series: [{first_group}, {first_group + chunk_size})')
+        save_chunk(calculate_issues_change_statistics(df_submissions.iloc[start:end], issue_names),
+                   issues_change_statistics_path, k)
 
 
 if __name__ == '__main__':
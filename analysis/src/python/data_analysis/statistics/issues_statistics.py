@@ -1,13 +1,19 @@
 import argparse
 import logging
 import sys
+from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
-from analysis.src.python.data_analysis.model.column_name import IssuesColumns, SubmissionColumns
+from analysis.src.python.data_analysis.model.column_name import IssuesColumns, IssueTableColumns, SubmissionColumns
 from analysis.src.python.data_analysis.utils.chunk_stats_utils import save_chunk
-from analysis.src.python.data_analysis.utils.report_utils import parse_report
+from analysis.src.python.data_analysis.utils.issues_matrix_utils import build_issues_count_matrix, \
+    ISSUES_MATRIX_DTYPE, issues_matrix_to_df, write_issues_matrix
+from analysis.src.python.data_analysis.utils.report_utils import explode_reports
 from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.extension_utils import AnalysisExtension
 from analysis.src.python.utils.logging_utils import configure_logger
 
 
@@ -16,21 +22,38 @@ def calculate_chunk_issues_statistics(df_submissions: pd.DataFrame,
                                       issues_column: str) -> pd.DataFrame:
     """ Calculate number of each issue class in all submissions chunk. """
 
-    issues_statistics = {
-        SubmissionColumns.ID.value: df_submissions[SubmissionColumns.ID.value].values,
-    }
+    return calculate_chunk_issues_statistics_from_table(df_submissions[SubmissionColumns.ID.value].tolist(),
+                                                        explode_reports(df_submissions, issues_column),
+                                                        df_issues)
 
-    for issue_name in df_issues[IssuesColumns.NAME.value].values:
-        issues_statistics[issue_name] = [0] * df_submissions.shape[0]
 
-    submission_index = 0
-    for _, submission_with_issues in df_submissions.iterrows():
-        report = parse_report(submission_with_issues, issues_column)
-        for issue in report.get_issues():
-            issues_statistics[issue.get_name()][submission_index] += 1
-        submission_index += 1
+def calculate_chunk_issues_statistics_from_table(submission_ids: List[int],
+                                                 df_issues_table: pd.DataFrame,
+                                                 df_issues: pd.DataFrame) -> pd.DataFrame:
+    """ Calculate number of each issue class in submissions chunk from issues table, reports are not parsed. """
 
-    return pd.DataFrame.from_dict(issues_statistics)
+    issue_names = df_issues[IssuesColumns.NAME.value].tolist()
+    matrix = build_chunk_issues_matrix(submission_ids, df_issues_table, issue_names)
+    return issues_matrix_to_df(matrix, submission_ids, issue_names)
+
+
+def build_chunk_issues_matrix(submission_ids: List[int],
+                              df_issues_table: pd.DataFrame,
+                              issue_names: List[str],
+                              as_sparse: bool = False) -> Union[np.ndarray, sparse.csr_matrix]:
+    return build_issues_count_matrix(submission_ids,
+                                     df_issues_table[IssueTableColumns.SUBMISSION_ID.value].values,
+                                     df_issues_table[IssueTableColumns.ISSUE_NAME.value].values,
+                                     issue_names,
+                                     as_sparse)
+
+
+def read_chunk_issues_table(issues_table_path: str, submission_ids: List[int]) -> pd.DataFrame:
+    """ Read issues of given submissions from issues table, for columnar table only their rows are read. """
+
+    return read_df(issues_table_path,
+                   columns=[IssueTableColumns.SUBMISSION_ID.value, IssueTableColumns.ISSUE_NAME.value],
+                   filters=[(IssueTableColumns.SUBMISSION_ID.value, 'in', submission_ids)])
 
 
 def get_issues_statistics(
@@ -38,20 +61,47 @@ def get_issues_statistics(
         issues_info_path: str,
         issues_column: str,
         issues_statistics_path: str,
-        chunk_size: int):
-    """ Calculate number of each issue class in all submissions. """
+        chunk_size: int,
+        issues_table_path: Optional[str] = None):
+    """
+    Calculate number of each issue class in all submissions.
+    If `issues_table_path` with issues table of submissions is given, issues are taken from it instead of reports.
+
+    Statistics are saved to .csv file chunk by chunk or to .npz file as one sparse matrix of all submissions,
+    which is much smaller, since most of submissions have few issue classes.
+    """
 
     df_issues = read_df(issues_info_path)
+    issue_names = df_issues[IssuesColumns.NAME.value].tolist()
+    as_sparse = AnalysisExtension.get_extension_from_file(issues_statistics_path) == AnalysisExtension.NPZ
     logging.info(f"Processing dataframe chunk_size={chunk_size}")
 
+    # Reports are not needed if issues are taken from the table
+    columns = None if issues_table_path is None else [SubmissionColumns.ID.value]
+    matrices = [sparse.csr_matrix((0, len(issue_names)), dtype=ISSUES_MATRIX_DTYPE)]
+    submission_ids = []
     k = 0
-    for df_submissions_with_issues in pd.read_csv(submissions_with_issues_path, chunksize=chunk_size):
+    for df_submissions_with_issues in pd.read_csv(submissions_with_issues_path, chunksize=chunk_size,
+                                                  usecols=columns):
         logging.info(f"Processing chunk: {k}")
-        df_issues_statistics = calculate_chunk_issues_statistics(df_submissions_with_issues, df_issues, issues_column)
-
-        save_chunk(df_issues_statistics, issues_statistics_path, k)
+        chunk_submission_ids = df_submissions_with_issues[SubmissionColumns.ID.value].tolist()
+        if issues_table_path is None:
+            df_issues_table = explode_reports(df_submissions_with_issues, issues_column)
+        else:
+            df_issues_table = read_chunk_issues_table(issues_table_path, chunk_submission_ids)
+        matrix = build_chunk_issues_matrix(chunk_submission_ids, df_issues_table, issue_names, as_sparse)
+
+        if as_sparse:
+            matrices.append(matrix)
+            submission_ids.extend(chunk_submission_ids)
+        else:
+            save_chunk(issues_matrix_to_df(matrix, chunk_submission_ids, issue_names), issues_statistics_path, k)
         k += 1
 
+    if as_sparse:
+        write_issues_matrix(issues_statistics_path, sparse.vstack(matrices, format='csr'), submission_ids,
+                            issue_names)
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -62,9 +112,13 @@ if __name__ == '__main__':
                         help='Path to .csv file with preprocessed submissions with series')
     parser.add_argument('issues_info_path', type=str, help='Path to .csv file with issues list (classes and types)')
     parser.add_argument('issues_statistics_path', type=str,
-                        help='Path to .csv file with submissions issues statistics')
+                        help='Path to .csv file with submissions issues statistics '
+                             'or to .npz file with sparse matrix of issues counts')
     parser.add_argument('--chunk-size', '-c', default=50000, type=int,
                         help='Number of groups which will be processed simultaneously')
+    parser.add_argument('--issues-table-path', type=str, default=None,
+                        help='Path to issues table of submissions made by explode_issues.py, '
+                             'which is used instead of parsing reports')
     parser.add_argument('--log-path', type=str, default=None, help='Path to directory for log.')
 
     args = parser.parse_args(sys.argv[1:])
@@ -74,4 +128,5 @@ if __name__ == '__main__':
                           args.issues_info_path,
                           args.issues_column,
                           args.issues_statistics_path,
-                          args.chunk_size)
+                          args.chunk_size,
+                          args.issues_table_path)
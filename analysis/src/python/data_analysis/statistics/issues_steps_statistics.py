@@ -6,6 +6,7 @@ from typing import List, Optional
 
 import pandas as pd
 
+from analysis.src.python.data_analysis.model.column_dtypes import read_df_columns
 from analysis.src.python.data_analysis.model.column_name import IssuesColumns, StepsStatsColumns, SubmissionColumns
 from analysis.src.python.utils.df_utils import merge_dfs, read_df, write_df
 from analysis.src.python.utils.logging_utils import configure_logger
@@ -88,17 +89,20 @@ def get_issues_steps_statistics(submissions_path: str,
     """ Calculate issue statistics for each step. """
     create_directory(issues_steps_statistics_directory_path)
 
-    df_submissions = read_df(submissions_path)
+    df_submissions = read_df_columns(submissions_path, [SubmissionColumns.ID,
+                                                        SubmissionColumns.STEP_ID,
+                                                        SubmissionColumns.ATTEMPT,
+                                                        SubmissionColumns.TOTAL_ATTEMPTS])
 
     # Select submission's attempt
     if attempt_number is not None:
         if attempt_number == -1:
-            df_submissions = df_submissions[
-                df_submissions[SubmissionColumns.ATTEMPT.value] == SubmissionColumns.TOTAL_ATTEMPTS.value]
+            df_submissions = df_submissions[df_submissions[SubmissionColumns.ATTEMPT.value]
+                                            == df_submissions[SubmissionColumns.TOTAL_ATTEMPTS.value]]
         else:
             df_submissions = df_submissions[df_submissions[SubmissionColumns.ATTEMPT.value] == attempt_number]
 
-    df_issues = read_df(issues_path)
+    df_issues = read_df_columns(issues_path, [IssuesColumns.NAME])
     df_issues_statistics = read_df(issue_statistics_path)
 
     df_issues_statistics = merge_dfs(
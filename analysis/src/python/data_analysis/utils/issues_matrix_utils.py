@@ -0,0 +1,76 @@
+from pathlib import Path
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+
+"""
+Matrix of issues counts with a row for every submission and a column for every issue class.
+Matrix is built from issues table (see `explode_reports`) by integer codes of submissions and issues,
+and can be saved as a compact sparse .npz file or converted to dataframe with issues statistics.
+"""
+
+ISSUES_MATRIX_DTYPE = np.int32
+
+
+def build_issues_count_matrix(submission_ids: Sequence[int],
+                              issues_submission_ids: Sequence[int],
+                              issues_names: Sequence[str],
+                              issue_names: Sequence[str],
+                              as_sparse: bool = False) -> Union[np.ndarray, sparse.csr_matrix]:
+    """
+    Count issues of every class in every submission. Issues are given as pairs of `issues_submission_ids`
+    and `issues_names`. Issues of other submissions and issue classes which are not in `issue_names` are skipped.
+    Matrix has a row for every id in `submission_ids`, rows of repeated id have the same counts.
+    """
+
+    # Issues are counted for unique submissions, which rows are copied to positions of all their ids
+    submission_codes, unique_submission_ids = pd.factorize(np.asarray(submission_ids))
+    rows = pd.Index(unique_submission_ids).get_indexer(issues_submission_ids)
+    columns = pd.Index(issue_names).get_indexer(issues_names)
+    known = (rows >= 0) & (columns >= 0)
+    rows, columns = rows[known], columns[known]
+    shape = (len(unique_submission_ids), len(issue_names))
+
+    if as_sparse:
+        # Duplicated (row, column) pairs are summed up
+        values = np.ones(len(rows), dtype=ISSUES_MATRIX_DTYPE)
+        matrix = sparse.csr_matrix((values, (rows, columns)), shape=shape, dtype=ISSUES_MATRIX_DTYPE)
+        return matrix[submission_codes]
+
+    counts = np.bincount(rows * shape[1] + columns, minlength=shape[0] * shape[1])
+    return counts.astype(ISSUES_MATRIX_DTYPE).reshape(shape)[submission_codes]
+
+
+def issues_matrix_to_df(matrix: Union[np.ndarray, sparse.spmatrix],
+                        submission_ids: Sequence[int],
+                        issue_names: Sequence[str]) -> pd.DataFrame:
+    """ Issues statistics dataframe with submission id column and a column with counts of every issue class. """
+
+    if sparse.issparse(matrix):
+        matrix = matrix.toarray()
+    df_statistics = pd.DataFrame(matrix, columns=list(issue_names))
+    df_statistics.insert(0, SubmissionColumns.ID.value, np.asarray(submission_ids))
+    return df_statistics
+
+
+def write_issues_matrix(path: Union[str, Path],
+                        matrix: sparse.csr_matrix,
+                        submission_ids: Sequence[int],
+                        issue_names: Sequence[str]):
+    """ Save sparse issues matrix with its submission ids and issue names to .npz file. """
+
+    np.savez_compressed(path,
+                        data=matrix.data, indices=matrix.indices, indptr=matrix.indptr, shape=matrix.shape,
+                        submission_ids=np.asarray(submission_ids), issue_names=np.asarray(issue_names, dtype=str))
+
+
+def read_issues_matrix(path: Union[str, Path]) -> Tuple[sparse.csr_matrix, List[int], List[str]]:
+    """ Read sparse issues matrix with its submission ids and issue names from .npz file. """
+
+    with np.load(path) as npz:
+        matrix = sparse.csr_matrix((npz['data'], npz['indices'], npz['indptr']), shape=tuple(npz['shape']))
+        return matrix, npz['submission_ids'].tolist(), npz['issue_names'].tolist()
@@ -0,0 +1,84 @@
+from typing import Callable, Dict, Union
+
+import orjson
+
+from analysis.src.python.evaluation.tools.hyperstyle.model.report import HyperstyleIssue, HyperstyleReport, Quality
+from analysis.src.python.evaluation.tools.model.report import BaseReport
+from analysis.src.python.evaluation.tools.qodana.model.report import Attributes, Code, Problem, QodanaReport, Source
+
+"""
+Decoders of code quality reports, specialized for every report class. Reports are parsed by orjson and objects
+are built from parsed dicts directly, without fields introspection, which `from_json` of `dataclass_json` does
+for every value. Decoded reports are equal to reports decoded by `from_json`.
+"""
+
+
+def decode_hyperstyle_issue(issue: dict) -> HyperstyleIssue:
+    return HyperstyleIssue(
+        code=issue['code'],
+        text=issue['text'],
+        line=issue['line'],
+        line_number=issue['line_number'],
+        column_number=issue['column_number'],
+        category=issue['category'],
+        difficulty=issue['difficulty'],
+        influence_on_penalty=issue['influence_on_penalty'],
+    )
+
+
+def decode_hyperstyle_report(report: dict) -> HyperstyleReport:
+    quality = report['quality']
+    return HyperstyleReport(
+        quality=Quality(code=quality['code'], text=quality['text']),
+        issues=[decode_hyperstyle_issue(issue) for issue in report['issues']],
+    )
+
+
+def decode_qodana_source(source: dict) -> Source:
+    code = source['code']
+    return Source(
+        type=source['type'],
+        path=source['path'],
+        language=source['language'],
+        line=source['line'],
+        offset=source['offset'],
+        length=source['length'],
+        code=Code(
+            start_line=code['startLine'],
+            length=code['length'],
+            offset=code['offset'],
+            surrounding_code=code['surroundingCode'],
+        ),
+    )
+
+
+def decode_qodana_problem(problem: dict) -> Problem:
+    return Problem(
+        tool=problem['tool'],
+        category=problem['category'],
+        type=problem['type'],
+        severity=problem['severity'],
+        comment=problem['comment'],
+        details_info=problem['detailsInfo'],
+        sources=[decode_qodana_source(source) for source in problem['sources']],
+        attributes=Attributes(inspection_name=problem['attributes']['inspectionName']),
+    )
+
+
+def decode_qodana_report(report: dict) -> QodanaReport:
+    return QodanaReport(
+        version=report['version'],
+        list_problem=[decode_qodana_problem(problem) for problem in report['listProblem']],
+    )
+
+
+REPORT_DECODERS: Dict[type, Callable[[dict], BaseReport]] = {
+    HyperstyleReport: decode_hyperstyle_report,
+    QodanaReport: decode_qodana_report,
+}
+
+
+def decode_report(str_report: Union[str, bytes], report_class: type) -> BaseReport:
+    """ Decode report of `report_class` from json string. """
+
+    return REPORT_DECODERS[report_class](orjson.loads(str_report))
@@ -0,0 +1,74 @@
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Callable, Dict, List
+
+import orjson
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.data_analysis.utils.report_decoder import decode_report
+from analysis.src.python.evaluation.tools.hyperstyle.model.report import HyperstyleReport
+from analysis.src.python.evaluation.tools.qodana.model.report import QodanaReport
+from analysis.src.python.utils.df_utils import read_df
+
+"""
+Benchmark of code quality reports decoding on reports of submissions dataset:
+specialized decoders against `from_json` of `dataclass_json`. Time of json parsing alone is measured for reference.
+"""
+
+logger = logging.getLogger(__name__)
+
+REPORT_CLASSES = {
+    SubmissionColumns.HYPERSTYLE_ISSUES.value: HyperstyleReport,
+    SubmissionColumns.QODANA_ISSUES.value: QodanaReport,
+}
+
+
+def measure(decode: Callable[[str], object], str_reports: List[str], repeat: int) -> float:
+    """ Mean time of decoding all reports in seconds. """
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for str_report in str_reports:
+            decode(str_report)
+    return (time.perf_counter() - start) / repeat
+
+
+def run_benchmark(str_reports: List[str], issues_column: str, repeat: int) -> Dict[str, float]:
+    """ Time of decoding all reports in seconds by every decoder. """
+
+    report_class = REPORT_CLASSES[issues_column]
+    return {
+        'dataclasses_json': measure(report_class.from_json, str_reports, repeat),
+        'decoder': measure(lambda str_report: decode_report(str_report, report_class), str_reports, repeat),
+        'json_loads': measure(json.loads, str_reports, repeat),
+        'orjson_loads': measure(orjson.loads, str_reports, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('submissions_path', type=str, help='Path to file with submissions with issues.')
+    parser.add_argument('issues_column', type=str, choices=list(REPORT_CLASSES),
+                        help='Column where issues stored (can be hyperstyle_issues or qodana_issues).')
+    parser.add_argument('--count', type=int, default=None, help='number of reports to decode, all by default')
+    parser.add_argument('--repeat', type=int, default=3, help='number of times to decode every report')
+    args = parser.parse_args(sys.argv[1:])
+
+    str_reports = read_df(args.submissions_path, columns=[args.issues_column])[args.issues_column]
+    str_reports = str_reports.dropna().tolist()[:args.count]
+    size = sum(len(str_report.encode()) for str_report in str_reports) / (1 << 20)
+    logger.info(f'Decoding {len(str_reports)} reports ({size:.1f} MiB)')
+
+    timings = run_benchmark(str_reports, args.issues_column, args.repeat)
+    base_time = timings['dataclasses_json']
+    for decoder, timing in timings.items():
+        logger.info(f'{decoder}: {timing:.3f}s, {len(str_reports) / timing:.0f} reports/s, '
+                    f'{size / timing:.1f} MiB/s ({base_time / timing:.1f}x)')
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,23 +1,92 @@
+import logging
+from functools import lru_cache
+from typing import Optional
+
 import pandas as pd
 
-from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
-from analysis.src.python.evaluation.tools.hyperstyle.model.report import HyperstyleReport
-from analysis.src.python.evaluation.tools.model.report import BaseReport
+from analysis.src.python.data_analysis.model.column_name import IssueTableColumns, SubmissionColumns
+from analysis.src.python.data_analysis.utils.report_decoder import decode_report
+from analysis.src.python.evaluation.tools.hyperstyle.model.report import HyperstyleIssue, HyperstyleReport
+from analysis.src.python.evaluation.tools.model.report import BaseIssue, BaseReport
 from analysis.src.python.evaluation.tools.qodana.model.report import QodanaReport
 
+# Number of the last parsed reports, which are cached. Reports of one submission are parsed by several
+# functions in a row, and the same submissions are processed by several passes.
+REPORT_CACHE_SIZE = 1 << 14
 
-def parse_str_report(str_report: str, column: str) -> BaseReport:
-    """ Parse code quality report from json string `str_report` according to `column`. """
 
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _parse_cached_str_report(str_report: str, column: str) -> BaseReport:
     if column == SubmissionColumns.HYPERSTYLE_ISSUES.value:
-        return HyperstyleReport.from_json(str_report)
+        return decode_report(str_report, HyperstyleReport)
     if column == SubmissionColumns.QODANA_ISSUES.value:
-        return QodanaReport.from_json(str_report)
+        return decode_report(str_report, QodanaReport)
 
     raise NotImplementedError(f'Implement parser for issue stored in column: {column}')
 
 
+def parse_str_report(str_report: str, column: str) -> BaseReport:
+    """
+    Parse code quality report from json string `str_report` according to `column`.
+    The last parsed reports are cached, so the same report is parsed once by several passes over submissions.
+    Reports are shared between callers and must not be changed.
+    """
+
+    return _parse_cached_str_report(str_report, column)
+
+
+def get_report_cache_info():
+    """ Number of hits and misses of parsed reports cache and its size, like `cache_info` of `lru_cache`. """
+
+    return _parse_cached_str_report.cache_info()
+
+
+def log_report_cache_info():
+    cache_info = get_report_cache_info()
+    requests = cache_info.hits + cache_info.misses
+    hit_rate = cache_info.hits / requests if requests else 0
+    logging.info(f'Parsed reports cache: {cache_info.hits} hits, {cache_info.misses} misses '
+                 f'(hit rate {hit_rate:.1%}), {cache_info.currsize} reports are cached')
+
+
+def clear_report_cache():
+    _parse_cached_str_report.cache_clear()
+
+
 def parse_report(row: pd.Series, column: str) -> BaseReport:
     """ Parse code quality report from `row` stored in `column` as a json string. """
 
     return parse_str_report(row[column], column)
+
+
+def get_issue_influence(issue: BaseIssue) -> Optional[int]:
+    """ Influence of issue on penalty, only Hyperstyle issues have it. """
+
+    return issue.influence_on_penalty if isinstance(issue, HyperstyleIssue) else None
+
+
+def explode_reports(df_submissions: pd.DataFrame, issues_column: str) -> pd.DataFrame:
+    """
+    Parse reports of submissions stored in `issues_column` once and convert them to the long table
+    with a row for every issue of every submission.
+    """
+
+    issues_table = {column.value: [] for column in IssueTableColumns}
+    for submission_id, str_report in zip(df_submissions[SubmissionColumns.ID.value],
+                                         df_submissions[issues_column]):
+        for issue in parse_str_report(str_report, issues_column).get_issues():
+            issues_table[IssueTableColumns.SUBMISSION_ID.value].append(submission_id)
+            issues_table[IssueTableColumns.ISSUE_NAME.value].append(issue.get_name())
+            issues_table[IssueTableColumns.LINE.value].append(issue.get_line_number())
+            issues_table[IssueTableColumns.COLUMN.value].append(issue.get_column_number())
+            issues_table[IssueTableColumns.CATEGORY.value].append(issue.get_category())
+            issues_table[IssueTableColumns.DIFFICULTY.value].append(issue.get_difficulty())
+            issues_table[IssueTableColumns.INFLUENCE.value].append(get_issue_influence(issue))
+
+    return pd.DataFrame(issues_table).astype({
+        IssueTableColumns.SUBMISSION_ID.value: 'int64',
+        IssueTableColumns.LINE.value: 'int64',
+        IssueTableColumns.COLUMN.value: 'int64',
+        # Influence is missing for issues of tools other than Hyperstyle
+        IssueTableColumns.INFLUENCE.value: 'Int64',
+    })
@@ -0,0 +1,125 @@
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Seconds between summaries of crawl progress in log
+DEFAULT_SUMMARY_INTERVAL = 60
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+def get_percentile(sorted_values: List[float], percentile: float) -> Optional[float]:
+    """ Nearest-rank percentile of sorted values. """
+
+    if not sorted_values:
+        return None
+    rank = max(0, int(round(percentile / 100 * len(sorted_values))) - 1)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class CrawlMetrics:
+    """
+    Metrics of crawl: latency and payload size of every request, responses by status, retries and
+    decoded objects. Metrics are recorded by client workers simultaneously.
+    Summary with throughput, latency percentiles and ETA (if number of expected objects is known)
+    is logged every `summary_interval` seconds and can be dumped to json file.
+    """
+
+    def __init__(self, summary_interval: Optional[float] = DEFAULT_SUMMARY_INTERVAL):
+        self.summary_interval = summary_interval
+        self.started = time.monotonic()
+        self.last_summary = self.started
+        self.latencies: List[float] = []
+        self.bytes = 0
+        self.retries = 0
+        self.pages = 0
+        self.objects = 0
+        self.expected_objects: Optional[int] = None
+        # Number of responses by status code and failed requests by exception name
+        self.statuses = Counter()
+        self.lock = threading.Lock()
+
+    def set_expected_objects(self, expected_objects: Optional[int]):
+        with self.lock:
+            self.expected_objects = expected_objects
+
+    def record_request(self, status: str, latency: float, size: int = 0):
+        """ Record request which took `latency` seconds and returned `size` bytes (or failed with exception). """
+
+        with self.lock:
+            self.latencies.append(latency)
+            self.bytes += size
+            self.statuses[status] += 1
+        self._log_periodic_summary()
+
+    def record_retry(self):
+        with self.lock:
+            self.retries += 1
+
+    def record_page(self, n_objects: int):
+        with self.lock:
+            self.pages += 1
+            self.objects += n_objects
+
+    def get_summary(self) -> Dict[str, Any]:
+        with self.lock:
+            elapsed = time.monotonic() - self.started
+            latencies = sorted(self.latencies)
+            summary = {
+                'elapsed_seconds': elapsed,
+                'requests': len(latencies),
+                'retries': self.retries,
+                'statuses': dict(sorted(self.statuses.items())),
+                'pages': self.pages,
+                'objects': self.objects,
+                'expected_objects': self.expected_objects,
+                'bytes': self.bytes,
+                'objects_per_second': self.objects / elapsed if elapsed > 0 else None,
+                'bytes_per_second': self.bytes / elapsed if elapsed > 0 else None,
+            }
+
+        for percentile in LATENCY_PERCENTILES:
+            latency = get_percentile(latencies, percentile)
+            summary[f'latency_p{percentile}_ms'] = latency * 1000 if latency is not None else None
+        summary['latency_max_ms'] = latencies[-1] * 1000 if latencies else None
+
+        eta = None
+        if summary['expected_objects'] is not None and summary['objects_per_second']:
+            eta = max(0, summary['expected_objects'] - summary['objects']) / summary['objects_per_second']
+        summary['eta_seconds'] = eta
+        return summary
+
+    def log_summary(self):
+        summary = self.get_summary()
+        message = (f'{summary["objects"]} objects in {summary["elapsed_seconds"]:.0f}s, '
+                   f'{summary["requests"]} requests ({summary["retries"]} retries), statuses: {summary["statuses"]}')
+        if summary['requests'] and summary['objects_per_second'] is not None:
+            message += (f', {summary["objects_per_second"]:.1f} objects/s, '
+                        f'{summary["bytes_per_second"] / 1024:.1f} KiB/s, latency '
+                        + ', '.join(f'p{p} {summary[f"latency_p{p}_ms"]:.0f}ms' for p in LATENCY_PERCENTILES))
+        if summary['eta_seconds'] is not None:
+            message += f', ETA {summary["eta_seconds"]:.0f}s'
+        logger.info(message)
+
+    def _log_periodic_summary(self):
+        if self.summary_interval is None:
+            return
+        with self.lock:
+            now = time.monotonic()
+            if now - self.last_summary < self.summary_interval:
+                return
+            self.last_summary = now
+        self.log_summary()
+
+    def dump(self, path: Union[str, Path]):
+        """ Write summary of metrics to json file. """
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as metrics_file:
+            json.dump(self.get_summary(), metrics_file, indent=2)
@@ -1,10 +1,48 @@
+import time
 import webbrowser
+from dataclasses import dataclass
+from enum import Enum, unique
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
 import requests
 
+# Seconds before token expiration, when token is considered expired, so it is not expired during request
+TOKEN_EXPIRATION_MARGIN = 60
+
+
+@unique
+class AuthMode(str, Enum):
+    # Interactive authorization of user in browser
+    AUTHORIZATION_CODE = 'authorization_code'
+    # Authorization of application by client id and secret, which does not need user
+    CLIENT_CREDENTIALS = 'client_credentials'
+
+    @classmethod
+    def values(cls):
+        return list(map(lambda c: c.value, cls))
+
+
+@dataclass(frozen=True)
+class PlatformToken:
+    access_token: str
+    # Unix time of token expiration, if platform reports it
+    expires_at: Optional[float] = None
+    refresh_token: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: dict) -> 'PlatformToken':
+        """ Token from platform response to token request. """
+
+        expires_in = response.get('expires_in')
+        return PlatformToken(access_token=response['access_token'],
+                             expires_at=time.time() + float(expires_in) if expires_in is not None else None,
+                             refresh_token=response.get('refresh_token'))
+
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at - TOKEN_EXPIRATION_MARGIN <= time.time()
+
 
 class OauthHandler(BaseHTTPRequestHandler):
     """ Handler process authorization code request and ask platform for access token."""
@@ -32,8 +70,8 @@ class OauthHandler(BaseHTTPRequestHandler):
         self.send_response(200)
         self.send_header("Content-type", "text/html")
         self.end_headers()
-        self.server.platform_token = response.json()['access_token']
-        self.wfile.write(response.json()['access_token'].encode())
+        self.server.platform_token = PlatformToken.from_response(response.json())
+        self.wfile.write(b'Authorized, the page can be closed')
 
 
 class OauthServer(HTTPServer):
@@ -56,7 +94,7 @@ class OauthServer(HTTPServer):
             client_id=self.client_id)
         webbrowser.open(oauth_url)
 
-    def get_token(self) -> Optional[str]:
+    def get_token(self) -> Optional[PlatformToken]:
         """ Execute token request. """
 
         self.handle_request()
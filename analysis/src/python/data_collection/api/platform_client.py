@@ -1,30 +1,238 @@
 import datetime
+import itertools
+import json
 import logging
-from dataclasses import asdict
-from typing import Dict, List, Optional, Type, TypeVar
+import math
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Type, TypeVar, Union
 
 import requests
-from dacite import Config, from_dict
+from requests.adapters import HTTPAdapter
 
-from analysis.src.python.data_collection.api.platform_auth import OauthServer
-from analysis.src.python.data_collection.api.platform_objects import BaseRequestParams, Object, ObjectResponse
-from analysis.src.python.data_collection.api.utils import str_to_datetime
-from analysis.src.python.data_collection.utils.json_utils import kebab_to_snake_case
+from analysis.src.python.data_collection.api.crawl_metrics import CrawlMetrics, DEFAULT_SUMMARY_INTERVAL
+from analysis.src.python.data_collection.api.platform_auth import AuthMode, OauthServer, PlatformToken
+from analysis.src.python.data_collection.api.platform_objects import BaseRequestParams, get_object_id, Object, \
+    ObjectResponse
+from analysis.src.python.data_collection.api.rate_limiter import RateLimiter
+from analysis.src.python.data_collection.api.response_decoder import get_response_decoder
+from analysis.src.python.data_collection.api.token_cache import TokenCache
+from analysis.src.python.data_collection.utils.object_store import ObjectStore
+from analysis.src.python.utils.parallel_utils import map_ordered
 
 T = TypeVar('T', bound=Object)
+K = TypeVar('K')
+
+DEFAULT_POOL_SIZE = 10
+# Seconds to wait for connection to platform and for response data
+DEFAULT_TIMEOUT = 60
+DEFAULT_RETRIES = 5
+# Seconds to wait before the first retry, every next retry waits twice longer
+DEFAULT_BACKOFF = 1
+# Statuses of responses after which request is retried
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Max length of comma separated ids in request, so request url fits common url length limits
+MAX_IDS_LENGTH = 2000
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """ Session which keeps up to `pool_size` alive connections to the platform and accepts compressed responses. """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+    return session
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """ Seconds to wait from `Retry-After` header, which contains seconds or http date. """
+
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_date - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0)
+
+
+def split_ids_to_batches(ids: List[int], batch_size: int,
+                         max_length: int = MAX_IDS_LENGTH,
+                         separator_length: int = 1) -> List[List[int]]:
+    """
+    Split `ids` to batches of at most `batch_size` ids, at most `max_length` long when joined
+    by separator of `separator_length` (comma by default).
+    """
+
+    batches = []
+    batch = []
+    batch_length = 0
+    for obj_id in ids:
+        id_length = len(str(obj_id))
+        if batch and (len(batch) == batch_size or batch_length + separator_length + id_length > max_length):
+            batches.append(batch)
+            batch = []
+            batch_length = 0
+        batch_length += id_length + (separator_length if batch else 0)
+        batch.append(obj_id)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def get_listing_key(params: BaseRequestParams, obj_id: Optional[int] = None) -> str:
+    """ Key of objects listing by request `params` and `obj_id`, which does not depend on requested page. """
+
+    listing_params = {key: value for key, value in asdict(params).items()
+                      if key not in ('page', 'page_size') and value is not None}
+    return json.dumps({'obj_id': obj_id, **listing_params}, sort_keys=True, default=str)
+
+
+def is_newest_first(page_ids: List[int], last_id: Optional[int]) -> bool:
+    """ Check that ids of page go in decreasing order after `last_id` of the previous page. """
+
+    ids = ([] if last_id is None else [last_id]) + page_ids
+    return all(prev_id > next_id for prev_id, next_id in zip(ids, ids[1:]))
+
+
+@dataclass
+class ListingProgress:
+    """ Listing of objects with `key`, which pages are fetched from the newest (`max_id`) to the oldest objects. """
+
+    key: str
+    max_id: Optional[int] = None
+    last_id: Optional[int] = None
+
+    def add_page(self, page_ids: List[Optional[int]]) -> bool:
+        """ Add ids of the next page, return False if they do not go after ids of previous pages. """
+
+        if None in page_ids or not is_newest_first(page_ids, self.last_id):
+            return False
+        if page_ids:
+            self.last_id = page_ids[-1]
+            self.max_id = page_ids[0] if self.max_id is None else self.max_id
+        return True
 
 
 class PlatformClient:
-    """ Base class for Hyperskill and Stepik clients which wraps data exchange process according to open APIs. """
+    """
+    Base class for Hyperskill and Stepik clients which wraps data exchange process according to open APIs.
+    All requests are sent through one pooled session, so connections to platform are reused between pages.
+    Up to `n_workers` requests are sent simultaneously: pages are prefetched and objects for several ids are fetched
+    at once, results are returned in the same order as for sequential fetching.
+    Requests are limited to `rate_limit` per second and retried up to `n_retries` times with exponential backoff
+    if platform is overloaded.
+    If `store` with objects from previous runs is given, paging stops at the first page of already collected objects.
+    Responses are decoded to objects dataclasses, only given `fields` of objects are decoded if they are set.
+    If `raw` is set, objects are returned as json dicts without decoding.
+
+    Token is requested according to `auth_mode`: by interactive authorization in browser or by client credentials.
+    If `token_cache` is given, token is reused by next clients until it expires. Expired token is refreshed
+    (or requested again) before the next request and after platform responds with 401 status.
+
+    Latency, size and status of every request, retries and decoded objects are recorded to `metrics`,
+    which summary is logged every `metrics_interval` seconds and is written to `metrics_path` json file on close.
+    """
 
-    def __init__(self, host: str, client_id: str, client_secret: str, port: int):
+    # Length of separator between ids in request url, see `_prepare_params`
+    ids_separator_length = 1
+
+    def __init__(self, host: str, client_id: str, client_secret: str, port: int,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 n_workers: int = 1,
+                 rate_limit: Optional[float] = None,
+                 n_retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF,
+                 store: Optional[ObjectStore] = None,
+                 raw: bool = False,
+                 fields: Optional[List[str]] = None,
+                 auth_mode: AuthMode = AuthMode.AUTHORIZATION_CODE,
+                 token_cache: Optional[TokenCache] = None,
+                 metrics_interval: Optional[float] = DEFAULT_SUMMARY_INTERVAL,
+                 metrics_path: Optional[str] = None):
         self.host = host
         self.client_id = client_id
         self.client_secret = client_secret
         self.port = port
-        self.token = self._get_authentication_code_token()
+        self.timeout = timeout
+        self.n_workers = n_workers
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.n_retries = n_retries
+        self.backoff = backoff
+        self.store = store
+        self.raw = raw
+        self.fields = frozenset(fields) if fields is not None else None
+        self.metrics = CrawlMetrics(metrics_interval)
+        self.metrics_path = metrics_path
+        # Every worker needs its own connection
+        self.session = create_session(max(pool_size, n_workers))
+        self.auth_mode = auth_mode
+        self.token_cache = token_cache
+        self.token: Optional[PlatformToken] = None
+        self.token_lock = threading.Lock()
+        self._set_token(self._get_token())
+
+    def close(self):
+        logging.info(f'Requests to {self.host} are finished')
+        self.metrics.log_summary()
+        if self.metrics_path is not None:
+            self.metrics.dump(self.metrics_path)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _set_token(self, token: Optional[PlatformToken]):
+        self.token = token
+        if token is not None:
+            self.session.headers.update({'Authorization': 'Bearer {token}'.format(token=token.access_token)})
+
+    def _get_token(self) -> Optional[PlatformToken]:
+        """ Get valid token from cache, refresh expired cached token or request new one. """
+
+        token = self.token_cache.get(self.host, self.client_id) if self.token_cache is not None else None
+        if token is not None and not token.is_expired():
+            logging.info(f'Using cached token for {self.host}')
+            return token
+        return self._renew_token(token)
 
-    def _get_authentication_code_token(self):
+    def _renew_token(self, token: Optional[PlatformToken]) -> Optional[PlatformToken]:
+        """ Refresh `token` if it can be refreshed or request new one according to auth mode. """
+
+        new_token = None
+        if token is not None and token.refresh_token is not None:
+            new_token = self._get_refreshed_token(token.refresh_token)
+        if new_token is None:
+            if self.auth_mode == AuthMode.CLIENT_CREDENTIALS:
+                new_token = self._get_client_credential_token()
+            else:
+                new_token = self._get_authentication_code_token()
+
+        if new_token is not None and self.token_cache is not None:
+            self.token_cache.put(self.host, self.client_id, new_token)
+        return new_token
+
+    def _update_expired_token(self, expired_token: Optional[PlatformToken]):
+        """ Renew token once for all workers, which found that `expired_token` is expired or rejected. """
+
+        with self.token_lock:
+            if self.token is expired_token:
+                self._set_token(self._renew_token(expired_token))
+
+    def _get_authentication_code_token(self) -> Optional[PlatformToken]:
         """ Runs authorization process using authentication-code grant type and
         gets session token for data exchange. """
 
@@ -32,70 +240,192 @@ class PlatformClient:
         server.open_oauth_page()
         return server.get_token()
 
-    def _get_client_credential_token(self) -> str:
+    def _get_client_credential_token(self) -> PlatformToken:
         """ Runs authorization process using client-credential grant type and
         gets session token for data exchange. """
 
         auth = requests.auth.HTTPBasicAuth(self.client_id, self.client_secret)
-        response = requests.post('{host}/oauth2/token/'.format(host=self.host),
-                                 data={'grant_type': 'client_credentials'},
-                                 auth=auth)
+        response = self.session.post('{host}/oauth2/token/'.format(host=self.host),
+                                     data={'grant_type': 'client_credentials'},
+                                     auth=auth,
+                                     timeout=self.timeout)
         token = response.json().get('access_token', None)
         if not token:
             logging.error('Unable to authorize with provided credentials')
             exit(1)
-        logging.info(f'Got token: {token}')
-        return token
+        logging.info('Got token by client credentials')
+        return PlatformToken.from_response(response.json())
+
+    def _get_refreshed_token(self, refresh_token: str) -> Optional[PlatformToken]:
+        """ Get new token by refresh token of expired one. """
+
+        auth = requests.auth.HTTPBasicAuth(self.client_id, self.client_secret)
+        try:
+            response = self.session.post('{host}/oauth2/token/'.format(host=self.host),
+                                         data={'grant_type': 'refresh_token', 'refresh_token': refresh_token},
+                                         auth=auth,
+                                         timeout=self.timeout)
+            if response.status_code == 200 and response.json().get('access_token'):
+                logging.info('Refreshed expired token')
+                return PlatformToken.from_response(response.json())
+            logging.warning(f'Unable to refresh token: {response}')
+        except (requests.RequestException, ValueError) as e:
+            logging.warning(f'Unable to refresh token: {e}')
+        return None
 
     def _get_objects(self,
                      obj_class: str,
                      obj_response_type: Type[ObjectResponse[T]],
                      params: BaseRequestParams,
                      obj_id: Optional[int] = None,
-                     count: Optional[int] = None) -> List[T]:
-        """ Get objects (steps, topics, ect.) from platform by given `obj_class`, `params` and `obj_id`."""
+                     count: Optional[int] = None,
+                     n_workers: Optional[int] = None) -> Iterator[T]:
+        """
+        Lazily get objects (steps, topics, ect.) from platform by given `obj_class`, `params` and `obj_id`.
+        Objects are yielded page by page, so they can be saved before all pages are fetched.
+        Up to `n_workers` next pages are requested while current page is processed.
+        Platform does not report total number of pages, so pages after the last one can be requested in vain.
+        Long `params.ids` list is split to batches, which fit one page and request url.
 
-        objects = []
-        page = 1
-        while count is None or len(objects) < count:
-            logging.info(f'Getting {obj_class} page={page} params={params}')
-            try:
-                params.page = page
-                response = self._fetch(obj_class, params, obj_response_type, obj_id)
-                if response is None:
-                    break
-                objects += response.get_objects()
+        If client has `store`, paging stops at the page which contains only objects collected by previous complete
+        listings with the same params. Listing order is not documented by platforms, so this is done only while
+        fetched pages go from the newest (max id) to the oldest objects.
+        """
+
+        if params.ids is not None:
+            ids_batches = split_ids_to_batches(params.ids, params.page_size,
+                                               separator_length=self.ids_separator_length)
+            if len(ids_batches) > 1:
+                yield from self._get_objects_by_ids_batches(obj_class, obj_response_type, params, ids_batches,
+                                                            obj_id, count)
+                return
+
+        pages = itertools.count(1)
+        if count is not None:
+            pages = range(1, math.ceil(count / params.page_size) + 1)
+
+        def fetch_page(page: int) -> Optional[ObjectResponse[T]]:
+            return self._fetch_page(obj_class, params, obj_response_type, obj_id, page)
+
+        listing = ListingProgress(get_listing_key(params, obj_id)) \
+            if self.store is not None and params.ids is None else None
+        is_complete = False
+
+        objects_count = 0
+        for response in map_ordered(fetch_page, pages, n_workers or self.n_workers):
+            if response is None:
+                break
+            page_objects = response.get_objects()
+            if count is not None:
+                page_objects = page_objects[:count - objects_count]
+            listing = self._update_listing(obj_class, listing, page_objects)
+
+            yield from page_objects
+            objects_count += len(page_objects)
 
-                if count is not None and len(objects) >= count:
-                    return objects[:count]
+            if count is not None and objects_count >= count:
+                break
 
-                if response.meta.has_next:
-                    page += 1
-                else:
-                    break
-            except Exception as e:
-                logging.error(f'Unable to get {obj_class} page={page} params={params}: {e}')
+            is_complete = not response.meta.has_next or self._is_known_page(obj_class, listing, response, page_objects)
+            if is_complete:
+                break
 
-        return objects
+        # Only complete listings are marked, so objects of interrupted listing are requested again by the next run
+        if listing is not None and is_complete and listing.max_id is not None:
+            self.store.set_watermark(obj_class, listing.key, listing.max_id)
+
+    def _get_objects_by_ids_batches(self,
+                                    obj_class: str,
+                                    obj_response_type: Type[ObjectResponse[T]],
+                                    params: BaseRequestParams,
+                                    ids_batches: List[List[int]],
+                                    obj_id: Optional[int] = None,
+                                    count: Optional[int] = None) -> Iterator[T]:
+        """ Lazily get objects by every batch of ids, which are requested instead of all `params.ids` at once. """
+
+        return self._get_objects_by_keys(
+            lambda ids_batch: self._get_objects(obj_class, obj_response_type, replace(params, ids=ids_batch),
+                                                obj_id, count, n_workers=1),
+            ids_batches,
+            count,
+        )
+
+    def _update_listing(self,
+                        obj_class: str,
+                        listing: Optional[ListingProgress],
+                        page_objects: List[T]) -> Optional[ListingProgress]:
+        """ Add fetched page to `listing`, which is not tracked further if pages do not go from the newest objects. """
+
+        if listing is None or listing.add_page([get_object_id(obj) for obj in page_objects]):
+            return listing
+        logging.warning(f'{obj_class} objects are not listed from the newest ones, '
+                        f'paging does not stop at already collected objects')
+        return None
+
+    def _is_known_page(self,
+                       obj_class: str,
+                       listing: Optional[ListingProgress],
+                       response: ObjectResponse[T],
+                       page_objects: List[T]) -> bool:
+        """ Check that page contains only collected objects, so next pages of `listing` contain them too. """
+
+        if listing is None or not self.store.is_known_page(obj_class, listing.key, page_objects):
+            return False
+        logging.info(f'Stop getting {obj_class} at already collected page={response.meta.page}')
+        return True
+
+    def _get_objects_by_keys(self,
+                             get_key_objects: Callable[[K], Iterable[T]],
+                             keys: List[K],
+                             count: Optional[int] = None) -> Iterator[T]:
+        """
+        Lazily get objects for every key by `get_key_objects` and yield them in order of `keys`.
+        Objects for up to `n_workers` keys are fetched simultaneously, pages of every key are fetched sequentially.
+        """
+
+        objects_count = 0
+        for key_objects in map_ordered(lambda key: list(get_key_objects(key)), keys, self.n_workers):
+            if count is not None:
+                key_objects = key_objects[:count - objects_count]
+            yield from key_objects
+            objects_count += len(key_objects)
+            if count is not None and objects_count >= count:
+                break
 
     def _get_objects_by_ids(self,
                             obj_class: str,
                             obj_ids: List[int],
                             obj_response_type: Type[ObjectResponse[T]],
                             params: BaseRequestParams,
-                            count: Optional[int] = None) -> List[T]:
-        """ Get objects (steps, topics, ect.) from platform by given `obj_class`, `params` and `obj_ids`."""
+                            count: Optional[int] = None) -> Iterator[T]:
+        """ Lazily get objects (steps, topics, ect.) from platform by given `obj_class`, `params` and `obj_ids`."""
 
-        objects = []
-        for obj_id in obj_ids:
-            objects += self._get_objects(obj_class, obj_response_type, params, obj_id)
-            if count is not None and len(objects) >= count:
-                return objects[:count]
+        return self._get_objects_by_keys(
+            lambda obj_id: self._get_objects(obj_class, obj_response_type, params, obj_id, n_workers=1),
+            obj_ids,
+            count,
+        )
 
-        return objects
+    def _fetch_page(self,
+                    obj_class: str,
+                    params: BaseRequestParams,
+                    obj_response_type: Type[ObjectResponse[T]],
+                    obj_id: Optional[int],
+                    page: int) -> Optional[ObjectResponse[T]]:
+        """
+        Fetch one `page` of objects. Params are copied, because pages can be fetched simultaneously.
+        Error of the last retry is raised, so failed page does not look like the end of listing.
+        """
 
-    @staticmethod
-    def _prepare_params(params: BaseRequestParams) -> Dict[str, str]:
+        page_params = replace(params, page=page)
+        logging.info(f'Getting {obj_class} page={page} params={page_params}')
+        try:
+            return self._fetch(obj_class, page_params, obj_response_type, obj_id)
+        except Exception as e:
+            logging.error(f'Unable to get {obj_class} page={page} params={page_params}: {e}')
+            raise
+
+    def _prepare_params(self, params: BaseRequestParams) -> Dict[str, Union[str, List[str]]]:
         """ Prepare request params. Remove None params and convert list request values to string objects,
         separated by comma. """
 
@@ -108,6 +438,59 @@ class PlatformClient:
             dict_params[key] = value
         return dict_params
 
+    def _get_retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """ Delay from `Retry-After` header or exponential backoff with full jitter. """
+
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return retry_after
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    def _get_with_retries(self, api_url: str, params: Dict[str, str]) -> requests.Response:
+        """
+        Send GET request, which is retried if platform is overloaded (429 or 5xx status) or connection failed.
+        Expired token is renewed before request, rejected token (401 status) is renewed and request is repeated.
+        Response or exception of the last attempt is returned or raised.
+        """
+
+        for attempt in range(self.n_retries + 1):
+            token = self.token
+            if token is not None and token.is_expired():
+                self._update_expired_token(token)
+            self.rate_limiter.acquire()
+            response = None
+            start = time.perf_counter()
+            try:
+                response = self.session.get(api_url, params=params, timeout=self.timeout)
+            except requests.RequestException as e:
+                self.metrics.record_request(type(e).__name__, time.perf_counter() - start)
+                if attempt == self.n_retries:
+                    raise
+            else:
+                self.metrics.record_request(str(response.status_code), time.perf_counter() - start,
+                                            len(response.content))
+                if response.status_code == 401 and token is not None and attempt < self.n_retries:
+                    # Token was revoked or expired earlier than reported
+                    self._update_expired_token(token)
+                    self.metrics.record_retry()
+                    continue
+                if response.status_code not in RETRY_STATUSES:
+                    self.rate_limiter.speed_up()
+                    return response
+                if attempt == self.n_retries:
+                    return response
+
+            delay = self._get_retry_delay(attempt, response)
+            self.metrics.record_retry()
+            logging.warning(f'Retrying request to {api_url} in {delay:.1f}s (attempt {attempt + 1}), '
+                            f'response: {response}')
+            if response is not None and response.status_code == 429:
+                # All workers wait, since the limit is common for client
+                self.rate_limiter.slow_down(delay)
+            else:
+                time.sleep(delay)
+
     def _fetch(self,
                obj_class: str,
                params: BaseRequestParams,
@@ -121,19 +504,16 @@ class PlatformClient:
 
         if obj_id is not None:
             api_url = '{url}/{obj_id}'.format(url=api_url, obj_id=obj_id)
-        if self.token is not None:
-            raw_response = requests.get(api_url, headers={'Authorization': 'Bearer {token}'.format(token=self.token)},
-                                        params=dict_params, timeout=None)
-        else:
-            raw_response = requests.get(api_url, params=dict_params, timeout=None)
+        raw_response = self._get_with_retries(api_url, dict_params)
+        if raw_response.status_code in RETRY_STATUSES:
+            # Platform is still overloaded after all retries
+            raw_response.raise_for_status()
 
         if raw_response is None or raw_response.status_code != 200:
             logging.warning(f"Failed to fetch {api_url}: {raw_response}")
             return None
-        else:
-            response_json = raw_response.json()
 
-        preprocessed_response = kebab_to_snake_case(response_json)
-        return from_dict(data_class=obj_response_type,
-                         data=preprocessed_response,
-                         config=Config(type_hooks={datetime.datetime: str_to_datetime}))
+        decode_response = get_response_decoder(obj_response_type, self.raw, self.fields)
+        response = decode_response(raw_response.json())
+        self.metrics.record_page(len(response.get_objects()))
+        return response
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, unique
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, List, Optional, TypeVar, Union
 
 
 @unique
@@ -18,6 +18,12 @@ class Object:
     pass
 
 
+def get_object_id(obj: Union[Object, dict]) -> Optional[int]:
+    """ Id of object or of raw json object, if it has id. """
+
+    return obj.get('id') if isinstance(obj, dict) else getattr(obj, 'id', None)
+
+
 @dataclass
 class BaseRequestParams:
     page: int = 1
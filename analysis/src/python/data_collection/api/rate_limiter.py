@@ -0,0 +1,59 @@
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token bucket which allows up to `rate` requests per second on average and bursts up to `rate` requests.
+    Rate is adaptive: it is halved when platform asks to slow down and restored gradually after successful requests.
+    Pause (e.g. from `Retry-After` header) stops all requests until it ends.
+    If `rate` is None, only pauses are applied.
+    """
+
+    # Rate never falls below this part of the initial rate
+    MIN_RATE_FRACTION = 1 / 16
+    # Part of the initial rate, which is restored after every successful request
+    RATE_RECOVERY_FRACTION = 1 / 20
+
+    def __init__(self, rate: Optional[float] = None):
+        self.max_rate = rate
+        self.rate = rate
+        self.tokens = 0 if rate is None else max(rate, 1)
+        self.updated = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """ Wait until request is allowed. """
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.rate is None:
+                    return
+                else:
+                    self.tokens = min(max(self.max_rate, 1), self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def slow_down(self, pause: float = 0):
+        """ Stop all requests for `pause` seconds and halve the rate. """
+
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+            if self.rate is not None:
+                self.rate = max(self.max_rate * self.MIN_RATE_FRACTION, self.rate / 2)
+
+    def speed_up(self):
+        """ Restore the rate a little after successful request. """
+
+        with self.lock:
+            if self.rate is not None:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.RATE_RECOVERY_FRACTION)
@@ -0,0 +1,167 @@
+import datetime
+import logging
+from dataclasses import fields, is_dataclass, MISSING
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, get_args, get_origin, get_type_hints, List, Optional, Tuple, Type, \
+    TypeVar, Union
+
+from analysis.src.python.data_collection.api.platform_objects import Object, ObjectResponse
+from analysis.src.python.data_collection.api.utils import str_to_datetime
+
+"""
+Decoders of platforms responses to `ObjectResponse` dataclasses. Decoder is compiled once for every response class
+from its fields type hints, so decoding of page does not inspect types like `dacite.from_dict` does for every value.
+Keys of response are accepted both in snake and kebab case.
+"""
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=Object)
+
+# Decoder of json value. None decoder means that value is used as is.
+Decoder = Optional[Callable[[Any], Any]]
+
+_NONE_TYPE = type(None)
+
+
+def _decode(decoder: Decoder, value: Any) -> Any:
+    return value if decoder is None or value is None else decoder(value)
+
+
+def _compile_union_decoder(args: Tuple) -> Decoder:
+    types = [arg for arg in args if arg is not _NONE_TYPE]
+    if len(types) == 1:
+        return compile_decoder(types[0])
+
+    decoders = [(dict if is_dataclass(arg) else (get_origin(arg) or arg), compile_decoder(arg)) for arg in types]
+
+    def decode_union(value: Any) -> Any:
+        # Types are checked in order of declaration
+        for value_type, decoder in decoders:
+            if isinstance(value, value_type):
+                return _decode(decoder, value)
+        raise ValueError(f'Value {value} does not match any of types {types}')
+
+    return decode_union
+
+
+def _compile_list_decoder(item_type: Any) -> Decoder:
+    item_decoder = compile_decoder(item_type)
+    if item_decoder is None:
+        return None
+    return lambda values: [_decode(item_decoder, value) for value in values]
+
+
+def compile_decoder(type_hint: Any) -> Decoder:
+    """ Decoder of json value to `type_hint` type. """
+
+    if type_hint is datetime.datetime:
+        return str_to_datetime
+    if is_dataclass(type_hint):
+        return compile_dataclass_decoder(type_hint)
+    origin = get_origin(type_hint)
+    if origin is Union:
+        return _compile_union_decoder(get_args(type_hint))
+    if origin is list and get_args(type_hint):
+        return _compile_list_decoder(get_args(type_hint)[0])
+    # Scalars and dicts are used as is
+    return None
+
+
+def compile_dataclass_decoder(data_class: Type, only_fields: Optional[FrozenSet[str]] = None) -> Callable[[dict], Any]:
+    """
+    Decoder of json object to `data_class`. If `only_fields` are given, other fields are not decoded:
+    they get default values or None.
+    """
+
+    type_hints = get_type_hints(data_class)
+    field_decoders = []
+    # Skipped fields without default values are set to None
+    skipped_fields = {}
+    for field in fields(data_class):
+        if not field.init:
+            continue
+        has_default = field.default is not MISSING or field.default_factory is not MISSING
+        if only_fields is not None and field.name not in only_fields:
+            if not has_default:
+                skipped_fields[field.name] = None
+            continue
+        type_hint = type_hints[field.name]
+        is_optional = get_origin(type_hint) is Union and _NONE_TYPE in get_args(type_hint)
+        field_decoders.append((field.name, field.name.replace('_', '-'), compile_decoder(type_hint),
+                               has_default, is_optional))
+
+    def decode_dataclass(data: dict) -> Any:
+        kwargs = dict(skipped_fields)
+        for name, kebab_name, decoder, has_default, is_optional in field_decoders:
+            if name in data:
+                value = data[name]
+            elif kebab_name in data:
+                value = data[kebab_name]
+            elif has_default:
+                continue
+            elif is_optional:
+                value = None
+            else:
+                raise ValueError(f'Missing value of field {name} of {data_class.__name__}')
+            kwargs[name] = _decode(decoder, value)
+        return data_class(**kwargs)
+
+    return decode_dataclass
+
+
+def get_objects_field(response_type: Type[ObjectResponse[T]]) -> Tuple[str, Type[T]]:
+    """ Name of the field of response, which contains list of objects, and class of these objects. """
+
+    type_hints = get_type_hints(response_type)
+    for field in fields(response_type):
+        args = get_args(type_hints[field.name])
+        if get_origin(type_hints[field.name]) is list and args and isinstance(args[0], type) \
+                and issubclass(args[0], Object):
+            return field.name, args[0]
+    raise ValueError(f'Response {response_type.__name__} does not contain list of objects')
+
+
+def _filter_raw_object(data: dict, only_fields: FrozenSet[str]) -> dict:
+    return {key: value for key, value in data.items() if key.replace('-', '_') in only_fields}
+
+
+@lru_cache(maxsize=None)
+def get_response_decoder(response_type: Type[ObjectResponse[T]],
+                         raw: bool = False,
+                         only_fields: Optional[FrozenSet[str]] = None) -> Callable[[dict], ObjectResponse[T]]:
+    """
+    Decoder of platform response to `response_type`, which is compiled once for every set of arguments.
+
+    If `raw` is set, objects are not decoded and left as json dicts, only response meta is decoded.
+    If `only_fields` are given, other fields of objects are not decoded (and removed from raw objects).
+    Object `id` is always decoded, since it is used to store objects and to stop paging.
+    """
+
+    objects_field, obj_class = get_objects_field(response_type)
+    if only_fields is not None:
+        obj_fields = {field.name for field in fields(obj_class)}
+        unknown_fields = only_fields - obj_fields
+        if unknown_fields:
+            logger.warning(f'{obj_class.__name__} objects do not have fields {sorted(unknown_fields)}')
+        only_fields = only_fields | ({'id'} & obj_fields)
+
+    if raw:
+        decode_object = None if only_fields is None else (lambda data: _filter_raw_object(data, only_fields))
+    else:
+        decode_object = compile_dataclass_decoder(obj_class, only_fields)
+
+    response_fields = frozenset(field.name for field in fields(response_type)) - {objects_field}
+    decode_response = compile_dataclass_decoder(response_type, response_fields)
+    objects_keys = (objects_field, objects_field.replace('_', '-'))
+
+    def decode(data: dict) -> ObjectResponse[T]:
+        response = decode_response(data)
+        objects: List = next((data[key] for key in objects_keys if key in data), [])
+        if decode_object is not None:
+            objects = [decode_object(obj) for obj in objects]
+        # Response is frozen dataclass
+        object.__setattr__(response, objects_field, objects)
+        return response
+
+    return decode
@@ -0,0 +1,142 @@
+import argparse
+import datetime
+import logging
+import sys
+import time
+from dataclasses import fields, is_dataclass, MISSING
+from typing import Any, Callable, Dict, get_args, get_origin, get_type_hints, Type, Union
+
+from dacite import Config, from_dict
+
+from analysis.src.python.data_collection.api.platform_objects import ObjectResponse
+from analysis.src.python.data_collection.api.response_decoder import get_objects_field, get_response_decoder
+from analysis.src.python.data_collection.api.utils import str_to_datetime
+from analysis.src.python.data_collection.hyperskill.api.projects import ProjectsResponse
+from analysis.src.python.data_collection.hyperskill.api.search_results import \
+    SearchResultsResponse as HyperskillSearchResultsResponse
+from analysis.src.python.data_collection.hyperskill.api.steps import StepsResponse as HyperskillStepsResponse
+from analysis.src.python.data_collection.hyperskill.api.submissions import SubmissionResponse
+from analysis.src.python.data_collection.hyperskill.api.topics import TopicsResponse
+from analysis.src.python.data_collection.hyperskill.api.tracks import TracksResponse
+from analysis.src.python.data_collection.hyperskill.api.users import UserResponse
+from analysis.src.python.data_collection.stepik.api.courses import CoursesResponse
+from analysis.src.python.data_collection.stepik.api.lessons import LessonsResponse
+from analysis.src.python.data_collection.stepik.api.search_results import \
+    SearchResultsResponse as StepikSearchResultsResponse
+from analysis.src.python.data_collection.stepik.api.steps import StepsResponse as StepikStepsResponse
+from analysis.src.python.data_collection.stepik.api.submissions import SubmissionsResponse
+from analysis.src.python.data_collection.stepik.api.users import UsersResponse
+from analysis.src.python.data_collection.utils.json_utils import kebab_to_snake_case
+
+"""
+Micro-benchmark of platforms responses decoding: compiled decoders against `dacite.from_dict`.
+Pages of responses are generated from responses dataclasses fields.
+"""
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_TYPES: Dict[str, Type[ObjectResponse]] = {
+    'hyperskill_projects': ProjectsResponse,
+    'hyperskill_search_results': HyperskillSearchResultsResponse,
+    'hyperskill_steps': HyperskillStepsResponse,
+    'hyperskill_submissions': SubmissionResponse,
+    'hyperskill_topics': TopicsResponse,
+    'hyperskill_tracks': TracksResponse,
+    'hyperskill_users': UserResponse,
+    'stepik_courses': CoursesResponse,
+    'stepik_lessons': LessonsResponse,
+    'stepik_search_results': StepikSearchResultsResponse,
+    'stepik_steps': StepikStepsResponse,
+    'stepik_submissions': SubmissionsResponse,
+    'stepik_users': UsersResponse,
+}
+
+SAMPLE_VALUES = {
+    int: 1,
+    float: 0.5,
+    bool: True,
+    str: 'text',
+    datetime.datetime: '2021-07-12T07:00:00Z',
+}
+
+
+def create_sample(type_hint: Any, index: int = 0) -> Any:
+    """ Json value of `type_hint` type as platform returns it. Ids of objects are set to `index`. """
+
+    if is_dataclass(type_hint):
+        type_hints = get_type_hints(type_hint)
+        sample = {}
+        for field in fields(type_hint):
+            if not field.init:
+                continue
+            sample[field.name] = index if field.name == 'id' else create_sample(type_hints[field.name], index)
+        return sample
+
+    origin = get_origin(type_hint)
+    if origin is Union:
+        # The last type of union is the most complex one, e.x. `Optional[Union[str, Feedback]]`
+        return create_sample([arg for arg in get_args(type_hint) if arg is not type(None)][-1], index)
+    if origin is list:
+        return [create_sample(get_args(type_hint)[0], index)] if get_args(type_hint) else []
+    if origin is dict:
+        return {'key': create_sample(get_args(type_hint)[1], index)} if get_args(type_hint) else {'key': 'value'}
+    return SAMPLE_VALUES.get(type_hint, None)
+
+
+def create_sample_page(response_type: Type[ObjectResponse], page_size: int) -> dict:
+    objects_field, obj_class = get_objects_field(response_type)
+    return {
+        'meta': {'page': 1, 'has-next': True, 'has-previous': False},
+        objects_field: [create_sample(obj_class, index) for index in range(1, page_size + 1)],
+    }
+
+
+def decode_with_dacite(response_type: Type[ObjectResponse], data: dict) -> ObjectResponse:
+    """ Decoding of response, which was used before compiled decoders. """
+
+    return from_dict(data_class=response_type,
+                     data=kebab_to_snake_case(data),
+                     config=Config(type_hooks={datetime.datetime: str_to_datetime}))
+
+
+def measure(decode: Callable[[dict], Any], data: dict, repeat: int) -> float:
+    """ Mean time of decoding in milliseconds. """
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode(data)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run_benchmark(response_type: Type[ObjectResponse], page_size: int, repeat: int) -> Dict[str, float]:
+    data = create_sample_page(response_type, page_size)
+    _, obj_class = get_objects_field(response_type)
+    first_field = next(field.name for field in fields(obj_class) if field.name != 'id' and field.default is MISSING)
+
+    return {
+        'dacite': measure(lambda page: decode_with_dacite(response_type, page), data, repeat),
+        'compiled': measure(get_response_decoder(response_type), data, repeat),
+        'compiled_two_fields': measure(get_response_decoder(response_type, only_fields=frozenset([first_field])),
+                                       data, repeat),
+        'raw': measure(get_response_decoder(response_type, raw=True), data, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--responses', nargs='*', type=str, default=list(RESPONSE_TYPES),
+                        choices=list(RESPONSE_TYPES), help='responses to decode, all responses by default')
+    parser.add_argument('--page-size', type=int, default=1000, help='number of objects in response page')
+    parser.add_argument('--repeat', type=int, default=10, help='number of times to decode every page')
+    args = parser.parse_args(sys.argv[1:])
+
+    for response in args.responses:
+        timings = run_benchmark(RESPONSE_TYPES[response], args.page_size, args.repeat)
+        dacite_time = timings['dacite']
+        logger.info(f'{response}: ' + ', '.join(f'{decoder} {timing:.2f}ms ({dacite_time / timing:.1f}x)'
+                                                for decoder, timing in timings.items()))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
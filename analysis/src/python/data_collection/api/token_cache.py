@@ -0,0 +1,49 @@
+import json
+import logging
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from analysis.src.python.data_collection.api.platform_auth import PlatformToken
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCache:
+    """
+    Tokens of platforms clients saved to json file, so several crawls (and their workers) share one token
+    and do not run authorization every time. Tokens are keyed by platform host and client id.
+    File is replaced atomically and is readable only by its owner.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    @staticmethod
+    def _get_key(host: str, client_id: Optional[str]) -> str:
+        return f'{host} {client_id}'
+
+    def _read(self) -> Dict[str, dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f'Unable to read tokens from {self.path}: {e}')
+            return {}
+
+    def get(self, host: str, client_id: Optional[str]) -> Optional[PlatformToken]:
+        token = self._read().get(self._get_key(host, client_id))
+        return PlatformToken(**token) if token is not None else None
+
+    def put(self, host: str, client_id: Optional[str], token: PlatformToken):
+        tokens = self._read()
+        tokens[self._get_key(host, client_id)] = asdict(token)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.parent / f'{self.path.name}.{os.getpid()}.tmp'
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as cache_file:
+            json.dump(tokens, cache_file)
+        os.replace(tmp_path, self.path)
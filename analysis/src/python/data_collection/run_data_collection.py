@@ -1,13 +1,22 @@
 import argparse
+import itertools
 import logging
 import sys
-from typing import List
+from typing import List, Optional
 
+from analysis.src.python.data_collection.api.crawl_metrics import DEFAULT_SUMMARY_INTERVAL
+from analysis.src.python.data_collection.api.platform_auth import AuthMode
+from analysis.src.python.data_collection.api.platform_client import DEFAULT_BACKOFF, DEFAULT_POOL_SIZE, \
+    DEFAULT_RETRIES, DEFAULT_TIMEOUT, PlatformClient
 from analysis.src.python.data_collection.api.platform_objects import Platform
+from analysis.src.python.data_collection.api.token_cache import TokenCache
 from analysis.src.python.data_collection.hyperskill.hyperskill_client import HyperskillClient
 from analysis.src.python.data_collection.stepik.stepik_client import StepikClient
-from analysis.src.python.data_collection.utils.csv_utils import save_objects_to_csv
+from analysis.src.python.data_collection.utils.object_store import ObjectStore
+from analysis.src.python.data_collection.utils.object_writers import create_object_writer, OUTPUT_EXTENSIONS, \
+    WRITE_BATCH_SIZE
 from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.extension_utils import AnalysisExtension
 
 platform_client = {
     Platform.HYPERSKILL: HyperskillClient,
@@ -29,6 +38,36 @@ def configure_parser() -> argparse.ArgumentParser:
     parser.add_argument('--output', '-out', type=str, default='results',
                         help='path to directory where to save the results')
     parser.add_argument('--port', '-p', type=int, default=8000, help='port to run authorization server at')
+    parser.add_argument('--auth', type=str, default=AuthMode.AUTHORIZATION_CODE.value, choices=AuthMode.values(),
+                        help='authorization mode: interactive authorization of user or by client credentials')
+    parser.add_argument('--token-cache', type=str, default=None,
+                        help='path to json file to keep platform token in and to reuse it until it expires')
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE,
+                        help='max number of alive connections to platform')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='seconds to wait for connection to platform and for response')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='number of requests to platform to send simultaneously')
+    parser.add_argument('--rate-limit', type=float, default=None,
+                        help='max number of requests to platform per second')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help='number of times to retry request if platform is overloaded')
+    parser.add_argument('--backoff', type=float, default=DEFAULT_BACKOFF,
+                        help='seconds to wait before the first retry, every next retry waits twice longer')
+    parser.add_argument('--output-format', type=str, default=AnalysisExtension.CSV.value,
+                        choices=[ext.value for ext in OUTPUT_EXTENSIONS], help='format of the results file')
+    parser.add_argument('--store', type=str, default=None,
+                        help='path to sqlite database with collected objects, only new objects are requested')
+    parser.add_argument('--raw', action='store_true',
+                        help='save objects as they are returned by platform, without decoding to known fields')
+    parser.add_argument('--fields', nargs='*', type=str, default=None,
+                        help='fields of objects to decode and save, other fields are skipped')
+    parser.add_argument('--refresh', action='store_true',
+                        help='request objects with given ids, even if they are already in the store')
+    parser.add_argument('--metrics', type=str, default=None,
+                        help='json file to write metrics of requests to at the end of collection')
+    parser.add_argument('--metrics-interval', type=float, default=DEFAULT_SUMMARY_INTERVAL,
+                        help='seconds between summaries of collection progress in log')
     return parser
 
 
@@ -40,6 +79,76 @@ def get_object_ids_from_file(csv_file_path: str, column_name: str) -> List[int]:
     return list(read_df(csv_file_path)[column_name].unique().values)
 
 
+def get_ids(args: argparse.Namespace) -> Optional[List[int]]:
+    """ Ids of requested objects from arguments or from file. """
+
+    if args.ids is not None:
+        return args.ids
+    if args.ids_from_file is not None and args.ids_from_column is not None:
+        return get_object_ids_from_file(args.ids_from_file, args.ids_from_column)
+    return None
+
+
+def create_client(args: argparse.Namespace, store: Optional[ObjectStore] = None) -> PlatformClient:
+    """ Client of platform with requests settings from arguments. """
+
+    return platform_client[Platform(args.platform)](args.port,
+                                                    pool_size=args.pool_size,
+                                                    timeout=args.timeout,
+                                                    n_workers=args.workers,
+                                                    rate_limit=args.rate_limit,
+                                                    n_retries=args.retries,
+                                                    backoff=args.backoff,
+                                                    store=store,
+                                                    raw=args.raw,
+                                                    fields=args.fields,
+                                                    auth_mode=AuthMode(args.auth),
+                                                    token_cache=TokenCache(args.token_cache) if args.token_cache
+                                                    else None,
+                                                    metrics_interval=args.metrics_interval,
+                                                    metrics_path=args.metrics)
+
+
+def collect_objects(client: PlatformClient,
+                    obj_class: str,
+                    ids: Optional[List[int]],
+                    count: Optional[int],
+                    output_path: str,
+                    store: Optional[ObjectStore] = None,
+                    output_extension: AnalysisExtension = AnalysisExtension.CSV,
+                    refresh: bool = False):
+    """
+    Get objects from platform and write them to `output_extension` file in `output_path` directory as they arrive.
+    If `store` is given, objects are merged into the store and only objects of this run are written: requested
+    objects or listing pages fetched until already collected objects. Requested objects which are already stored
+    are taken from the store and are not requested again, unless `refresh` is set to request them to get changes.
+    """
+
+    with create_object_writer(output_path, obj_class, output_extension) as writer:
+        if store is not None and ids is not None and not refresh:
+            new_ids = store.get_new_ids(obj_class, ids)
+            logging.info(f'{len(ids) - len(new_ids)} of {len(ids)} {obj_class} objects are already collected')
+            new_ids_set = set(new_ids)
+            stored_ids = [obj_id for obj_id in ids if obj_id not in new_ids_set]
+            writer.write(store.get_objects(obj_class, stored_ids))
+            ids = new_ids
+
+        # Number of objects to request is unknown for listings without count
+        client.metrics.set_expected_objects(count if ids is None else min(len(ids), count or len(ids)))
+        objects = iter([]) if ids == [] else client.get_objects(obj_class, ids, count)
+
+        if store is None:
+            writer.write(objects)
+            return
+
+        while True:
+            batch = list(itertools.islice(objects, WRITE_BATCH_SIZE))
+            if not batch:
+                break
+            store.put(obj_class, batch)
+            writer.write(batch)
+
+
 logging.basicConfig(level=logging.DEBUG)
 
 if __name__ == '__main__':
@@ -47,15 +156,11 @@ if __name__ == '__main__':
     parser = configure_parser()
     args = parser.parse_args(sys.argv[1:])
 
-    platform = Platform(args.platform)
-    client = platform_client[platform]()
+    store = ObjectStore(args.store) if args.store is not None else None
+    client = create_client(args, store)
 
-    if args.ids is not None:
-        ids = args.ids
-    elif args.ids_from_file is not None and args.ids_from_column is not None:
-        ids = get_object_ids_from_file(args.ids_from_file, args.ids_from_column)
-    else:
-        ids = None
-
-    objects = client.get_objects(args.object, ids, args.count)
-    save_objects_to_csv(args.output, objects, args.object)
+    with client:
+        collect_objects(client, args.object, get_ids(args), args.count, args.output, store,
+                        AnalysisExtension(args.output_format), args.refresh)
+    if store is not None:
+        store.close()
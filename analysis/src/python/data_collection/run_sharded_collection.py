@@ -0,0 +1,179 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+from pyarrow import parquet as pq
+
+from analysis.src.python.data_collection.api.platform_client import PlatformClient
+from analysis.src.python.data_collection.run_data_collection import collect_objects, configure_parser, \
+    create_client, get_ids
+from analysis.src.python.utils.csv_utils import merge_csv_files
+from analysis.src.python.utils.extension_utils import AnalysisExtension
+from analysis.src.python.utils.file_utils import create_directory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_SIZE = 1000
+# File in shard directory, which marks that all objects of shard are collected
+SHARD_DONE_FILE = 'done'
+# File in shard directory with metrics of shard requests
+SHARD_METRICS_FILE = 'metrics.json'
+
+
+@dataclass(frozen=True)
+class Shard:
+    index: int
+    ids: List[int]
+
+
+def configure_sharding_parser() -> argparse.ArgumentParser:
+    parser = configure_parser()
+    parser.add_argument('--id-range', nargs=2, type=int, default=None, metavar=('START', 'END'),
+                        help='range of ids of requested objects (both ends are included)')
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE, help='number of ids in one shard')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(),
+                        help='number of processes to collect shards in')
+    return parser
+
+
+def split_to_shards(ids: List[int], shard_size: int) -> List[Shard]:
+    return [Shard(index, ids[start:start + shard_size]) for index, start in enumerate(range(0, len(ids), shard_size))]
+
+
+def get_shard_path(shards_path: Path, shard: Shard) -> Path:
+    return shards_path / f'shard_{shard.index}'
+
+
+def is_shard_done(shards_path: Path, shard: Shard) -> bool:
+    return (get_shard_path(shards_path, shard) / SHARD_DONE_FILE).exists()
+
+
+def collect_shard(create_shard_client: Callable[[], PlatformClient],
+                  obj_class: str,
+                  shards_path: Path,
+                  output_extension: AnalysisExtension,
+                  shard: Shard) -> Tuple[int, Optional[str]]:
+    """
+    Collect objects of shard and metrics of its requests to shard directory.
+    Return shard index and error, if collection failed.
+    """
+
+    shard_path = create_directory(get_shard_path(shards_path, shard), clear=True)
+    try:
+        with create_shard_client() as client:
+            try:
+                collect_objects(client, obj_class, shard.ids, None, str(shard_path),
+                                output_extension=output_extension)
+            finally:
+                client.metrics.dump(shard_path / SHARD_METRICS_FILE)
+    except Exception as e:
+        logger.exception(f'Failed to collect shard {shard.index}')
+        return shard.index, str(e)
+
+    (shard_path / SHARD_DONE_FILE).touch()
+    return shard.index, None
+
+
+def collect_shards(create_shard_client: Callable[[], PlatformClient],
+                   obj_class: str,
+                   shards: List[Shard],
+                   output_path: Union[str, Path],
+                   n_processes: int,
+                   output_extension: AnalysisExtension = AnalysisExtension.CSV) -> List[int]:
+    """
+    Collect objects of shards in `n_processes` processes, which take shards from common queue one by one,
+    so processes are busy until all shards are done. Every shard is written to its own directory in
+    `output_path`/shards. Shards which are done by previous runs are skipped.
+    `create_shard_client` must be picklable. Return indices of failed shards.
+    """
+
+    shards_path = create_directory(Path(output_path) / 'shards')
+    pending_shards = [shard for shard in shards if not is_shard_done(shards_path, shard)]
+    logger.info(f'Collecting {len(pending_shards)} of {len(shards)} shards, other shards are already collected')
+
+    collect = partial(collect_shard, create_shard_client, obj_class, shards_path, output_extension)
+    failed_shards = []
+    with Pool(processes=n_processes) as pool:
+        for done, (index, error) in enumerate(pool.imap_unordered(collect, pending_shards), start=1):
+            if error is not None:
+                failed_shards.append(index)
+            logger.info(f'Shard {index} is {"failed" if error else "collected"}, {done}/{len(pending_shards)} done')
+
+    return sorted(failed_shards)
+
+
+def merge_parquet_files(input_paths: List[Path], output_path: Path):
+    """ Merge .parquet files with the same schema, every file is written as a row group. """
+
+    with pq.ParquetWriter(str(output_path), pq.read_schema(str(input_paths[0]))) as writer:
+        for input_path in input_paths:
+            writer.write_table(pq.read_table(str(input_path)))
+
+
+def merge_shards(obj_class: str,
+                 shards: List[Shard],
+                 output_path: Union[str, Path],
+                 output_extension: AnalysisExtension = AnalysisExtension.CSV) -> Optional[Path]:
+    """ Merge objects of shards in order of shards to `output_path` file. Shards without objects have no files. """
+
+    output_file = f'{obj_class}s{output_extension.value}'
+    shards_path = Path(output_path) / 'shards'
+    shard_files = [get_shard_path(shards_path, shard) / output_file for shard in shards]
+    shard_files = [shard_file for shard_file in shard_files if shard_file.exists()]
+    if not shard_files:
+        logger.info(f'No {obj_class} objects are collected')
+        return None
+
+    merged_path = Path(output_path) / output_file
+    logger.info(f'Merging {len(shard_files)} shards to {merged_path}')
+    if output_extension == AnalysisExtension.CSV:
+        merge_csv_files(shard_files, merged_path)
+    else:
+        merge_parquet_files(shard_files, merged_path)
+    return merged_path
+
+
+def main():
+    parser = configure_sharding_parser()
+    args = parser.parse_args(sys.argv[1:])
+
+    if args.store is not None or args.count is not None:
+        parser.error('--store and --count are not supported for sharded collection')
+    ids = list(range(args.id_range[0], args.id_range[1] + 1)) if args.id_range is not None else get_ids(args)
+    if ids is None:
+        parser.error('Ids to split to shards are required: --ids, --ids_from_file or --id-range')
+
+    shards = split_to_shards(ids, args.shard_size)
+    output_extension = AnalysisExtension(args.output_format)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Platform is authorized once, processes share the token through the cache
+        if args.token_cache is None:
+            args.token_cache = os.path.join(tmp_dir, 'token.json')
+        create_client(args).close()
+
+        # Rate limit is common for all processes, metrics are written to every shard directory
+        shard_args = argparse.Namespace(**dict(vars(args), metrics=None))
+        if args.rate_limit is not None:
+            shard_args.rate_limit = args.rate_limit / args.processes
+
+        failed_shards = collect_shards(partial(create_client, shard_args), args.object, shards, args.output,
+                                       args.processes, output_extension)
+
+    if failed_shards:
+        logger.error(f'Shards {failed_shards} failed, restart collection to collect them again')
+        sys.exit(1)
+
+    merge_shards(args.object, shards, args.output, output_extension)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
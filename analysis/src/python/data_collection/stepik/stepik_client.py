@@ -1,5 +1,6 @@
 import os
-from typing import Callable, Dict, List, Optional, Type, TypeVar
+from dataclasses import replace
+from typing import Callable, Dict, Iterator, List, Optional, Type, TypeVar, Union
 
 from analysis.src.python.data_collection.api.platform_client import PlatformClient
 from analysis.src.python.data_collection.api.platform_objects import BaseRequestParams, Object, ObjectResponse
@@ -16,14 +17,19 @@ T = TypeVar('T', bound=Object)
 
 
 class StepikClient(PlatformClient):
+    """ Stepik API accepts list of ids as repeated `ids[]` param: `?ids[]=1&ids[]=2`. """
+
+    ids_separator_length = len('&ids%5B%5D=')
+
+    def __init__(self, port: int = 8000, **kwargs):
+        """ `kwargs` are requests settings of `PlatformClient` (pool size, timeout, workers, rate limit, retries). """
 
-    def __init__(self, port: int = 8000):
         client_id = os.environ.get('STEPIK_CLIENT_ID')
         client_secret = os.environ.get('STEPIK_CLIENT_SECRET')
-        super().__init__(StepikPlatform.BASE_URL, client_id, client_secret, port)
+        super().__init__(StepikPlatform.BASE_URL, client_id, client_secret, port, **kwargs)
 
         self._get_objects_by_class: Dict[
-            ObjectClass, Callable[[Optional[List[int]], Optional[int]], List[Object]]] = {
+            ObjectClass, Callable[[Optional[List[int]], Optional[int]], Iterator[Object]]] = {
             ObjectClass.COURSE: self.get_courses,
             ObjectClass.LESSON: self.get_lessons,
             ObjectClass.STEP: self.get_steps,
@@ -31,36 +37,41 @@ class StepikClient(PlatformClient):
             ObjectClass.SUBMISSION: self.get_submissions,
         }
 
-    def get_objects(self, obj: str, ids: Optional[List[int]] = None, count: Optional[int] = None) -> List[Object]:
+    def _prepare_params(self, params: BaseRequestParams) -> Dict[str, Union[str, List[str]]]:
+        dict_params = super()._prepare_params(replace(params, ids=None))
+        if params.ids is not None:
+            # List value is sent by requests as repeated param
+            dict_params['ids[]'] = list(map(str, params.ids))
+        return dict_params
+
+    def get_objects(self, obj: str, ids: Optional[List[int]] = None, count: Optional[int] = None) -> Iterator[Object]:
         if obj not in ObjectClass.values():
             return self.get_search_result(obj, count)
         else:
             return self._get_objects_by_class[ObjectClass(obj)](ids, count)
 
-    def get_search_result(self, query: str, count: Optional[int] = None) -> List[SearchResult]:
+    def get_search_result(self, query: str, count: Optional[int] = None) -> Iterator[SearchResult]:
         return self._get_objects(ObjectClass.SEARCH_RESULT, SearchResultsResponse,
                                  SearchResultsRequestParams(query=query), count=count)
 
-    def get_courses(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> List[Course]:
+    def get_courses(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> Iterator[Course]:
         return self._get_objects_default(ids, count, ObjectClass.COURSE, CoursesResponse)
 
-    def get_lessons(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> List[Lesson]:
+    def get_lessons(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> Iterator[Lesson]:
         return self._get_objects_default(ids, count, ObjectClass.LESSON, LessonsResponse)
 
-    def get_steps(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> List[Step]:
+    def get_steps(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> Iterator[Step]:
         return self._get_objects_default(ids, count, ObjectClass.STEP, StepsResponse)
 
-    def get_users(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> List[User]:
+    def get_users(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> Iterator[User]:
         return self._get_objects_default(ids, count, ObjectClass.USER, UsersResponse)
 
-    def get_submissions(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> List[Submission]:
+    def get_submissions(self, ids: Optional[List[int]] = None, count: Optional[int] = None) -> Iterator[Submission]:
         return self._get_objects_default(ids, count, ObjectClass.SUBMISSION, SubmissionsResponse)
 
     def _get_objects_default(self,
                              ids: Optional[List[int]],
                              count: Optional[int],
                              obj_class: ObjectClass,
-                             obj_response_type: Type[ObjectResponse[T]]) -> List[T]:
-        params = BaseRequestParams()
-        return self._get_objects_by_ids(obj_class, ids, obj_response_type, params, count=count) if ids is not None \
-            else self._get_objects(obj_class, obj_response_type, params, count=count)
+                             obj_response_type: Type[ObjectResponse[T]]) -> Iterator[T]:
+        return self._get_objects(obj_class, obj_response_type, BaseRequestParams(ids=ids), count=count)
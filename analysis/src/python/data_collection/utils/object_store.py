@@ -0,0 +1,121 @@
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from analysis.src.python.data_collection.api.platform_objects import get_object_id, Object
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectStore:
+    """
+    Local SQLite store of objects collected from platform, keyed by object class and id.
+    For every listing of objects (object class and request params) high-water mark (max id of completely collected
+    listing) is kept, so rerun of collection can stop paging when it reaches objects, which were already collected
+    by previous runs. High-water marks are read once on opening, so they do not change during the run.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = path
+        self.connection = sqlite3.connect(str(path), check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS objects '
+                                    '(obj_class TEXT, id INTEGER, data TEXT, PRIMARY KEY (obj_class, id))')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS listing_watermarks '
+                                    '(obj_class TEXT, listing TEXT, id INTEGER, PRIMARY KEY (obj_class, listing))')
+            self.watermarks: Dict[Tuple[str, str], int] = {
+                (obj_class, listing): obj_id for obj_class, listing, obj_id in
+                self.connection.execute('SELECT obj_class, listing, id FROM listing_watermarks')
+            }
+
+    def get_watermark(self, obj_class: str, listing: str) -> Optional[int]:
+        return self.watermarks.get((obj_class, listing))
+
+    def set_watermark(self, obj_class: str, listing: str, obj_id: int):
+        """ Save max id of objects in completely collected `listing`. The new mark is used by the next runs. """
+
+        with self.lock, self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO listing_watermarks (obj_class, listing, id) '
+                                    'VALUES (?, ?, MAX(?, COALESCE((SELECT id FROM listing_watermarks '
+                                    'WHERE obj_class = ? AND listing = ?), ?)))',
+                                    (obj_class, listing, obj_id, obj_class, listing, obj_id))
+
+    def is_known_page(self, obj_class: str, listing: str, objects: List[Union[Object, dict]]) -> bool:
+        """ Check that all `objects` are not newer than objects of `listing` collected by previous runs. """
+
+        watermark = self.get_watermark(obj_class, listing)
+        return watermark is not None and len(objects) > 0 and all(get_object_id(obj) <= watermark for obj in objects)
+
+    def get_new_ids(self, obj_class: str, ids: List[int]) -> List[int]:
+        """ Ids of objects, which are not stored yet. """
+
+        with self.lock:
+            stored_ids = {obj_id for obj_id, in self.connection.execute(
+                'SELECT id FROM objects WHERE obj_class = ?', (obj_class,))}
+        return [obj_id for obj_id in ids if obj_id not in stored_ids]
+
+    def put(self, obj_class: str, objects: List[Union[Object, dict]]) -> Tuple[int, int]:
+        """ Insert new objects (dataclasses or raw json objects) and update changed ones.
+        Return number of new and changed objects. """
+
+        if any(get_object_id(obj) is None for obj in objects):
+            raise ValueError(f'Objects of class {obj_class} without id can not be stored')
+
+        new, changed = 0, 0
+        with self.lock, self.connection:
+            for obj in objects:
+                obj_id = get_object_id(obj)
+                data = json.dumps(asdict(obj) if isinstance(obj, Object) else obj, default=str)
+                stored = self.connection.execute('SELECT data FROM objects WHERE obj_class = ? AND id = ?',
+                                                 (obj_class, obj_id)).fetchone()
+                if stored is None:
+                    new += 1
+                elif stored[0] != data:
+                    changed += 1
+                else:
+                    continue
+                self.connection.execute('INSERT OR REPLACE INTO objects (obj_class, id, data) VALUES (?, ?, ?)',
+                                        (obj_class, obj_id, data))
+
+        logger.info(f'Stored {new} new and {changed} changed {obj_class} objects')
+        return new, changed
+
+    def get_objects(self, obj_class: str, ids: Optional[List[int]] = None, batch_size: int = 1000) -> Iterator[dict]:
+        """ Lazily get stored objects of given class ordered by id. If `ids` are given, only these objects are got. """
+
+        if ids is None:
+            yield from self._select_objects('SELECT data FROM objects WHERE obj_class = ? ORDER BY id',
+                                            (obj_class,), batch_size)
+            return
+
+        # Number of query params is limited
+        for start in range(0, len(ids), batch_size):
+            ids_batch = ids[start:start + batch_size]
+            yield from self._select_objects(f'SELECT data FROM objects WHERE obj_class = ? '
+                                            f'AND id IN ({", ".join("?" * len(ids_batch))}) ORDER BY id',
+                                            (obj_class, *map(int, ids_batch)), batch_size)
+
+    def _select_objects(self, query: str, query_params: tuple, batch_size: int) -> Iterator[dict]:
+        with self.lock:
+            cursor = self.connection.execute(query, query_params)
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for data, in rows:
+                yield json.loads(data)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
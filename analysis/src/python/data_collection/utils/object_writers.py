@@ -0,0 +1,156 @@
+import logging
+import os
+from abc import ABC, abstractmethod
+from dataclasses import asdict, fields
+from typing import get_args, get_origin, get_type_hints, Iterable, List, Optional, Union
+
+import pyarrow as pa
+from pyarrow import parquet as pq
+
+from analysis.src.python.data_collection.api.platform_objects import Object
+from analysis.src.python.data_collection.utils.csv_utils import CsvWriter
+from analysis.src.python.utils.extension_utils import AnalysisExtension
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_EXTENSIONS = [AnalysisExtension.CSV, AnalysisExtension.PARQUET]
+
+# Number of collected objects, which are written to output at once
+WRITE_BATCH_SIZE = 1000
+
+PARQUET_COLUMN_TYPES = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+}
+
+
+def to_row(obj: Union[Object, dict]) -> dict:
+    return asdict(obj) if isinstance(obj, Object) else obj
+
+
+class ObjectWriter(ABC):
+    """ Writes collected objects of `obj_class` to `<obj_class>s` file in `output_dir` as they arrive. """
+
+    def __init__(self, output_dir: str, obj_class: str, extension: AnalysisExtension):
+        self.output_dir = output_dir
+        self.output_file = f'{obj_class}s{extension.value}'
+        self.written = 0
+
+    def write(self, objects: Iterable[Union[Object, dict]]):
+        """ Write objects by batches, every batch is flushed to output file. """
+
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) == WRITE_BATCH_SIZE:
+                self._write_batch(batch)
+                batch = []
+        if batch:
+            self._write_batch(batch)
+
+    def _write_batch(self, objects: List[Union[Object, dict]]):
+        self._write_rows(objects)
+        self.written += len(objects)
+        logger.info(f'Written {self.written} objects to {os.path.join(self.output_dir, self.output_file)}')
+
+    @abstractmethod
+    def _write_rows(self, objects: List[Union[Object, dict]]):
+        """ Write batch of objects to output file. """
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CsvObjectWriter(ObjectWriter):
+    """ Objects are appended to .csv file, which stays readable even if collection is killed. """
+
+    def __init__(self, output_dir: str, obj_class: str):
+        super().__init__(output_dir, obj_class, AnalysisExtension.CSV)
+        self.csv_writer: Optional[CsvWriter] = None
+
+    def _write_rows(self, objects: List[Union[Object, dict]]):
+        rows = [to_row(obj) for obj in objects]
+        if self.csv_writer is None:
+            self.csv_writer = CsvWriter(self.output_dir, self.output_file, list(rows[0].keys()))
+        for row in rows:
+            self.csv_writer.write_csv(row)
+        self.csv_writer.flush()
+
+    def close(self):
+        if self.csv_writer is not None:
+            self.csv_writer.close()
+
+
+def get_column_type(annotation) -> pa.DataType:
+    """ Column type for dataclass field `annotation`: scalars keep their type, other values are strings. """
+
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else str
+    return PARQUET_COLUMN_TYPES.get(annotation, pa.string())
+
+
+def get_objects_schema(obj: Union[Object, dict]) -> pa.Schema:
+    """
+    Schema for objects of the same class as `obj`. It is built from dataclass fields annotations,
+    so it does not depend on values of particular objects. Columns of plain dict rows are strings.
+    """
+
+    if isinstance(obj, Object):
+        type_hints = get_type_hints(type(obj))
+        return pa.schema([(f.name, get_column_type(type_hints[f.name])) for f in fields(obj)])
+    return pa.schema([(key, pa.string()) for key in obj.keys()])
+
+
+def to_column_value(value, column_type: pa.DataType):
+    if value is None:
+        return None
+    if pa.types.is_string(column_type):
+        return value if isinstance(value, str) else str(value)
+    if pa.types.is_floating(column_type):
+        return float(value)
+    return value
+
+
+class ParquetObjectWriter(ObjectWriter):
+    """
+    Every batch of objects is written to .parquet file as a row group. Schema is built from objects class fields:
+    numbers and booleans keep their types, other values (lists, objects, dates) are written as strings like in .csv.
+    File is finalized on close, which also happens if collection fails with an error.
+    """
+
+    def __init__(self, output_dir: str, obj_class: str):
+        super().__init__(output_dir, obj_class, AnalysisExtension.PARQUET)
+        self.parquet_writer: Optional[pq.ParquetWriter] = None
+        self.schema: Optional[pa.Schema] = None
+
+    def _write_rows(self, objects: List[Union[Object, dict]]):
+        if self.parquet_writer is None:
+            self.schema = get_objects_schema(objects[0])
+            os.makedirs(self.output_dir, exist_ok=True)
+            self.parquet_writer = pq.ParquetWriter(os.path.join(self.output_dir, self.output_file), self.schema)
+
+        rows = [to_row(obj) for obj in objects]
+        columns = {
+            field.name: [to_column_value(row.get(field.name), field.type) for row in rows] for field in self.schema
+        }
+        self.parquet_writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+
+def create_object_writer(output_dir: str, obj_class: str, extension: AnalysisExtension) -> ObjectWriter:
+    if extension == AnalysisExtension.PARQUET:
+        return ParquetObjectWriter(output_dir, obj_class)
+    return CsvObjectWriter(output_dir, obj_class)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, unique
-from typing import List
+from typing import List, Optional
 
 from analysis.src.python.utils.yaml_utils import parse_yaml
 
@@ -39,3 +39,14 @@ class BatchConfig:
                            script_path=config[BatchConfigFields.SCRIPT_PATH.value],
                            script_args=script_args,
                            script_flags=script_flags)
+
+
+@dataclass(frozen=True)
+class Batch:
+    index: int
+    input_path: str
+    logs_path: str
+    output_path: str
+    # Byte offsets of batch rows in the input file, if batch rows are not copied to a separate file
+    start_offset: Optional[int] = None
+    end_offset: Optional[int] = None
@@ -2,22 +2,27 @@ import argparse
 import logging
 import os
 import re
-import time
+import sys
 from collections import defaultdict
 from pathlib import Path
-from typing import List, Tuple
+from typing import List
 
 import pandas as pd
 
-from analysis.src.python.evaluation.batching.batch_config import BatchConfig
-from analysis.src.python.utils.parallel_utils import run_and_wait
-from analysis.src.python.utils.df_utils import append_df, write_df
-from analysis.src.python.utils.file_utils import create_directory, get_name_from_path
+from analysis.src.python.evaluation.batching.batch_config import Batch, BatchConfig
+from analysis.src.python.evaluation.batching.batch_scheduler import BatchScheduler, BatchStatusStorage, \
+    STATUS_FILE_NAME
+from analysis.src.python.utils.arrow_utils import merge_csv_files_to_arrow
+from analysis.src.python.utils.csv_utils import build_csv_batch_offsets, merge_csv_files
+from analysis.src.python.utils.df_utils import write_df
 from analysis.src.python.utils.extension_utils import AnalysisExtension
+from analysis.src.python.utils.file_utils import create_directory, get_name_from_path
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+MERGE_EXTENSIONS = [AnalysisExtension.CSV, AnalysisExtension.PARQUET, AnalysisExtension.FEATHER]
+
 
 def configure_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("input_path", help="Path to the csv file with data to process",
@@ -28,6 +33,13 @@ def configure_arguments(parser: argparse.ArgumentParser) -> None:
                         type=lambda value: Path(value).absolute())
     parser.add_argument("--batch-size", help="Batch size for data", nargs='?', default=1000, type=int)
     parser.add_argument("--start-from", help="Index of batch to start processing from", nargs='?', default=0, type=int)
+    parser.add_argument("--workers", help="Number of batches to process simultaneously", default=1, type=int)
+    parser.add_argument("--retries", help="Number of times to restart failed batch", default=0, type=int)
+    parser.add_argument("--merge-format", help="Format of merged results", default=AnalysisExtension.CSV.value,
+                        choices=[ext.value for ext in MERGE_EXTENSIONS], type=str)
+    parser.add_argument("--index", help="Do not copy batches to separate files, pass byte offsets of batch rows in "
+                                        "the input file to the script instead (--start-offset and --end-offset)",
+                        action='store_true')
 
 
 def run_batching():
@@ -35,29 +47,22 @@ def run_batching():
     configure_arguments(parser)
 
     args = parser.parse_args()
-    batch_paths = split_to_batches(args.input_path, args.output_path, args.batch_size)
+    if args.index:
+        batches = split_to_batches_by_index(args.input_path, args.output_path, args.batch_size)
+    else:
+        batches = split_to_batches(args.input_path, args.output_path, args.batch_size)
     config = BatchConfig.from_yaml(args.config_path)
 
-    for index, input_file_path, logs_path, output_path in batch_paths[args.start_from:]:
-        logs_file_path = os.path.join(logs_path, f"log{AnalysisExtension.TXT.value}")
-
-        with open(logs_file_path, 'w+') as logs_file:
-            # create run script with python3
-            command = ['python3', config.script_path, input_file_path]
-            # add script args and flags
-            command += config.script_args + config.script_flags
-            # add script output flag
-            command += [f'-o={output_path}']
-
-            logger.info(f"Command to execute batch {index}: {command}")
+    # Batches statuses are persisted, so restarted batching skips already processed batches
+    status_storage = BatchStatusStorage(args.output_path / STATUS_FILE_NAME, args.batch_size)
+    scheduler = BatchScheduler(config, status_storage, n_workers=args.workers, n_retries=args.retries)
 
-            logger.info(f'Start batch {index} processing')
-            start_time = time.time()
-            run_and_wait(command, stdout=logs_file, stderr=logs_file, cwd=config.project_path)
-            end_time = time.time()
-            logger.info(f'Finish batch {index} processing in {end_time - start_time}')
+    if not scheduler.run(batches[args.start_from:]):
+        logger.error(f'Some batches failed, see statuses in {status_storage.status_path}. '
+                     f'Restart batching to process them again.')
+        sys.exit(1)
 
-    merge_batch_results(batch_paths, args.output_path)
+    merge_batch_results(batches, args.output_path, AnalysisExtension(args.merge_format))
 
 
 def create_sub_directory(base_path: str, directory_name: str) -> str:
@@ -66,14 +71,14 @@ def create_sub_directory(base_path: str, directory_name: str) -> str:
     return directory_path
 
 
-def split_to_batches(dataset_path: str, output_dir_path: str, batch_size: int) -> List[Tuple[int, str, str, str]]:
+def split_to_batches(dataset_path: str, output_dir_path: str, batch_size: int) -> List[Batch]:
     input_path = create_sub_directory(output_dir_path, 'input')
     logs_path = create_sub_directory(output_dir_path, 'logs')
     output_path = create_sub_directory(output_dir_path, 'output')
 
     df_name = get_name_from_path(dataset_path)
 
-    batch_paths = []
+    batches = []
     index = 0
     for batch in pd.read_csv(dataset_path, chunksize=batch_size):
         batch_name = f'batch_{index}'
@@ -87,28 +92,55 @@ def split_to_batches(dataset_path: str, output_dir_path: str, batch_size: int) -
         batch_input_file = os.path.join(batch_input_path, df_name)
         write_df(batch, batch_input_file)
 
-        batch_paths.append((index, batch_input_file, batch_logs_path, batch_output_path))
+        batches.append(Batch(index, batch_input_file, batch_logs_path, batch_output_path))
         index += 1
 
-    return batch_paths
+    return batches
+
+
+def split_to_batches_by_index(dataset_path: str, output_dir_path: str, batch_size: int) -> List[Batch]:
+    """ Split dataset to batches by byte offsets of rows, without copying batches rows to separate files. """
+
+    logs_path = create_sub_directory(output_dir_path, 'logs')
+    output_path = create_sub_directory(output_dir_path, 'output')
+
+    logger.info(f'Building rows index of {dataset_path}')
+    batch_offsets = build_csv_batch_offsets(dataset_path, batch_size)
+
+    batches = []
+    for index, (start_offset, end_offset) in enumerate(batch_offsets):
+        batch_name = f'batch_{index}'
+        batch_logs_path = create_sub_directory(logs_path, batch_name)
+        batch_output_path = create_sub_directory(output_path, batch_name)
+
+        batches.append(Batch(index, str(dataset_path), batch_logs_path, batch_output_path, start_offset, end_offset))
+
+    return batches
+
 
+def merge_batch_results(batches: List[Batch],
+                        output: str,
+                        merge_extension: AnalysisExtension = AnalysisExtension.CSV):
+    """
+    Merge .csv results of batches with the same name into one file with `merge_extension` (csv, parquet or feather).
+    Batches results are streamed file by file, csv files are copied without parsing.
+    """
 
-def merge_batch_results(batch_paths: List[Tuple[int, str, str, str]], output: str):
     output_files_by_name = defaultdict(list)
 
-    for _, _, _, output_path in batch_paths:
-        output_files = os.listdir(output_path)
+    for batch in batches:
+        output_files = os.listdir(batch.output_path)
         for output_file in output_files:
             if AnalysisExtension.get_extension_from_file(output_file) == AnalysisExtension.CSV:
                 output_file_id = re.sub(r'\.*batch_\d+\.*', '', get_name_from_path(output_file))
-                output_files_by_name[output_file_id].append(os.path.join(output_path, output_file))
+                output_files_by_name[output_file_id].append(os.path.join(batch.output_path, output_file))
     for output_file_name, output_files in output_files_by_name.items():
-        for i, output_file in enumerate(output_files):
-            output_df = pd.read_csv(output_file)
-            if i == 0:
-                write_df(output_df, os.path.join(output, output_file_name))
-            else:
-                append_df(output_df, os.path.join(output, output_file_name))
+        merged_file_path = Path(output, output_file_name).with_suffix(merge_extension.value)
+        logger.info(f'Merging {len(output_files)} batches results to {merged_file_path}')
+        if merge_extension == AnalysisExtension.CSV:
+            merge_csv_files(output_files, merged_file_path)
+        else:
+            merge_csv_files_to_arrow(output_files, merged_file_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from enum import Enum, unique
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from analysis.src.python.evaluation.batching.batch_config import Batch, BatchConfig
+from analysis.src.python.utils.extension_utils import AnalysisExtension
+from analysis.src.python.utils.parallel_utils import run_and_wait
+
+logger = logging.getLogger(__name__)
+
+STATUS_FILE_NAME = f'status{AnalysisExtension.JSON.value}'
+
+
+@unique
+class BatchStatus(Enum):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+
+class BatchStatusStorage:
+    """
+    Statuses of batches persisted to json file after every change, so interrupted batching can be resumed.
+    Statuses are valid only for the same batch size.
+    """
+
+    def __init__(self, status_path: Path, batch_size: int):
+        self.status_path = status_path
+        self.batch_size = batch_size
+        self.statuses: Dict[int, BatchStatus] = {}
+        self.lock = threading.Lock()
+
+        if status_path.exists():
+            with open(status_path) as status_file:
+                status = json.load(status_file)
+            if status['batch_size'] == batch_size:
+                self.statuses = {int(index): BatchStatus(value) for index, value in status['batches'].items()}
+            else:
+                logger.warning(f'Batch size changed from {status["batch_size"]} to {batch_size}, '
+                               f'previous batches statuses are ignored')
+
+    def get(self, index: int) -> BatchStatus:
+        return self.statuses.get(index, BatchStatus.PENDING)
+
+    def set(self, index: int, status: BatchStatus):
+        with self.lock:
+            self.statuses[index] = status
+            self._save()
+
+    def _save(self):
+        status = {
+            'batch_size': self.batch_size,
+            'batches': {str(index): value.value for index, value in sorted(self.statuses.items())},
+        }
+        tmp_path = self.status_path.parent / f'{self.status_path.name}.tmp'
+        with open(tmp_path, 'w') as status_file:
+            json.dump(status, status_file, indent=4)
+        os.replace(tmp_path, self.status_path)
+
+
+def build_batch_command(config: BatchConfig, batch: Batch) -> List[str]:
+    # create run script with python3
+    command = ['python3', config.script_path, batch.input_path]
+    # add script args and flags
+    command += config.script_args + config.script_flags
+    # add script output flag
+    command += [f'-o={batch.output_path}']
+    # add batch rows offsets in the input file
+    if batch.start_offset is not None:
+        command += [f'--start-offset={batch.start_offset}', f'--end-offset={batch.end_offset}']
+    return command
+
+
+class BatchScheduler:
+    """
+    Runs batches as subprocesses, up to `n_workers` batches simultaneously.
+    Batch is restarted up to `n_retries` times if script exits with non-zero code.
+    Batches which are done according to `status_storage` are skipped.
+    """
+
+    def __init__(self, config: BatchConfig, status_storage: BatchStatusStorage, n_workers: int = 1, n_retries: int = 0):
+        self.config = config
+        self.status_storage = status_storage
+        self.n_workers = n_workers
+        self.n_retries = n_retries
+
+    def run_batch(self, batch: Batch) -> BatchStatus:
+        index = batch.index
+        logs_file_path = os.path.join(batch.logs_path, f'log{AnalysisExtension.TXT.value}')
+        command = build_batch_command(self.config, batch)
+        logger.info(f'Command to execute batch {index}: {command}')
+
+        for attempt in range(self.n_retries + 1):
+            self.status_storage.set(index, BatchStatus.RUNNING)
+            logger.info(f'Start batch {index} processing (attempt {attempt + 1})')
+
+            with open(logs_file_path, 'w+' if attempt == 0 else 'a') as logs_file:
+                return_code = run_and_wait(command, stdout=logs_file, stderr=logs_file, cwd=self.config.project_path)
+
+            if return_code == 0:
+                self.status_storage.set(index, BatchStatus.DONE)
+                return BatchStatus.DONE
+
+            logger.warning(f'Batch {index} failed with exit code {return_code}, see logs in {logs_file_path}')
+
+        self.status_storage.set(index, BatchStatus.FAILED)
+        return BatchStatus.FAILED
+
+    def run(self, batches: List[Batch]) -> bool:
+        """ Run all not done batches. Return True if all batches are done. """
+
+        pending_batches = [batch for batch in batches if self.status_storage.get(batch.index) != BatchStatus.DONE]
+        logger.info(f'{len(batches) - len(pending_batches)} of {len(batches)} batches are already done')
+
+        start_time = time.time()
+        batch_times = []
+        all_done = True
+        with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+            futures = {}
+            for batch in pending_batches:
+                futures[executor.submit(self._timed_run_batch, batch)] = batch.index
+
+            for future in as_completed(futures):
+                status, batch_time = future.result()
+                batch_times.append(batch_time)
+                all_done = all_done and status == BatchStatus.DONE
+
+                remaining = len(pending_batches) - len(batch_times)
+                eta = sum(batch_times) / len(batch_times) * remaining / min(self.n_workers, max(remaining, 1))
+                logger.info(f'Finish batch {futures[future]} processing in {batch_time:.1f}s with status '
+                            f'{status.value}. Progress: {len(batch_times)}/{len(pending_batches)} batches, '
+                            f'elapsed={time.time() - start_time:.1f}s, ETA={eta:.1f}s')
+
+        return all_done
+
+    def _timed_run_batch(self, batch: Batch) -> Tuple[BatchStatus, float]:
+        start_time = time.time()
+        status = self.run_batch(batch)
+        return status, time.time() - start_time
@@ -4,21 +4,23 @@ import time
 from enum import Enum
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Optional, Set
+from typing import Any, Callable, Optional, Set, Tuple
 
 import pandas as pd
-from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
 
 from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
-from analysis.src.python.evaluation.tools.hyperstyle import parse_hyperstyle_result
-from analysis.src.python.evaluation.tools.hyperstyle import HYPERSTYLE_TOOL_PATH, HyperstyleEvaluationConfig
+from analysis.src.python.evaluation.tools.hyperstyle.evaluate import parse_hyperstyle_result
+from analysis.src.python.evaluation.tools.hyperstyle.evaluation_config import HYPERSTYLE_TOOL_PATH, \
+    HyperstyleEvaluationConfig
+from analysis.src.python.evaluation.tools.model.evaluation_config import EvaluationConfig
 from analysis.src.python.evaluation.tools.qodana.evaluate import parse_qodana_result
 from analysis.src.python.evaluation.tools.qodana.evaluation_config import QodanaEvaluationConfig
-from analysis.src.python.evaluation.utils.pandas_utils import get_language_version
+from analysis.src.python.evaluation.tools.utils.executors import create_executor, Executor, ExecutorType
 from analysis.src.python.evaluation.tools.utils.saving_utils import save_solutions_to_files
+from analysis.src.python.evaluation.utils.pandas_utils import get_language_version
 from analysis.src.python.utils.df_utils import read_df, write_df
 from analysis.src.python.utils.file_utils import create_directory, get_tmp_directory
-from utils.numpy_utils import AggregateFunction
+from analysis.src.python.utils.numpy_utils import AggregateFunction
 
 logger = logging.getLogger(__name__)
 
@@ -67,15 +69,13 @@ def measure_run_time(
     return aggregate_function(repeat_times)
 
 
-def time_benchmark_row(
-    row: pd.Series,
+def create_config(
     docker_path: str,
     analyzer: Optional[Analyzer],
-    repeat: int,
-    aggregate: AggregateFunction,
     n_cpu: Optional[int],
     tmp_directory: Path,
-) -> float:
+    executor: Executor,
+) -> Tuple[EvaluationConfig, Callable[[Path], Any]]:
     if analyzer == Analyzer.HYPERSTYLE:
         config = HyperstyleEvaluationConfig(
             docker_path=docker_path,
@@ -85,14 +85,27 @@ def time_benchmark_row(
             new_format=False,
             n_cpu=n_cpu,
             tmp_path=tmp_directory,
+            executor=executor,
         )
         parser = parse_hyperstyle_result
     elif analyzer == Analyzer.QODANA:
+        if executor.runs_in_container:
+            raise NotImplementedError('Qodana can not be run in the container pool.')
         config = QodanaEvaluationConfig(tmp_path=tmp_directory)
         parser = parse_qodana_result
     else:
         raise NotImplementedError(f'Benchmark for {analyzer} is not implemented.')
 
+    return config, parser
+
+
+def time_benchmark_row(
+    row: pd.Series,
+    config: EvaluationConfig,
+    parser: Callable[[Path], Any],
+    repeat: int,
+    aggregate: AggregateFunction,
+) -> float:
     logger.info(f'Benchmarking {row[SubmissionColumns.ID.value]} ...')
 
     language_version = get_language_version(row[SubmissionColumns.LANG.value])
@@ -104,7 +117,7 @@ def time_benchmark_row(
     command = config.build_command(input_path, output_path, language_version)
 
     mean_time = measure_run_time(
-        partial(run_in_subprocess, command=command),
+        partial(config.executor.execute, command=command),
         repeat,
         aggregate,
         output_path / config.result_path,
@@ -176,6 +189,24 @@ def configure_parser(parser: argparse.ArgumentParser) -> None:
         help='The path to the directory with the temporary files.',
     )
 
+    parser.add_argument(
+        '--executor',
+        type=str,
+        default=ExecutorType.SUBPROCESS.value,
+        choices=ExecutorType.values(),
+        help=(
+            'How to run the analyzer: `subprocess` runs a new container for every run, '
+            '`docker_pool` starts a container once and executes all runs inside it (only for Hyperstyle).'
+        ),
+    )
+
+    parser.add_argument(
+        '--containers',
+        type=int,
+        default=1,
+        help='Number of containers in the pool for `docker_pool` executor.',
+    )
+
 
 def main() -> None:
     parser = argparse.ArgumentParser()
@@ -194,20 +225,28 @@ def main() -> None:
 
     logging.basicConfig(level=logging.INFO, filename=args.log_path, filemode='w')
 
-    submissions = read_df(args.submissions_path)
-    submissions[args.time_column] = submissions.apply(
-        lambda row: time_benchmark_row(
-            row,
-            args.docker_path,
-            Analyzer.from_value(args.analyzer),
-            args.repeat,
-            AggregateFunction(args.aggregate),
-            args.n_cpu,
-            args.tmp_dir,
-        ),
-        axis=1,
+    executor = create_executor(ExecutorType(args.executor), args.docker_path, args.tmp_dir, args.containers)
+    config, result_parser = create_config(
+        args.docker_path,
+        Analyzer.from_value(args.analyzer),
+        args.n_cpu,
+        args.tmp_dir,
+        executor,
     )
 
+    submissions = read_df(args.submissions_path)
+    with executor:
+        submissions[args.time_column] = submissions.apply(
+            lambda row: time_benchmark_row(
+                row,
+                config,
+                result_parser,
+                args.repeat,
+                AggregateFunction(args.aggregate),
+            ),
+            axis=1,
+        )
+
     write_df(submissions, args.output_path)
 
 
@@ -3,6 +3,7 @@ import logging
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
@@ -10,8 +11,11 @@ from analysis.src.python.data_analysis.model.column_name import SubmissionColumn
 from analysis.src.python.evaluation.tools.hyperstyle.evaluation_args import configure_arguments
 from analysis.src.python.evaluation.tools.hyperstyle.evaluation_config import HyperstyleEvaluationConfig
 from analysis.src.python.evaluation.tools.hyperstyle.model.report import HyperstyleNewFormatReport, HyperstyleReport
+from analysis.src.python.evaluation.tools.utils.cache_utils import create_cache, EvaluationCache
 from analysis.src.python.evaluation.tools.utils.evaluation_utils import evaluate_by_language, evaluate_by_solution
+from analysis.src.python.evaluation.tools.utils.executors import create_executor, ExecutorType
 from analysis.src.python.evaluation.tools.utils.saving_utils import get_solution_id_by_file_path
+from analysis.src.python.evaluation.tools.utils.streaming_utils import evaluate_in_chunks
 from analysis.src.python.utils.df_utils import read_df, write_df
 from analysis.src.python.utils.file_utils import get_output_filename, get_output_path
 
@@ -57,13 +61,15 @@ def parse_hyperstyle_result(results_path: Path) -> pd.Series:
     return pd.Series({SubmissionColumns.HYPERSTYLE_ISSUES.value: report.to_json()})
 
 
-def evaluate_hyperstyle(df_solutions: pd.DataFrame, config: HyperstyleEvaluationConfig) -> pd.DataFrame:
-    """ Run hyperstyle tool on solutions. """
+def evaluate_hyperstyle(df_solutions: pd.DataFrame,
+                        config: HyperstyleEvaluationConfig,
+                        cache: Optional[EvaluationCache] = None) -> pd.DataFrame:
+    """ Run hyperstyle tool on solutions. If `cache` is given, cached results are reused. """
 
     if config.new_format:
-        df_solutions = evaluate_by_language(df_solutions, config, parse_hyperstyle_new_format_result)
+        df_solutions = evaluate_by_language(df_solutions, config, parse_hyperstyle_new_format_result, cache)
     else:
-        df_solutions = evaluate_by_solution(df_solutions, config, parse_hyperstyle_result)
+        df_solutions = evaluate_by_solution(df_solutions, config, parse_hyperstyle_result, cache)
     return df_solutions
 
 
@@ -74,22 +80,46 @@ def main():
     start = time.time()
     args = parser.parse_args()
 
-    df_solutions = read_df(args.solutions_file_path)
-    config = HyperstyleEvaluationConfig(docker_path=None if args.docker_path == 'None' else args.docker_path,
+    docker_path = None if args.docker_path == 'None' else args.docker_path
+    executor = create_executor(ExecutorType(args.executor),
+                               docker_path=docker_path,
+                               mount_path=args.tmp_directory,
+                               n_containers=args.workers if args.containers is None else args.containers)
+    config = HyperstyleEvaluationConfig(docker_path=docker_path,
                                         tool_path=args.tool_path,
                                         allow_duplicates=args.allow_duplicates,
                                         with_all_categories=args.with_all_categories,
                                         # new_format is True for batching evaluation
                                         new_format=True,
-                                        tmp_path=args.tmp_directory)
+                                        tmp_path=args.tmp_directory,
+                                        n_workers=args.workers,
+                                        shard_size=args.shard_size,
+                                        executor=executor)
+
+    cache = create_cache(args, config)
 
-    logger.info('Start processing:')
-    results = evaluate_hyperstyle(df_solutions, config)
     if args.output_path is None:
         output_path = get_output_path(args.solutions_file_path, HYPERSTYLE_OUTPUT_SUFFIX)
     else:
         output_path = args.output_path / get_output_filename(args.solutions_file_path, HYPERSTYLE_OUTPUT_SUFFIX)
-    write_df(results, output_path)
+
+    logger.info('Start processing:')
+    with executor:
+        if args.chunk_size is None:
+            df_solutions = read_df(args.solutions_file_path, args.start_offset, args.end_offset)
+            results = evaluate_hyperstyle(df_solutions, config, cache)
+            write_df(results, output_path)
+        else:
+            evaluate_in_chunks(args.solutions_file_path,
+                               output_path,
+                               lambda df_chunk: evaluate_hyperstyle(df_chunk, config, cache),
+                               args.chunk_size,
+                               args.start_offset,
+                               args.end_offset)
+
+    if cache is not None:
+        cache.log_statistics()
+        cache.evict()
     end = time.time()
     logger.info(f'Total processing time: {end - start}')
 
@@ -3,6 +3,8 @@ from pathlib import Path
 
 from analysis.src.python.evaluation.tools.hyperstyle.evaluation_config import HYPERSTYLE_DOCKER_PATH, \
     HYPERSTYLE_TOOL_PATH
+from analysis.src.python.evaluation.tools.utils.cache_utils import configure_cache_arguments
+from analysis.src.python.evaluation.tools.utils.executors import configure_executor_arguments
 from analysis.src.python.evaluation.utils.args_utils import EvaluationRunToolArgument
 from analysis.src.python.utils.file_utils import get_tmp_directory
 
@@ -33,6 +35,33 @@ def configure_arguments(parser: argparse.ArgumentParser) -> None:
                         type=lambda value: Path(value).absolute(),
                         help='Path to tmp directory to save temporary files')
 
+    parser.add_argument('-w', '--workers',
+                        default=1,
+                        type=int,
+                        help='Number of hyperstyle runs (language groups or their shards) to execute simultaneously.')
+
+    parser.add_argument('--shard-size',
+                        default=None,
+                        type=int,
+                        help='Max number of solutions in one hyperstyle run. '
+                             'By default, all solutions with the same language are evaluated in one run.')
+
+    parser.add_argument('--chunk-size',
+                        default=None,
+                        type=int,
+                        help='Read solutions by chunks of given size and append results of every chunk to the output '
+                             '.csv file. Evaluated solutions are saved to checkpoint and skipped on restart.')
+
+    parser.add_argument('--start-offset',
+                        default=None,
+                        type=int,
+                        help='Byte offset in the .csv solutions file of the first row to evaluate.')
+
+    parser.add_argument('--end-offset',
+                        default=None,
+                        type=int,
+                        help='Byte offset in the .csv solutions file after the last row to evaluate.')
+
     parser.add_argument('--allow-duplicates',
                         help='Allow duplicate issues found by different linters. By default, duplicates are skipped.',
                         action='store_true')
@@ -41,3 +70,7 @@ def configure_arguments(parser: argparse.ArgumentParser) -> None:
                         help='Without this flag, all issues will be categorized into 5 main categories: '
                              'CODE_STYLE, BEST_PRACTICES, ERROR_PRONE, COMPLEXITY, INFO.',
                         action='store_true')
+
+    configure_executor_arguments(parser)
+
+    configure_cache_arguments(parser)
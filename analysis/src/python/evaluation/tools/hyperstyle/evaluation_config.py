@@ -1,10 +1,11 @@
 import logging.config
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from hyperstyle.src.python.review.application_config import LanguageVersion
 
 from analysis.src.python.evaluation.tools.model.evaluation_config import EvaluationConfig
+from analysis.src.python.evaluation.tools.utils.executors import Executor
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +22,27 @@ class HyperstyleEvaluationConfig(EvaluationConfig):
                  with_all_categories: bool,
                  new_format: bool,
                  tmp_path: Path,
-                 n_cpu: Optional[int] = None):
+                 n_cpu: Optional[int] = None,
+                 n_workers: int = 1,
+                 shard_size: Optional[int] = None,
+                 executor: Optional[Executor] = None):
         """
         `docker_path` - docker image name to run hyperstyle in (custom or default HYPERSTYLE_DOCKER_PATH)
         `tool_path` - path to hyperstyle tool running script (custom or HYPERSTYLE_TOOL_PATH)
         `tmp_path` - path where to place evaluation temporary files
+        `n_workers` - number of hyperstyle runs which can be executed simultaneously
+        `shard_size` - max number of solutions in one hyperstyle run
+        `executor` - executor to run hyperstyle with, if it runs commands inside containers of `docker_path` image,
+        hyperstyle is called directly, without `docker run`
         Number of hyperstyle tool running script parameters (`allow_duplicates`, `with_all_categories` etc.)
         """
 
         super().__init__(tmp_path=tmp_path / 'hyperstyle',
                          result_path=OUTPUT_FILE_PATH,
-                         with_template=False)
+                         with_template=False,
+                         n_workers=n_workers,
+                         shard_size=shard_size,
+                         executor=executor)
 
         self.docker_path: str = docker_path
         self.tool_path: str = tool_path
@@ -63,8 +74,8 @@ class HyperstyleEvaluationConfig(EvaluationConfig):
         if language_version.is_java():
             python_command += ['--language_version', language_version.value]
 
-        # If docker path specified, hyperstyle will run inside docker
-        if self.docker_path is not None:
+        # If docker path specified, hyperstyle will run inside new docker container (unless executor provides one)
+        if self.docker_path is not None and not self.executor.runs_in_container:
             python_command += ['/input', '>', f'/output/{OUTPUT_FILE_PATH}']
             command = ['docker', 'run',
                        '-v', f'{input_path}/:/input/',
@@ -77,3 +88,16 @@ class HyperstyleEvaluationConfig(EvaluationConfig):
             command = ['/bin/bash', '-c', ' '.join(python_command)]
 
         return command
+
+    def get_tool_settings(self) -> Dict[str, Any]:
+        return {
+            **super().get_tool_settings(),
+            'docker_path': self.docker_path,
+            'tool_path': self.tool_path,
+            'allow_duplicates': self.allow_duplicates,
+            'with_all_categories': self.with_all_categories,
+            'new_format': self.new_format,
+        }
+
+    def get_tool_version(self) -> str:
+        return 'local' if self.docker_path is None else self.docker_path
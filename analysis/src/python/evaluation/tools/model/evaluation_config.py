@@ -1,22 +1,30 @@
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from hyperstyle.src.python.review.application_config import LanguageVersion
 
+from analysis.src.python.evaluation.tools.utils.executors import Executor
 from analysis.src.python.utils.file_utils import create_directory
 
 
 class EvaluationConfig:
 
-    def __init__(self, tmp_path: Path, result_path: Path, with_template: bool):
+    def __init__(self, tmp_path: Path, result_path: Path, with_template: bool,
+                 n_workers: int = 1, shard_size: Optional[int] = None, executor: Optional[Executor] = None):
         """
         @param tmp_path: temporary directory path where input/output can be saved
         @param result_path: relative path from output root where results are located
         @param with_template: template should or not be added while evaluation
+        @param n_workers: number of language groups (or shards) which can be evaluated simultaneously
+        @param shard_size: max number of solutions in one evaluation run, bigger language groups are split into shards
+        @param executor: executor to run evaluation commands with (in subprocess by default)
         """
         self.tmp_path = tmp_path
         self.result_path = result_path
         self.with_template = with_template
+        self.n_workers = n_workers
+        self.shard_size = shard_size
+        self.executor = Executor() if executor is None else executor
 
         create_directory(self.tmp_path, clear=True)
 
@@ -25,3 +33,11 @@ class EvaluationConfig:
                       output_path: Union[Path, str],
                       language_version: LanguageVersion) -> List[str]:
         pass
+
+    def get_tool_settings(self) -> Dict[str, Any]:
+        """ Settings which affect evaluation results, so results are cached separately for different settings. """
+        return {'with_template': self.with_template}
+
+    def get_tool_version(self) -> str:
+        """ Version of evaluation tool, so cached results can be invalidated when tool is updated. """
+        pass
@@ -4,6 +4,7 @@ import sys
 import time
 from collections import defaultdict
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
@@ -11,8 +12,10 @@ from analysis.src.python.data_analysis.model.column_name import SubmissionColumn
 from analysis.src.python.evaluation.tools.qodana.evaluation_args import configure_arguments
 from analysis.src.python.evaluation.tools.qodana.evaluation_config import QodanaEvaluationConfig
 from analysis.src.python.evaluation.tools.qodana.model.report import QodanaReport
+from analysis.src.python.evaluation.tools.utils.cache_utils import create_cache, EvaluationCache
 from analysis.src.python.evaluation.tools.utils.evaluation_utils import evaluate_by_language
 from analysis.src.python.evaluation.tools.utils.saving_utils import get_solution_id_by_file_path
+from analysis.src.python.evaluation.tools.utils.streaming_utils import evaluate_in_chunks
 from analysis.src.python.utils.df_utils import dict_to_df, read_df, write_df
 from analysis.src.python.utils.file_utils import get_output_filename, get_output_path
 
@@ -47,10 +50,14 @@ def parse_qodana_result(result_path: Path) -> pd.DataFrame:
                       value_column=SubmissionColumns.QODANA_ISSUES.value)
 
 
-def evaluate_qodana(df_solutions: pd.DataFrame, config: QodanaEvaluationConfig) -> pd.DataFrame:
-    """ Run qodana on set of solutions. """
+def evaluate_qodana(df_solutions: pd.DataFrame,
+                    config: QodanaEvaluationConfig,
+                    cache: Optional[EvaluationCache] = None) -> pd.DataFrame:
+    """ Run qodana on set of solutions. If `cache` is given, cached results are reused. """
 
-    df_solutions = evaluate_by_language(df_solutions, config, parse_qodana_result)
+    df_solutions = evaluate_by_language(df_solutions, config, parse_qodana_result, cache)
+    if SubmissionColumns.QODANA_ISSUES.value not in df_solutions.columns:
+        df_solutions[SubmissionColumns.QODANA_ISSUES.value] = None
     df_solutions[SubmissionColumns.QODANA_ISSUES.value].fillna(QodanaReport.get_default().to_json(), inplace=True)
     return df_solutions
 
@@ -62,17 +69,34 @@ def main():
     start = time.time()
     args = parser.parse_args()
 
-    df_solutions = read_df(args.solutions_file_path)
     config = QodanaEvaluationConfig(with_custom_profile=args.with_custom_profile,
-                                    tmp_path=args.tmp_directory)
+                                    tmp_path=args.tmp_directory,
+                                    n_workers=args.workers,
+                                    shard_size=args.shard_size)
+
+    cache = create_cache(args, config)
 
-    logger.info('Start processing:')
-    results = evaluate_qodana(df_solutions, config)
     if args.output_path is None:
         output_path = get_output_path(args.solutions_file_path, QODANA_OUTPUT_SUFFIX)
     else:
         output_path = args.output_path / get_output_filename(args.solutions_file_path, QODANA_OUTPUT_SUFFIX)
-    write_df(results, output_path)
+
+    logger.info('Start processing:')
+    if args.chunk_size is None:
+        df_solutions = read_df(args.solutions_file_path, args.start_offset, args.end_offset)
+        results = evaluate_qodana(df_solutions, config, cache)
+        write_df(results, output_path)
+    else:
+        evaluate_in_chunks(args.solutions_file_path,
+                           output_path,
+                           lambda df_chunk: evaluate_qodana(df_chunk, config, cache),
+                           args.chunk_size,
+                           args.start_offset,
+                           args.end_offset)
+
+    if cache is not None:
+        cache.log_statistics()
+        cache.evict()
     end = time.time()
     logger.info(f'Total processing time: {end - start}')
 
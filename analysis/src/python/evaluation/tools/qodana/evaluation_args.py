@@ -1,6 +1,7 @@
 import argparse
 from pathlib import Path
 
+from analysis.src.python.evaluation.tools.utils.cache_utils import configure_cache_arguments
 from analysis.src.python.evaluation.utils.args_utils import EvaluationRunToolArgument
 from analysis.src.python.utils.file_utils import get_tmp_directory
 
@@ -20,6 +21,35 @@ def configure_arguments(parser: argparse.ArgumentParser) -> None:
                         type=lambda value: Path(value).absolute(),
                         help='Path to tmp directory to save temporary files')
 
+    parser.add_argument('-w', '--workers',
+                        default=1,
+                        type=int,
+                        help='Number of qodana runs (language groups or their shards) to execute simultaneously.')
+
+    parser.add_argument('--shard-size',
+                        default=None,
+                        type=int,
+                        help='Max number of solutions in one qodana run. '
+                             'By default, all solutions with the same language are evaluated in one run.')
+
+    parser.add_argument('--chunk-size',
+                        default=None,
+                        type=int,
+                        help='Read solutions by chunks of given size and append results of every chunk to the output '
+                             '.csv file. Evaluated solutions are saved to checkpoint and skipped on restart.')
+
+    parser.add_argument('--start-offset',
+                        default=None,
+                        type=int,
+                        help='Byte offset in the .csv solutions file of the first row to evaluate.')
+
+    parser.add_argument('--end-offset',
+                        default=None,
+                        type=int,
+                        help='Byte offset in the .csv solutions file after the last row to evaluate.')
+
     parser.add_argument('--with-custom-profile',
                         help='Run qodana only in inspections listed in language specific profile.xml',
                         action='store_true')
+
+    configure_cache_arguments(parser)
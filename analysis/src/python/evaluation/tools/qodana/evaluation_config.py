@@ -1,7 +1,7 @@
 import logging.config
 import os
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from hyperstyle.src.python.review.application_config import LanguageVersion
 
@@ -21,15 +21,21 @@ class QodanaEvaluationConfig(EvaluationConfig):
 
     def __init__(self,
                  tmp_path: Path,
-                 with_custom_profile: bool = False):
+                 with_custom_profile: bool = False,
+                 n_workers: int = 1,
+                 shard_size: Optional[int] = None):
         """
         `tmp_path` - directory where to place evaluation temporary files
         `with_custom_profile` - run qodana with custom inspection profile (settings)
+        `n_workers` - number of qodana runs which can be executed simultaneously
+        `shard_size` - max number of solutions in one qodana run
         """
 
         super().__init__(tmp_path=tmp_path / 'qodana',
                          result_path=OUTPUT_FILE_PATH,
-                         with_template=True)
+                         with_template=True,
+                         n_workers=n_workers,
+                         shard_size=shard_size)
 
         self.with_custom_profile: bool = with_custom_profile
 
@@ -62,3 +68,12 @@ class QodanaEvaluationConfig(EvaluationConfig):
         command.append('--save-report')
 
         return command
+
+    def get_tool_settings(self) -> Dict[str, Any]:
+        return {
+            **super().get_tool_settings(),
+            'with_custom_profile': self.with_custom_profile,
+        }
+
+    def get_tool_version(self) -> str:
+        return f'{QODANA_JAVA_DOCKER_PATH}_{QODANA_PYTHON_DOCKER_PATH}'
@@ -0,0 +1,208 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.evaluation.tools.model.evaluation_config import EvaluationConfig
+from analysis.src.python.evaluation.utils.pandas_utils import get_language_version
+from analysis.src.python.utils.file_utils import create_directory, remove_directory, remove_file
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENTRY_EXTENSION = '.json'
+
+BYTES_IN_MEGABYTE = 1024 * 1024
+
+
+def _to_json_value(value: Any) -> Any:
+    """ Convert numpy scalars to python ones to dump them to json. """
+
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+def get_version_directory_name(tool_version: str) -> str:
+    """ Tool version (e.x. docker image `stepik/hyperstyle:1.2.2`) as a directory name. """
+
+    return re.sub(r'[^\w.-]', '_', tool_version)
+
+
+class EvaluationCache:
+    """
+    Persistent content-addressed cache of evaluation results.
+
+    Every solution result is stored in a separate json file with name equal to hash of solution code,
+    language version and tool settings. Results are grouped in directories by tool version, so all results
+    of some tool version can be invalidated at once.
+    """
+
+    def __init__(self,
+                 cache_path: Path,
+                 tool_settings: Dict[str, Any],
+                 tool_version: str,
+                 max_size: Optional[int] = None):
+        """
+        `cache_path` - directory where to store cached results
+        `tool_settings` - tool settings which affect evaluation results
+        `tool_version` - version of the tool (e.x. docker image with tag)
+        `max_size` - max cache size in bytes, the least recently used results are evicted if cache is bigger
+        """
+
+        self.cache_path = create_directory(cache_path)
+        self.version_path = create_directory(cache_path / get_version_directory_name(tool_version))
+        self.tool_settings = json.dumps(tool_settings, sort_keys=True, default=str)
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, solution: pd.Series) -> str:
+        """ Hash of solution code, language version and tool settings. """
+
+        language_version = get_language_version(solution[SubmissionColumns.LANG.value])
+
+        key = hashlib.sha256()
+        for part in [solution[SubmissionColumns.CODE.value], language_version.value, self.tool_settings]:
+            key.update(str(part).encode())
+            key.update(b'\0')
+        return key.hexdigest()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.version_path / key[:2] / f'{key}{CACHE_ENTRY_EXTENSION}'
+
+    def get(self, solution: pd.Series) -> Optional[Dict[str, Any]]:
+        """ Get cached evaluation result for given solution. Returns None if there is no cached result. """
+
+        entry_path = self._get_entry_path(self.get_key(solution))
+        try:
+            with open(entry_path) as entry_file:
+                result = json.load(entry_file)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # Update modification time to evict the least recently used results first
+        os.utime(entry_path)
+        self.hits += 1
+        return result
+
+    def put(self, solution: pd.Series, result: Dict[str, Any]):
+        """ Save evaluation result for given solution. Missing values are not saved. """
+
+        result = {key: value for key, value in result.items() if not pd.isna(value)}
+
+        entry_path = self._get_entry_path(self.get_key(solution))
+        create_directory(entry_path.parent)
+
+        # Write to temporary file first, so concurrent readers never see a partially written result
+        fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w') as tmp_file:
+            json.dump(result, tmp_file, default=_to_json_value)
+        os.replace(tmp_path, entry_path)
+
+    def split_by_cached(self, df_solutions: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Split solutions into cached results (solution id with cached result columns)
+        and solutions which are not cached and should be evaluated.
+        """
+
+        cached_results = []
+        is_cached = []
+        for _, solution in df_solutions.iterrows():
+            result = self.get(solution)
+            is_cached.append(result is not None)
+            if result is not None:
+                cached_results.append({SubmissionColumns.ID.value: solution[SubmissionColumns.ID.value], **result})
+
+        df_cached_results = pd.DataFrame.from_records(cached_results)
+        logger.info(f'Found cached results for {len(cached_results)} of {df_solutions.shape[0]} solutions')
+
+        return df_cached_results, df_solutions[[not cached for cached in is_cached]]
+
+    def put_results(self, df_solutions: pd.DataFrame, df_results: pd.DataFrame):
+        """ Save results of evaluated solutions. Solutions without result are cached with empty result. """
+
+        results = df_results.set_index(SubmissionColumns.ID.value).to_dict(orient='index')
+        for _, solution in df_solutions.iterrows():
+            self.put(solution, results.get(solution[SubmissionColumns.ID.value], {}))
+
+    def evict(self):
+        """ Remove the least recently used results (from all tool versions) while cache is bigger than max size. """
+
+        if self.max_size is None:
+            return
+
+        entries = []
+        total_size = 0
+        for entry_path in self.cache_path.glob(f'*/*/*{CACHE_ENTRY_EXTENSION}'):
+            stat = entry_path.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total_size += stat.st_size
+
+        evicted = 0
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            remove_file(entry_path)
+            total_size -= size
+            evicted += 1
+
+        logger.info(f'Evicted {evicted} cached results, cache size={total_size}B')
+
+    def log_statistics(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total if total != 0 else 0
+        logger.info(f'Cache hits={self.hits} misses={self.misses} hit rate={hit_rate:.2%}')
+
+
+def invalidate_cache_versions(cache_path: Path, tool_versions: List[str]):
+    """ Remove all cached results of given tool versions. """
+
+    for tool_version in tool_versions:
+        logger.info(f'Invalidating cached results of {tool_version}')
+        remove_directory(cache_path / get_version_directory_name(tool_version))
+
+
+def configure_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--cache-path',
+                        default=None,
+                        type=lambda value: Path(value).absolute(),
+                        help='Path to the directory with cached evaluation results. '
+                             'If not specified, results are not cached.')
+
+    parser.add_argument('--cache-max-size',
+                        default=None,
+                        type=float,
+                        help='Max size of the cache in megabytes. The least recently used results are evicted.')
+
+    parser.add_argument('--cache-tool-version',
+                        default=None,
+                        type=str,
+                        help='Version of the tool to cache results for. By default, docker image is used.')
+
+    parser.add_argument('--invalidate-cache-versions',
+                        nargs='*',
+                        default=[],
+                        type=str,
+                        help='Tool versions which cached results should be removed before evaluation.')
+
+
+def create_cache(args: argparse.Namespace, config: EvaluationConfig) -> Optional[EvaluationCache]:
+    """ Create evaluation cache for given `config` according to arguments configured by `configure_cache_arguments`. """
+
+    if args.cache_path is None:
+        return None
+
+    invalidate_cache_versions(args.cache_path, args.invalidate_cache_versions)
+
+    tool_version = config.get_tool_version() if args.cache_tool_version is None else args.cache_tool_version
+    max_size = None if args.cache_max_size is None else int(args.cache_max_size * BYTES_IN_MEGABYTE)
+
+    return EvaluationCache(args.cache_path, config.get_tool_settings(), tool_version, max_size)
@@ -1,13 +1,13 @@
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, List, TypeVar
+from typing import Callable, List, Optional, Tuple, TypeVar
 
 import pandas as pd
-from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
 
 from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
 from analysis.src.python.evaluation.tools.model.evaluation_config import EvaluationConfig
+from analysis.src.python.evaluation.tools.utils.cache_utils import EvaluationCache
 from analysis.src.python.evaluation.tools.utils.saving_utils import save_solutions_to_files
 from analysis.src.python.evaluation.utils.pandas_utils import get_language_version
 from analysis.src.python.utils.df_utils import merge_dfs
@@ -16,49 +16,143 @@ from analysis.src.python.utils.file_utils import create_directory, remove_direct
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+REPRESENTATIVE_ID_COLUMN = 'representative_id'
+
+
+def deduplicate_solutions(df_solutions: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Leave only first solution of each group of solutions with identical code and language.
+    Return unique solutions and id of representative (unique) solution for each solution.
+    """
+
+    key_columns = [SubmissionColumns.CODE.value, SubmissionColumns.LANG.value]
+
+    df_unique_solutions = df_solutions.drop_duplicates(subset=key_columns)
+    representative_ids = df_solutions.groupby(key_columns, sort=False, dropna=False)[SubmissionColumns.ID.value] \
+        .transform('first')
+
+    if df_solutions.shape[0] != 0:
+        logger.info(f'Deduplicated {df_solutions.shape[0]} solutions to {df_unique_solutions.shape[0]} unique '
+                    f'(dedup ratio={df_solutions.shape[0] / max(df_unique_solutions.shape[0], 1):.2f})')
+
+    return df_unique_solutions, representative_ids
+
+
+def fan_out_results(df_solutions: pd.DataFrame, representative_ids: pd.Series, df_results: pd.DataFrame) \
+        -> pd.DataFrame:
+    """ Merge results of unique solutions to all solutions by id of their representative solution. """
+
+    df_solutions = df_solutions.assign(**{REPRESENTATIVE_ID_COLUMN: representative_ids})
+    df_solutions = merge_dfs(df_solutions, df_results,
+                             left_on=REPRESENTATIVE_ID_COLUMN,
+                             right_on=SubmissionColumns.ID.value,
+                             how='left',
+                             )
+    return df_solutions.drop(columns=REPRESENTATIVE_ID_COLUMN)
+
+
+def split_to_shards(df_solutions: pd.DataFrame, shard_size: Optional[int] = None) -> List[pd.DataFrame]:
+    """
+    Group solutions by language and split every group into shards of at most `shard_size` solutions.
+    If `shard_size` is None, every language group is a single shard.
+    """
+
+    shards = []
+
+    for _, df_lang_solutions in df_solutions.groupby(SubmissionColumns.LANG.value):
+        if shard_size is None:
+            shards.append(df_lang_solutions)
+            continue
+
+        for start in range(0, df_lang_solutions.shape[0], shard_size):
+            shards.append(df_lang_solutions.iloc[start:start + shard_size])
+
+    return shards
+
 
 def evaluate_by_language(df_solutions: pd.DataFrame,
                          config: EvaluationConfig,
-                         parse_result: Callable[[Path], pd.DataFrame]) -> pd.DataFrame:
+                         parse_result: Callable[[Path], pd.DataFrame],
+                         cache: Optional[EvaluationCache] = None) -> pd.DataFrame:
     """
     Group solutions by language and run evaluation tool on groups of solutions with same language.
+    Solutions with identical code and language are evaluated once.
+    Groups bigger than `config.shard_size` are split into shards. Up to `config.n_workers` shards are evaluated
+    simultaneously, each in its own tmp directory.
+    If `cache` is given, only solutions without cached results are evaluated.
     Return solutions with evaluation results.
     """
 
+    df_unique_solutions, representative_ids = deduplicate_solutions(df_solutions)
+
     results = []
+    df_solutions_to_evaluate = df_unique_solutions
+    if cache is not None:
+        df_cached_results, df_solutions_to_evaluate = cache.split_by_cached(df_unique_solutions)
+        if not df_cached_results.empty:
+            results.append(df_cached_results)
 
-    for _, df_lang_solutions in df_solutions.groupby(SubmissionColumns.LANG.value):
-        result = evaluate(df_lang_solutions, config, parse_result)
-        results.append(result)
+    shards = split_to_shards(df_solutions_to_evaluate, config.shard_size)
 
-    df_results = pd.concat(results)
-    df_solutions = merge_dfs(df_solutions, df_results,
-                             left_on=SubmissionColumns.ID.value,
-                             right_on=SubmissionColumns.ID.value,
-                             how='left',
-                             )
-    return df_solutions
+    def evaluate_shard(shard_index: int) -> pd.DataFrame:
+        return evaluate(shards[shard_index], config, parse_result, tmp_directory_name=f'shard_{shard_index}')
+
+    if config.n_workers > 1 and len(shards) > 1:
+        logger.info(f'Evaluating {len(shards)} shards with {config.n_workers} workers')
+        with ThreadPoolExecutor(max_workers=config.n_workers) as executor:
+            # map keeps shards order, so results are merged in submission order
+            evaluated_results = list(executor.map(evaluate_shard, range(len(shards))))
+    else:
+        evaluated_results = [evaluate_shard(shard_index) for shard_index in range(len(shards))]
+
+    if cache is not None and evaluated_results:
+        cache.put_results(df_solutions_to_evaluate, pd.concat(evaluated_results))
+
+    df_results = pd.concat(results + evaluated_results)
+    return fan_out_results(df_solutions, representative_ids, df_results)
 
 
 def evaluate_by_solution(df_solutions: pd.DataFrame,
                          config: EvaluationConfig,
-                         parse_result: Callable[[Path], pd.Series]) -> pd.DataFrame:
+                         parse_result: Callable[[Path], pd.Series],
+                         cache: Optional[EvaluationCache] = None) -> pd.DataFrame:
     """
-    Run evaluation tool on each solution separately.
+    Run evaluation tool on each solution separately. Solutions with identical code and language are evaluated once.
+    If `cache` is given, only solutions without cached results are evaluated.
     Return solutions with evaluation results.
     """
 
-    results = df_solutions.apply(lambda solution: evaluate(solution.to_frame().T, config, parse_result), axis=1)
+    def evaluate_solution(solution: pd.Series) -> pd.Series:
+        if cache is not None:
+            cached_result = cache.get(solution)
+            if cached_result is not None:
+                return pd.Series(cached_result, dtype=object)
+
+        result = evaluate(solution.to_frame().T, config, parse_result)
+
+        if cache is not None:
+            cache.put(solution, result.to_dict())
+        return result
+
+    df_unique_solutions, representative_ids = deduplicate_solutions(df_solutions)
+
+    df_results = pd.DataFrame([evaluate_solution(solution) for _, solution in df_unique_solutions.iterrows()])
+    df_results[SubmissionColumns.ID.value] = df_unique_solutions[SubmissionColumns.ID.value].tolist()
 
-    return pd.concat([df_solutions, pd.DataFrame.from_records(results)], axis=1)
+    return fan_out_results(df_solutions, representative_ids, df_results)
 
 
 T = TypeVar('T')
 
 
-def evaluate(df_solutions: pd.DataFrame, config: EvaluationConfig, parse_result: [[Path], T]) -> T:
+def evaluate(df_solutions: pd.DataFrame,
+             config: EvaluationConfig,
+             parse_result: [[Path], T],
+             tmp_directory_name: Optional[str] = None) -> T:
     """
     Run tool on directory with group of solutions written on same language version.
+    Input and output are stored in `tmp_directory_name` directory inside `config.tmp_path`
+    (language version name by default).
     Return path to evaluation result.
     """
 
@@ -66,28 +160,20 @@ def evaluate(df_solutions: pd.DataFrame, config: EvaluationConfig, parse_result:
     assert language_versions.size == 1, "Given solution should have same language version"
     language_version = language_versions[0]
 
-    language_version_path = create_directory(config.tmp_path / language_version.value, clear=True)
+    if tmp_directory_name is None:
+        tmp_directory_name = language_version.value
+
+    language_version_path = create_directory(config.tmp_path / tmp_directory_name, clear=True)
     input_path = create_directory(language_version_path / 'input', clear=True)
     output_path = create_directory(language_version_path / 'output', clear=True)
 
     save_solutions_to_files(df_solutions, language_version, input_path, config.with_template)
 
     command = config.build_command(input_path, output_path, language_version)
-    evaluate_command(command)
+    config.executor.execute(command)
 
     result = parse_result(output_path / config.result_path)
 
     remove_directory(language_version_path)
 
     return result
-
-
-def evaluate_command(command: List[str]):
-    logger.info('Start evaluation')
-    start = time.time()
-
-    logger.info('Executing command: ' + (' '.join(command)))
-    run_in_subprocess(command)
-
-    end = time.time()
-    logger.info(f'Finish evaluation time={end - start}s')
@@ -0,0 +1,166 @@
+import argparse
+import logging
+import time
+from abc import ABC, abstractmethod
+from enum import Enum, unique
+from pathlib import Path
+from queue import Queue
+from typing import List, Optional, Set
+
+from hyperstyle.src.python.review.common.subprocess_runner import run_in_subprocess
+
+logger = logging.getLogger(__name__)
+
+
+@unique
+class ExecutorType(Enum):
+    SUBPROCESS = 'subprocess'
+    DOCKER_POOL = 'docker_pool'
+
+    @classmethod
+    def values(cls) -> Set[str]:
+        return {cls.SUBPROCESS.value, cls.DOCKER_POOL.value}
+
+
+class Executor:
+    """ Runs evaluation tool commands in subprocess. """
+
+    # Commands are executed inside container, so tool should be called directly, without `docker run`
+    runs_in_container: bool = False
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def execute(self, command: List[str]):
+        logger.info('Start evaluation')
+        start = time.time()
+
+        logger.info('Executing command: ' + (' '.join(command)))
+        run_in_subprocess(command)
+
+        end = time.time()
+        logger.info(f'Finish evaluation time={end - start}s')
+
+    def __enter__(self) -> 'Executor':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+class ContainerPoolExecutor(Executor, ABC):
+    """
+    Runs evaluation tool commands inside pool of long-lived containers, which are started once on `start`
+    and removed on `stop`. Every container executes one command at a time, commands wait for a free container.
+    """
+
+    runs_in_container = True
+
+    def __init__(self, n_containers: int = 1):
+        self.n_containers = n_containers
+        self.containers: List[str] = []
+        self.free_containers: Queue = Queue()
+
+    @abstractmethod
+    def start_container(self) -> str:
+        """ Start container and return its id. """
+        pass
+
+    @abstractmethod
+    def stop_container(self, container: str):
+        """ Stop and remove `container`. """
+        pass
+
+    @abstractmethod
+    def build_container_command(self, container: str, command: List[str]) -> List[str]:
+        """ Build command which runs given `command` inside `container`. """
+        pass
+
+    def start(self):
+        logger.info(f'Starting {self.n_containers} containers')
+        for _ in range(self.n_containers):
+            container = self.start_container()
+            self.containers.append(container)
+            self.free_containers.put(container)
+
+    def stop(self):
+        logger.info(f'Stopping {len(self.containers)} containers')
+        for container in self.containers:
+            self.stop_container(container)
+        self.containers = []
+        self.free_containers = Queue()
+
+    def execute(self, command: List[str]):
+        if not self.containers:
+            raise RuntimeError('Container pool is not started')
+
+        container = self.free_containers.get()
+        try:
+            super().execute(self.build_container_command(container, command))
+        finally:
+            self.free_containers.put(container)
+
+
+class DockerPoolExecutor(ContainerPoolExecutor):
+    """
+    Pool of docker containers started with `docker run -d` and fed with commands via `docker exec`.
+    `mount_paths` are mounted to containers by the same paths, so input and output paths stay unchanged.
+    """
+
+    def __init__(self, docker_path: str, mount_paths: List[Path], n_containers: int = 1):
+        super().__init__(n_containers)
+        self.docker_path = docker_path
+        self.mount_paths = mount_paths
+
+    def start_container(self) -> str:
+        command = ['docker', 'run', '-d', '--rm']
+        for mount_path in self.mount_paths:
+            command += ['-v', f'{mount_path}/:{mount_path}/']
+        command += [self.docker_path, 'sleep', 'infinity']
+
+        container = run_in_subprocess(command).strip()
+        if not container:
+            raise RuntimeError(f'Can not start container from {self.docker_path}')
+        return container
+
+    def stop_container(self, container: str):
+        run_in_subprocess(['docker', 'rm', '-f', container])
+
+    def build_container_command(self, container: str, command: List[str]) -> List[str]:
+        return ['docker', 'exec', container] + command
+
+
+def configure_executor_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--executor',
+                        default=ExecutorType.SUBPROCESS.value,
+                        choices=ExecutorType.values(),
+                        type=str,
+                        help='How to run evaluation tool: `subprocess` runs new container (or local tool) for every '
+                             'evaluation, `docker_pool` starts pool of containers once and reuses them.')
+
+    parser.add_argument('--containers',
+                        default=None,
+                        type=int,
+                        help='Number of containers in the pool for `docker_pool` executor. '
+                             'By default, equals to number of workers.')
+
+
+def create_executor(executor_type: ExecutorType,
+                    docker_path: Optional[str],
+                    mount_path: Path,
+                    n_containers: int) -> Executor:
+    """ Create executor of given type. Docker pool containers run `docker_path` image with mounted `mount_path`. """
+
+    if executor_type == ExecutorType.SUBPROCESS:
+        return Executor()
+
+    if executor_type == ExecutorType.DOCKER_POOL:
+        if docker_path is None:
+            raise ValueError('Docker path should be specified to run evaluation in docker pool')
+        return DockerPoolExecutor(docker_path, [mount_path], n_containers)
+
+    raise NotImplementedError(f'Executor {executor_type.value} is not supported')
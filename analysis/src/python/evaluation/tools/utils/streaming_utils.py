@@ -0,0 +1,94 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Set
+
+import pandas as pd
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.utils.df_utils import append_df, read_df_in_chunks
+from analysis.src.python.utils.extension_utils import AnalysisExtension, get_restricted_extension
+from analysis.src.python.utils.file_utils import remove_file
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_SUFFIX = '.checkpoint'
+
+
+class EvaluationCheckpoint:
+    """
+    Manifest of solutions which results are already written to the output file.
+
+    Every line of manifest contains ids of appended chunk of solutions and output file size after appending.
+    On restore, output file is truncated to the last recorded size, so partially written chunk is dropped.
+    """
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.checkpoint_path = output_path.parent / f'{output_path.name}{CHECKPOINT_SUFFIX}'
+
+    def restore(self) -> Set[int]:
+        """ Return ids of already evaluated solutions and drop output written after the last checkpoint. """
+
+        completed_ids = set()
+        output_size = 0
+
+        if self.checkpoint_path.exists():
+            with open(self.checkpoint_path) as checkpoint_file:
+                for line in checkpoint_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Last record can be written partially
+                        break
+                    completed_ids.update(record['ids'])
+                    output_size = record['output_size']
+
+        if self.output_path.exists():
+            if output_size == 0:
+                remove_file(self.output_path)
+            elif os.path.getsize(self.output_path) != output_size:
+                logger.info(f'Dropping output written after the last checkpoint from {self.output_path}')
+                os.truncate(self.output_path, output_size)
+
+        logger.info(f'Restored {len(completed_ids)} evaluated solutions from checkpoint')
+        return completed_ids
+
+    def save(self, ids: Iterable[int]):
+        """ Record that results of solutions with given `ids` are appended to the output file. """
+
+        record = {'ids': list(ids), 'output_size': os.path.getsize(self.output_path)}
+        with open(self.checkpoint_path, 'a') as checkpoint_file:
+            checkpoint_file.write(json.dumps(record) + '\n')
+
+
+def evaluate_in_chunks(solutions_path: Path,
+                       output_path: Path,
+                       evaluate_chunk: Callable[[pd.DataFrame], pd.DataFrame],
+                       chunk_size: int,
+                       start_offset: Optional[int] = None,
+                       end_offset: Optional[int] = None):
+    """
+    Read solutions by chunks of `chunk_size` rows, evaluate every chunk and append results to `output_path` .csv file.
+    Only rows between `start_offset` and `end_offset` bytes of solutions file are evaluated if offsets are given.
+    Progress is saved to checkpoint, so on restart already evaluated solutions are skipped.
+    """
+
+    get_restricted_extension(output_path, [AnalysisExtension.CSV])
+
+    checkpoint = EvaluationCheckpoint(output_path)
+    completed_ids = checkpoint.restore()
+
+    evaluated = 0
+    for df_chunk in read_df_in_chunks(solutions_path, chunk_size, start_offset, end_offset):
+        df_chunk = df_chunk[~df_chunk[SubmissionColumns.ID.value].isin(completed_ids)]
+        if df_chunk.empty:
+            continue
+
+        df_results = evaluate_chunk(df_chunk)
+        append_df(df_results, output_path)
+        checkpoint.save(df_chunk[SubmissionColumns.ID.value].tolist())
+
+        evaluated += df_chunk.shape[0]
+        logger.info(f'Evaluated {evaluated} solutions ({len(completed_ids)} skipped as already evaluated)')
@@ -0,0 +1,227 @@
+import logging
+import operator
+import os
+import re
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import csv as pa_csv, ipc, parquet as pq
+
+from analysis.src.python.utils.csv_utils import read_csv_header
+from analysis.src.python.utils.extension_utils import AnalysisExtension, get_restricted_extension
+
+logger = logging.getLogger(__name__)
+
+# Code in solutions contains line breaks
+CSV_PARSE_OPTIONS = pa_csv.ParseOptions(newlines_in_values=True)
+
+# Size in bytes of the first block of .csv file, which is parsed to infer column types
+SCHEMA_SAMPLE_SIZE = 1 << 20
+
+
+def unify_types(types: Iterable[pa.DataType]) -> pa.DataType:
+    """ Common type of column values: integers and floats are unified to float, other different types to string. """
+
+    types = {column_type for column_type in types if not pa.types.is_null(column_type)}
+    if len(types) == 1:
+        return types.pop()
+    if types and all(pa.types.is_integer(column_type) or pa.types.is_floating(column_type) for column_type in types):
+        return pa.float64()
+    return pa.string()
+
+
+def read_csv_table(path: Union[str, Path], schema: Optional[pa.Schema] = None) -> pa.Table:
+    convert_options = pa_csv.ConvertOptions(column_types=schema)
+    return pa_csv.read_csv(path, parse_options=CSV_PARSE_OPTIONS, convert_options=convert_options)
+
+
+def infer_csv_schema(path: Union[str, Path], sample_size: int = SCHEMA_SAMPLE_SIZE) -> pa.Schema:
+    """ Infer column types of .csv file from its first block of `sample_size` bytes. """
+
+    while True:
+        with open(path, 'rb') as source:
+            try:
+                read_options = pa_csv.ReadOptions(block_size=sample_size)
+                return pa_csv.open_csv(source, read_options=read_options, parse_options=CSV_PARSE_OPTIONS).schema
+            except pa.ArrowInvalid as e:
+                # The first row does not fit the block
+                if 'straddling' not in str(e):
+                    raise
+                sample_size *= 2
+
+
+def get_merged_schema(input_paths: List[Union[str, Path]], sample_size: int = SCHEMA_SAMPLE_SIZE) -> pa.Schema:
+    """ Schema which fits all given .csv files. Types are inferred from the first block of every file. """
+
+    header = None
+    column_types = {}
+    for input_path in input_paths:
+        input_header = read_csv_header(input_path)
+        if header is None:
+            header = input_header
+            column_types = {column: [] for column in header}
+        elif input_header != header:
+            raise ValueError(f'Columns of {input_path} {input_header} differ from merged columns {header}')
+
+        for field in infer_csv_schema(input_path, sample_size):
+            column_types[field.name].append(field.type)
+
+    return pa.schema([(column, unify_types(types)) for column, types in column_types.items()])
+
+
+def widen_schema(schema: pa.Schema, error: pa.ArrowInvalid) -> pa.Schema:
+    """
+    Widen type of the column, which values failed to convert: integers are widened to float, other types to string.
+    """
+
+    match = re.search(r'CSV column #(\d+)', str(error))
+    if match is None:
+        raise error
+    index = int(match.group(1))
+    field = schema.field(index)
+    if pa.types.is_string(field.type):
+        raise error
+
+    widen_type = pa.float64() if pa.types.is_integer(field.type) else pa.string()
+    logger.info(f'Values of column {field.name} do not fit {field.type} type, widening it to {widen_type}')
+    return schema.set(index, pa.field(field.name, widen_type))
+
+
+def write_csv_files_to_arrow(input_paths: List[Union[str, Path]], output_path: Union[str, Path], schema: pa.Schema):
+    ext = get_restricted_extension(output_path, [AnalysisExtension.PARQUET, AnalysisExtension.FEATHER])
+    if ext == AnalysisExtension.PARQUET:
+        writer = pq.ParquetWriter(str(output_path), schema)
+    else:
+        writer = ipc.new_file(str(output_path), schema)
+
+    with writer:
+        for input_path in input_paths:
+            writer.write_table(read_csv_table(input_path, schema))
+
+
+def merge_csv_files_to_arrow(input_paths: List[Union[str, Path]],
+                             output_path: Union[str, Path],
+                             sample_size: int = SCHEMA_SAMPLE_SIZE):
+    """
+    Merge .csv files with the same columns into one `output_path` .parquet or .feather file.
+    Every input file is written as a separate row group (record batch for feather).
+
+    Column types are inferred from the first `sample_size` bytes of every file. If values further in files
+    do not fit the inferred type, the type is widened and files are written again.
+    """
+
+    schema = get_merged_schema(input_paths, sample_size)
+    while True:
+        try:
+            write_csv_files_to_arrow(input_paths, output_path, schema)
+            return
+        except pa.ArrowInvalid as e:
+            schema = widen_schema(schema, e)
+
+
+# Filter is a list of (column, operator, value) conditions joined by AND, e.g. [('lang', '==', 'python3')]
+Filters = List[Tuple[str, str, Any]]
+
+FILTER_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda column, value: column.isin(value),
+    'not in': lambda column, value: ~column.isin(value),
+}
+
+
+def filters_to_expression(filters: Filters) -> Optional[ds.Expression]:
+    """ Convert filters to arrow dataset expression, which is pushed down to the file reader. """
+
+    expression = None
+    for column, op, value in filters:
+        if op not in FILTER_OPERATORS:
+            raise ValueError(f'Unsupported filter operator {op}. Available values are: {list(FILTER_OPERATORS)}.')
+        condition = FILTER_OPERATORS[op](ds.field(column), value)
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _get_dataset(path: Union[str, Path]) -> ds.Dataset:
+    ext = get_restricted_extension(path, [AnalysisExtension.PARQUET, AnalysisExtension.FEATHER])
+    return ds.dataset(str(path), format='parquet' if ext == AnalysisExtension.PARQUET else 'ipc')
+
+
+def read_arrow_df(path: Union[str, Path],
+                  columns: Optional[List[str]] = None,
+                  filters: Optional[Filters] = None) -> pd.DataFrame:
+    """
+    Read dataframe from given .parquet or .feather file.
+    Only `columns` are read and row groups which do not match `filters` are skipped if possible.
+    """
+
+    expression = filters_to_expression(filters) if filters else None
+    return _get_dataset(path).to_table(columns=columns, filter=expression).to_pandas()
+
+
+def read_arrow_df_in_chunks(path: Union[str, Path], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """ Read dataframe from given .parquet or .feather file by chunks of at most `chunk_size` rows. """
+
+    for batch in _get_dataset(path).to_batches(batch_size=chunk_size):
+        if batch.num_rows > 0:
+            yield batch.to_pandas()
+
+
+def _write_arrow_table(table: pa.Table, path: Union[str, Path], ext: AnalysisExtension):
+    if ext == AnalysisExtension.PARQUET:
+        pq.write_table(table, str(path))
+    else:
+        with ipc.new_file(str(path), table.schema) as writer:
+            writer.write_table(table)
+
+
+def write_arrow_df(df: pd.DataFrame, path: Union[str, Path]):
+    """ Write dataframe to given .parquet or .feather file as a single row group. """
+
+    ext = get_restricted_extension(path, [AnalysisExtension.PARQUET, AnalysisExtension.FEATHER])
+    _write_arrow_table(pa.Table.from_pandas(df, preserve_index=False), path, ext)
+
+
+def _copy_parquet_with_table(path: Path, output_path: Path, df: pd.DataFrame):
+    source = pq.ParquetFile(str(path))
+    # Appended row group has the schema of the file, so the file is read at once
+    table = pa.Table.from_pandas(df, schema=source.schema_arrow, preserve_index=False)
+    with pq.ParquetWriter(str(output_path), source.schema_arrow) as writer:
+        for i in range(source.num_row_groups):
+            writer.write_table(source.read_row_group(i))
+        writer.write_table(table)
+
+
+def _copy_feather_with_table(path: Path, output_path: Path, df: pd.DataFrame):
+    with pa.memory_map(str(path)) as source:
+        reader = ipc.open_file(source)
+        table = pa.Table.from_pandas(df, schema=reader.schema, preserve_index=False)
+        with ipc.new_file(str(output_path), reader.schema) as writer:
+            for i in range(reader.num_record_batches):
+                writer.write_batch(reader.get_batch(i))
+            writer.write_table(table)
+
+
+def append_arrow_df(df: pd.DataFrame, path: Union[str, Path]):
+    """
+    Append dataframe to given .parquet or .feather file as a new row group (record batch for feather).
+    Neither format can be appended in place, so previous row groups are copied one by one to a new file
+    after which the appended one is written, and the new file replaces the given one. The file stays a single
+    file readable by any parquet or feather reader.
+    """
+
+    ext = get_restricted_extension(path, [AnalysisExtension.PARQUET, AnalysisExtension.FEATHER])
+    path = Path(path)
+    tmp_path = path.parent / f'{path.name}.tmp'
+    if ext == AnalysisExtension.PARQUET:
+        _copy_parquet_with_table(path, tmp_path, df)
+    else:
+        _copy_feather_with_table(path, tmp_path, df)
+    os.replace(tmp_path, path)
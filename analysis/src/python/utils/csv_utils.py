@@ -0,0 +1,125 @@
+import csv
+import io
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+
+def read_csv_header(path: Union[str, Path]) -> List[str]:
+    """ Read column names of given .csv file without reading its rows. """
+
+    with open(path, newline='') as csv_file:
+        return next(csv.reader(csv_file), [])
+
+
+def merge_csv_files(input_paths: List[Union[str, Path]], output_path: Union[str, Path]):
+    """
+    Merge .csv files with the same columns into one `output_path` .csv file.
+    Files are copied byte-wise: header is written once, then raw rows of every file, rows are not parsed.
+    """
+
+    header = None
+    with open(output_path, 'wb') as output_file:
+        for input_path in input_paths:
+            input_header = read_csv_header(input_path)
+            if header is not None and input_header != header:
+                raise ValueError(f'Columns of {input_path} {input_header} differ from merged columns {header}')
+
+            with open(input_path, 'rb') as input_file:
+                header_line = input_file.readline()
+                if header is None:
+                    header = input_header
+                    output_file.write(header_line if header_line.endswith(b'\n') else header_line + b'\n')
+
+                rows_start = input_file.tell()
+                input_file.seek(0, os.SEEK_END)
+                if input_file.tell() == rows_start:
+                    continue
+
+                # Last row of the file can have no line break
+                input_file.seek(-1, os.SEEK_END)
+                ends_with_line_break = input_file.read(1) == b'\n'
+
+                input_file.seek(rows_start)
+                shutil.copyfileobj(input_file, output_file)
+                if not ends_with_line_break:
+                    output_file.write(b'\n')
+
+
+def build_csv_batch_offsets(path: Union[str, Path], batch_size: int) -> List[Tuple[int, int]]:
+    """
+    Split rows of given .csv file into batches of `batch_size` rows and return byte offsets [start, end)
+    of every batch. Quoted values with line breaks (e.x. code) are handled: line break inside quotes does not end row.
+    """
+
+    batch_offsets = []
+    with open(path, 'rb') as csv_file:
+        quotes = 0
+        for line in csv_file:
+            quotes += line.count(b'"')
+            if quotes % 2 == 0:
+                break
+
+        start_offset = csv_file.tell()
+        offset = start_offset
+        rows = 0
+        for line in csv_file:
+            offset += len(line)
+            quotes += line.count(b'"')
+            # Row ends only if all quotes are closed
+            if quotes % 2 != 0:
+                continue
+
+            rows += 1
+            if rows == batch_size:
+                batch_offsets.append((start_offset, offset))
+                start_offset = offset
+                rows = 0
+
+        if offset != start_offset:
+            batch_offsets.append((start_offset, offset))
+
+    return batch_offsets
+
+
+class CsvSliceReader(io.RawIOBase):
+    """ Stream of .csv file header followed by rows between `start_offset` and `end_offset` bytes of the file. """
+
+    def __init__(self, path: Union[str, Path], start_offset: int, end_offset: Optional[int] = None):
+        self.file = open(path, 'rb')
+
+        header = self.file.readline()
+        self.header = header if header.endswith(b'\n') else header + b'\n'
+
+        start_offset = max(start_offset, self.file.tell())
+        if end_offset is None:
+            end_offset = os.path.getsize(path)
+
+        self.file.seek(start_offset)
+        self.remaining = max(end_offset - start_offset, 0)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.header:
+            size = min(len(buffer), len(self.header))
+            buffer[:size] = self.header[:size]
+            self.header = self.header[size:]
+            return size
+
+        data = self.file.read(min(len(buffer), self.remaining))
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+def open_csv_slice(path: Union[str, Path], start_offset: int, end_offset: Optional[int] = None) -> io.BufferedReader:
+    """ Open .csv file to read only rows between `start_offset` and `end_offset` bytes (with header). """
+
+    return io.BufferedReader(CsvSliceReader(path, start_offset, end_offset))
@@ -1,10 +1,13 @@
 import os
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 import pandas as pd
 from pandarallel import pandarallel
 
+from analysis.src.python.utils.arrow_utils import append_arrow_df, FILTER_OPERATORS, Filters, read_arrow_df, \
+    read_arrow_df_in_chunks, write_arrow_df
+from analysis.src.python.utils.csv_utils import open_csv_slice
 from analysis.src.python.utils.extension_utils import AnalysisExtension, get_restricted_extension
 from analysis.src.python.utils.xlsx_utils import read_df_from_xlsx, write_df_to_xlsx
 
@@ -79,34 +82,121 @@ def merge_dfs(df_left: pd.DataFrame, df_right: pd.DataFrame, left_on: str, right
     return df_merged
 
 
-def read_df(path: Union[str, Path]) -> Optional[pd.DataFrame]:
-    """ Read dataframe from given .csv or .xlsx file `Sheet1` sheet. """
+DF_EXTENSIONS = [AnalysisExtension.CSV, AnalysisExtension.XLSX, AnalysisExtension.PARQUET, AnalysisExtension.FEATHER]
+ARROW_EXTENSIONS = [AnalysisExtension.PARQUET, AnalysisExtension.FEATHER]
+
+
+def filter_df(df: pd.DataFrame, filters: Filters) -> pd.DataFrame:
+    """ Filter dataframe `df` rows by (column, operator, value) conditions joined by AND. """
+
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if op not in FILTER_OPERATORS:
+            raise ValueError(f'Unsupported filter operator {op}. Available values are: {list(FILTER_OPERATORS)}.')
+        mask &= FILTER_OPERATORS[op](df[column], value)
+    return df.loc[mask]
+
+
+def _check_offsets(ext: AnalysisExtension, start_offset: Optional[int], end_offset: Optional[int]):
+    if ext != AnalysisExtension.CSV and (start_offset is not None or end_offset is not None):
+        raise ValueError('Byte offsets are supported only for .csv files')
+
+
+def read_df(path: Union[str, Path],
+            start_offset: Optional[int] = None,
+            end_offset: Optional[int] = None,
+            columns: Optional[List[str]] = None,
+            filters: Optional[Filters] = None,
+            dtype: Optional[Dict[str, str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Read dataframe from given .csv, .parquet, .feather or .xlsx file `Sheet1` sheet.
+    For .csv file only rows between `start_offset` and `end_offset` bytes can be read.
+
+    Only `columns` are read if given. Rows are filtered by `filters`, list of (column, operator, value) conditions,
+    for .parquet and .feather files filters are pushed down to the reader, so not matching row groups are skipped.
+    Columns are converted to types from `dtype` dict, for .csv file values are parsed directly to these types.
+    """
+
+    ext = get_restricted_extension(path, DF_EXTENSIONS)
+    _check_offsets(ext, start_offset, end_offset)
+    if ext in ARROW_EXTENSIONS:
+        df = read_arrow_df(path, columns, filters)
+        return df if dtype is None else df.astype({c: t for c, t in dtype.items() if c in df.columns})
+
+    if filters:
+        # Columns used only for filtering are read too and dropped after filtering
+        read_columns = None if columns is None else list(dict.fromkeys(columns + [f[0] for f in filters]))
+    else:
+        read_columns = columns
 
-    ext = get_restricted_extension(path, [AnalysisExtension.CSV, AnalysisExtension.XLSX])
     if ext == AnalysisExtension.CSV:
-        df = pd.read_csv(path)
+        if start_offset is None and end_offset is None:
+            df = pd.read_csv(path, usecols=read_columns, dtype=dtype)
+        else:
+            with open_csv_slice(path, start_offset or 0, end_offset) as csv_slice:
+                df = pd.read_csv(csv_slice, usecols=read_columns, dtype=dtype)
     else:
         df = read_df_from_xlsx(path)
+        if read_columns is not None:
+            df = df[read_columns]
+        if dtype is not None:
+            df = df.astype({c: t for c, t in dtype.items() if c in df.columns})
+
+    if filters:
+        df = filter_df(df, filters).reset_index(drop=True)
+    if columns is not None:
+        df = df[columns]
     return df
 
 
+def read_df_in_chunks(path: Union[str, Path],
+                      chunk_size: int,
+                      start_offset: Optional[int] = None,
+                      end_offset: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read dataframe from given .csv, .parquet, .feather or .xlsx file `Sheet1` sheet by chunks of `chunk_size` rows.
+    For .csv file only rows between `start_offset` and `end_offset` bytes can be read.
+    """
+
+    ext = get_restricted_extension(path, DF_EXTENSIONS)
+    _check_offsets(ext, start_offset, end_offset)
+    if ext == AnalysisExtension.CSV:
+        with open_csv_slice(path, start_offset or 0, end_offset) as csv_slice:
+            yield from pd.read_csv(csv_slice, chunksize=chunk_size)
+    elif ext in ARROW_EXTENSIONS:
+        yield from read_arrow_df_in_chunks(path, chunk_size)
+    else:
+        # xlsx can not be read partially
+        df = read_df_from_xlsx(path)
+        for start in range(0, df.shape[0], chunk_size):
+            yield df.iloc[start:start + chunk_size]
+
+
 def write_df(df: pd.DataFrame, path: Union[str, Path]):
-    """ Write dataframe to given .csv or .xlsx file `Sheet1` sheet. """
+    """ Write dataframe to given .csv, .parquet, .feather or .xlsx file `Sheet1` sheet. """
 
-    ext = get_restricted_extension(path, [AnalysisExtension.CSV, AnalysisExtension.XLSX])
+    ext = get_restricted_extension(path, DF_EXTENSIONS)
     if ext == AnalysisExtension.CSV:
         df.to_csv(path, index=False)
+    elif ext in ARROW_EXTENSIONS:
+        write_arrow_df(df, path)
     else:
         write_df_to_xlsx(df, path, index=False)
 
 
 def append_df(df: pd.DataFrame, path: Union[str, Path]):
-    """ Append dataframe by given .csv file or .xlsx file `Sheet1` sheet. """
+    """
+    Append dataframe by given .csv, .parquet, .feather file or .xlsx file `Sheet1` sheet.
+    Dataframe is appended to .parquet and .feather files as a new row group, the file is rewritten by row groups
+    and stays a single file.
+    """
 
     if os.path.exists(path):
-        ext = get_restricted_extension(path, [AnalysisExtension.CSV, AnalysisExtension.XLSX])
+        ext = get_restricted_extension(path, DF_EXTENSIONS)
         if ext == AnalysisExtension.CSV:
             df.to_csv(path, index=False, mode='a', header=False)
+        elif ext in ARROW_EXTENSIONS:
+            append_arrow_df(df, path)
         else:
             write_df_to_xlsx(df, path, index=False, mode='a', header=False)
     else:
@@ -14,6 +14,9 @@ class AnalysisExtension(Enum):
     JSON = '.json'
     HTML = '.html'
     TXT = '.txt'
+    PARQUET = '.parquet'
+    FEATHER = '.feather'
+    NPZ = '.npz'
 
     # Image extensions
     PNG = '.png'
@@ -1,5 +1,10 @@
 import subprocess
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
 
 
 def run_in_subprocess_with_working_dir(command: List[str], working_dir: str) -> str:
@@ -15,6 +20,28 @@ def run_in_subprocess_with_working_dir(command: List[str], working_dir: str) ->
     return stdout
 
 
-def run_and_wait(command: List[str], stdout=None, stderr=None, cwd=None) -> None:
+def run_and_wait(command: List[str], stdout=None, stderr=None, cwd=None) -> int:
     process = subprocess.Popen(command, stdout=stdout, stderr=stderr, cwd=cwd)
-    process.wait()
+    return process.wait()
+
+
+def map_ordered(func: Callable[[T], R], items: Iterable[T], n_workers: int) -> Iterator[R]:
+    """
+    Lazily apply `func` to `items` in `n_workers` threads and yield results in order of `items`.
+    At most `n_workers` items are processed ahead of consumer, so `items` can be infinite. When consumer stops
+    iteration, not started items are cancelled.
+    """
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = deque(executor.submit(func, item) for _, item in zip(range(n_workers), items))
+        try:
+            while futures:
+                result = futures.popleft().result()
+                for item in items:
+                    futures.append(executor.submit(func, item))
+                    break
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
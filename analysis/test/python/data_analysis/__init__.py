@@ -1,5 +1,11 @@
 from analysis.test.python import TEST_DATA_FOLDER
+from analysis.test.python.evaluation.tools import QODANA_DIR_PATH
 
 CURRENT_TEST_DATA_FOLDER = TEST_DATA_FOLDER / 'data_analysis'
 
 TEMPLATES_ISSUES_FOLDER = CURRENT_TEST_DATA_FOLDER / 'templates'
+
+# Submissions with code quality reports, which are shared by tests of reports processing
+HYPERSTYLE_SUBMISSIONS_PATH = TEMPLATES_ISSUES_FOLDER / 'template_issues' / 'submissions_python3_hyperstyle.csv'
+
+QODANA_SUBMISSIONS_PATH = QODANA_DIR_PATH / 'docker_evaluation' / 'out_1.csv'
@@ -0,0 +1,48 @@
+import pytest
+
+from analysis.src.python.data_analysis.model.column_dtypes import read_df_columns
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.data_analysis.preprocessing.compile_dataset import compile_dataset
+from analysis.src.python.utils.df_utils import read_df, write_df
+from analysis.src.python.utils.extension_utils import AnalysisExtension
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_analysis.preprocessing import COMPILE_DATASET_TEST_DATA_FOLDER
+
+RESULT_PATH = COMPILE_DATASET_TEST_DATA_FOLDER / 'result'
+
+
+INPUT_PATH = COMPILE_DATASET_TEST_DATA_FOLDER / 'input'
+DATASETS = ['submissions', 'steps', 'topics']
+
+
+@pytest.mark.parametrize('extension', [AnalysisExtension.CSV, AnalysisExtension.PARQUET])
+def test_compile_dataset(extension: AnalysisExtension):
+    remove_directory(RESULT_PATH)
+    create_directory(INPUT_PATH, clear=True)
+    # Columnar datasets are read with filters, other datasets are filtered in memory
+    for dataset in DATASETS:
+        write_df(read_df(COMPILE_DATASET_TEST_DATA_FOLDER / f'{dataset}.csv'),
+                 INPUT_PATH / f'{dataset}{extension.value}')
+
+    compile_dataset(*[INPUT_PATH / f'{dataset}{extension.value}' for dataset in DATASETS], RESULT_PATH)
+
+    df_submissions = read_df(RESULT_PATH / f'submissions{extension.value}')
+    df_steps = read_df(RESULT_PATH / f'steps{extension.value}')
+    df_topics = read_df(RESULT_PATH / f'topics{extension.value}')
+    remove_directory(RESULT_PATH)
+    remove_directory(INPUT_PATH)
+
+    assert df_submissions['id'].tolist() == [1, 2]
+    assert df_submissions.columns.tolist() == ['id', 'user_id', 'step_id', 'lang', 'client', 'code']
+    assert df_submissions['code'].tolist() == ['print(1)', 'print(\n2)']
+    assert df_steps['id'].tolist() == [100]
+    assert df_topics['id'].tolist() == [1000]
+
+
+def test_read_df_columns():
+    df_submissions = read_df_columns(COMPILE_DATASET_TEST_DATA_FOLDER / 'submissions.csv',
+                                     [SubmissionColumns.ID, SubmissionColumns.LANG, SubmissionColumns.CODE])
+
+    assert df_submissions.columns.tolist() == ['id', 'lang', 'code']
+    assert df_submissions['id'].dtype == 'int32'
+    assert df_submissions['lang'].dtype == 'category'
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from analysis.src.python.data_analysis.model.column_name import IssueTableColumns, SubmissionColumns
+from analysis.src.python.data_analysis.preprocessing.explode_issues import explode_issues
+from analysis.src.python.data_analysis.utils.report_utils import parse_report
+from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_analysis import HYPERSTYLE_SUBMISSIONS_PATH, QODANA_SUBMISSIONS_PATH
+from analysis.test.python.data_analysis.preprocessing import EXPLODE_ISSUES_TEST_DATA_FOLDER
+
+RESULT_PATH = EXPLODE_ISSUES_TEST_DATA_FOLDER / 'result'
+
+EXPLODE_ISSUES_DATA = [
+    (HYPERSTYLE_SUBMISSIONS_PATH, SubmissionColumns.HYPERSTYLE_ISSUES.value),
+    (QODANA_SUBMISSIONS_PATH, SubmissionColumns.QODANA_ISSUES.value),
+]
+
+
+@pytest.mark.parametrize(('submissions_path', 'issues_column'), EXPLODE_ISSUES_DATA)
+def test_explode_issues(submissions_path: Path, issues_column: str):
+    create_directory(RESULT_PATH, clear=True)
+    issues_table_path = RESULT_PATH / 'issues.parquet'
+    df_submissions = read_df(submissions_path)
+
+    explode_issues(submissions_path, issues_table_path, issues_column, chunk_size=2)
+
+    df_issues_table = read_df(issues_table_path)
+    remove_directory(RESULT_PATH)
+
+    expected_rows = [
+        (submission[SubmissionColumns.ID.value], issue.get_name(), issue.get_line_number(),
+         issue.get_column_number(), issue.get_category(), issue.get_difficulty())
+        for _, submission in df_submissions.iterrows()
+        for issue in parse_report(submission, issues_column).get_issues()
+    ]
+    columns = [IssueTableColumns.SUBMISSION_ID.value, IssueTableColumns.ISSUE_NAME.value,
+               IssueTableColumns.LINE.value, IssueTableColumns.COLUMN.value,
+               IssueTableColumns.CATEGORY.value, IssueTableColumns.DIFFICULTY.value]
+    assert len(expected_rows) > 0
+    assert list(df_issues_table[columns].itertuples(index=False, name=None)) == expected_rows
+
+    influence = df_issues_table[IssueTableColumns.INFLUENCE.value]
+    if issues_column == SubmissionColumns.HYPERSTYLE_ISSUES.value:
+        assert influence.notna().all()
+    else:
+        assert influence.isna().all()
@@ -0,0 +1,3 @@
+from analysis.test.python.data_analysis import CURRENT_TEST_DATA_FOLDER
+
+STATISTICS_TEST_DATA_FOLDER = CURRENT_TEST_DATA_FOLDER / 'statistics'
@@ -0,0 +1,81 @@
+import random
+from typing import List
+
+import pandas as pd
+
+from analysis.src.python.data_analysis.model.column_name import IssuesColumns, SubmissionColumns
+from analysis.src.python.data_analysis.statistics.issues_change_statistics import \
+    calculate_issues_change_statistics, get_submissions_issues_change_statistics
+from analysis.src.python.utils.df_utils import read_df, write_df
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_analysis.statistics import STATISTICS_TEST_DATA_FOLDER
+
+RESULT_PATH = STATISTICS_TEST_DATA_FOLDER / 'issues_change_result'
+ISSUE_NAMES = ['MagicNumberCheck', 'WPS446', 'E501']
+
+
+def get_issues_statistics(n_groups: int) -> pd.DataFrame:
+    """ Issues statistics of submissions series in random order. """
+
+    rng = random.Random(7)
+    rows = []
+    submission_id = 1
+    for group in range(n_groups):
+        for attempt in range(1, rng.randint(1, 5) + 1):
+            rows.append([submission_id, group, attempt] + [rng.randint(0, 3) for _ in ISSUE_NAMES])
+            submission_id += 1
+    rng.shuffle(rows)
+    return pd.DataFrame(rows, columns=[SubmissionColumns.ID.value, SubmissionColumns.GROUP.value,
+                                       SubmissionColumns.ATTEMPT.value] + ISSUE_NAMES)
+
+
+def calculate_series_issues_change_statistics(df_series: pd.DataFrame, issue_names: List[str]) -> List[List[int]]:
+    """ Diffs of issues counts calculated attempt by attempt for one submissions series. """
+
+    df_series = df_series.sort_values([SubmissionColumns.ATTEMPT.value])
+    diffs = []
+    previous = None
+    for _, submission in df_series.iterrows():
+        diffs.append([submission[SubmissionColumns.ID.value]] + [
+            submission[name] - (0 if previous is None else previous[name]) for name in issue_names
+        ])
+        previous = submission
+    return diffs
+
+
+def get_expected_statistics(df_issues_statistics: pd.DataFrame) -> List[List[int]]:
+    return [
+        diff
+        for _, df_series in df_issues_statistics.groupby(SubmissionColumns.GROUP.value)
+        for diff in calculate_series_issues_change_statistics(df_series, ISSUE_NAMES)
+    ]
+
+
+def test_calculate_issues_change_statistics():
+    df_issues_statistics = get_issues_statistics(n_groups=30)
+
+    df_issues_change_statistics = calculate_issues_change_statistics(df_issues_statistics, ISSUE_NAMES)
+
+    assert df_issues_change_statistics.columns.tolist() == [SubmissionColumns.ID.value] + ISSUE_NAMES
+    assert df_issues_change_statistics.values.tolist() == get_expected_statistics(df_issues_statistics)
+
+
+def test_get_submissions_issues_change_statistics():
+    create_directory(RESULT_PATH, clear=True)
+    df_issues_statistics = get_issues_statistics(n_groups=11)
+    submission_columns = [SubmissionColumns.ID.value, SubmissionColumns.GROUP.value, SubmissionColumns.ATTEMPT.value]
+    write_df(df_issues_statistics[submission_columns], RESULT_PATH / 'submissions.csv')
+    write_df(df_issues_statistics.drop(columns=submission_columns[1:]), RESULT_PATH / 'issues_statistics.csv')
+    write_df(pd.DataFrame({IssuesColumns.NAME.value: ISSUE_NAMES}), RESULT_PATH / 'issues.csv')
+
+    get_submissions_issues_change_statistics(RESULT_PATH / 'submissions.csv',
+                                             RESULT_PATH / 'issues_statistics.csv',
+                                             RESULT_PATH / 'issues_change_statistics.csv',
+                                             RESULT_PATH / 'issues.csv',
+                                             chunk_size=4)
+
+    df_issues_change_statistics = read_df(RESULT_PATH / 'issues_change_statistics.csv')
+    remove_directory(RESULT_PATH)
+
+    assert df_issues_change_statistics.columns.tolist() == [SubmissionColumns.ID.value] + ISSUE_NAMES
+    assert df_issues_change_statistics.values.tolist() == get_expected_statistics(df_issues_statistics)
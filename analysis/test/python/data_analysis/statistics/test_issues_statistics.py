@@ -0,0 +1,100 @@
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from analysis.src.python.data_analysis.model.column_name import IssuesColumns, IssueTableColumns, SubmissionColumns
+from analysis.src.python.data_analysis.statistics.issues_statistics import calculate_chunk_issues_statistics, \
+    calculate_chunk_issues_statistics_from_table, get_issues_statistics
+from analysis.src.python.data_analysis.utils.issues_matrix_utils import build_issues_count_matrix, \
+    ISSUES_MATRIX_DTYPE, issues_matrix_to_df, read_issues_matrix
+from analysis.src.python.data_analysis.utils.report_utils import explode_reports, parse_report
+from analysis.src.python.utils.df_utils import read_df, write_df
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_analysis import HYPERSTYLE_SUBMISSIONS_PATH
+from analysis.test.python.data_analysis.statistics import STATISTICS_TEST_DATA_FOLDER
+
+ISSUES_COLUMN = SubmissionColumns.HYPERSTYLE_ISSUES.value
+RESULT_PATH = STATISTICS_TEST_DATA_FOLDER / 'result'
+
+
+def get_submissions_and_issues():
+    df_submissions = read_df(HYPERSTYLE_SUBMISSIONS_PATH)
+    df_issues_table = explode_reports(df_submissions, ISSUES_COLUMN)
+    # Issues which are not found in submissions have zero counts
+    issue_names = sorted(df_issues_table[IssueTableColumns.ISSUE_NAME.value].unique()) + ['MissingIssue']
+    return df_submissions, df_issues_table, pd.DataFrame({IssuesColumns.NAME.value: issue_names})
+
+
+def count_issues(df_submissions: pd.DataFrame, issue_names):
+    """ Counts of issues of every submission, calculated by parsing every report. """
+
+    counts = []
+    for _, submission in df_submissions.iterrows():
+        submission_counts = Counter(issue.get_name() for issue in parse_report(submission, ISSUES_COLUMN).get_issues())
+        counts.append([submission[SubmissionColumns.ID.value]] + [submission_counts[name] for name in issue_names])
+    return counts
+
+
+def test_issues_statistics():
+    df_submissions, df_issues_table, df_issues = get_submissions_and_issues()
+    issue_names = df_issues[IssuesColumns.NAME.value].tolist()
+    submission_ids = df_submissions[SubmissionColumns.ID.value].tolist()
+
+    df_statistics = calculate_chunk_issues_statistics(df_submissions, df_issues, ISSUES_COLUMN)
+    df_table_statistics = calculate_chunk_issues_statistics_from_table(submission_ids, df_issues_table, df_issues)
+
+    assert df_statistics.columns.tolist() == [SubmissionColumns.ID.value] + issue_names
+    assert df_statistics.values.tolist() == count_issues(df_submissions, issue_names)
+    assert df_table_statistics.values.tolist() == df_statistics.values.tolist()
+    assert df_statistics['MissingIssue'].sum() == 0
+
+
+@pytest.mark.parametrize('as_sparse', [False, True])
+def test_build_issues_count_matrix(as_sparse: bool):
+    matrix = build_issues_count_matrix(
+        submission_ids=[3, 1, 2],
+        issues_submission_ids=[1, 1, 2, 3, 1, 4],
+        issues_names=['a', 'b', 'a', 'c', 'a', 'a'],
+        issue_names=['a', 'b'],
+        as_sparse=as_sparse,
+    )
+
+    # Issue c and submission 4 are not counted
+    df_statistics = issues_matrix_to_df(matrix, [3, 1, 2], ['a', 'b'])
+    assert df_statistics.values.tolist() == [[3, 0, 0], [1, 2, 1], [2, 1, 0]]
+
+
+@pytest.mark.parametrize('as_sparse', [False, True])
+def test_build_issues_count_matrix_with_repeated_submission(as_sparse: bool):
+    matrix = build_issues_count_matrix(
+        submission_ids=[1, 2, 1],
+        issues_submission_ids=[1, 2, 1, 3],
+        issues_names=['a', 'b', 'b', 'a'],
+        issue_names=['a', 'b'],
+        as_sparse=as_sparse,
+    )
+
+    df_statistics = issues_matrix_to_df(matrix, [1, 2, 1], ['a', 'b'])
+    assert matrix.dtype == ISSUES_MATRIX_DTYPE
+    assert df_statistics.values.tolist() == [[1, 1, 1], [2, 0, 1], [1, 1, 1]]
+
+
+def test_write_sparse_issues_statistics():
+    create_directory(RESULT_PATH, clear=True)
+    df_submissions, _, df_issues = get_submissions_and_issues()
+    issues_info_path = RESULT_PATH / 'issues_info.csv'
+    write_df(df_issues, issues_info_path)
+
+    get_issues_statistics(HYPERSTYLE_SUBMISSIONS_PATH, issues_info_path, ISSUES_COLUMN,
+                          RESULT_PATH / 'statistics.csv', 4)
+    get_issues_statistics(HYPERSTYLE_SUBMISSIONS_PATH, issues_info_path, ISSUES_COLUMN,
+                          RESULT_PATH / 'statistics.npz', 4)
+
+    df_statistics = read_df(RESULT_PATH / 'statistics.csv')
+    matrix, submission_ids, issue_names = read_issues_matrix(RESULT_PATH / 'statistics.npz')
+    remove_directory(RESULT_PATH)
+
+    assert submission_ids == df_submissions[SubmissionColumns.ID.value].tolist()
+    assert issue_names == df_issues[IssuesColumns.NAME.value].tolist()
+    assert issues_matrix_to_df(matrix, submission_ids, issue_names).values.tolist() == df_statistics.values.tolist()
@@ -0,0 +1,45 @@
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.data_analysis.utils.report_decoder_benchmark import REPORT_CLASSES, run_benchmark
+from analysis.src.python.data_analysis.utils.report_utils import parse_str_report
+from analysis.src.python.utils.df_utils import read_df
+from analysis.test.python.data_analysis import HYPERSTYLE_SUBMISSIONS_PATH, QODANA_SUBMISSIONS_PATH
+
+REPORTS_DATA = [
+    (HYPERSTYLE_SUBMISSIONS_PATH, SubmissionColumns.HYPERSTYLE_ISSUES.value),
+    (QODANA_SUBMISSIONS_PATH, SubmissionColumns.QODANA_ISSUES.value),
+]
+
+
+def read_str_reports(submissions_path: Path, issues_column: str):
+    return read_df(submissions_path)[issues_column].tolist()
+
+
+@pytest.mark.parametrize(('submissions_path', 'issues_column'), REPORTS_DATA)
+def test_decode_as_dataclasses_json(submissions_path: Path, issues_column: str):
+    report_class = REPORT_CLASSES[issues_column]
+
+    for str_report in read_str_reports(submissions_path, issues_column):
+        report = parse_str_report(str_report, issues_column)
+        expected_report = report_class.from_json(str_report)
+
+        assert type(report) is report_class
+        assert asdict(report) == asdict(expected_report)
+        assert report.to_json() == expected_report.to_json()
+
+
+def test_decode_missing_field():
+    with pytest.raises(KeyError):
+        parse_str_report('{"quality": {"code": "GOOD", "text": ""}}', SubmissionColumns.HYPERSTYLE_ISSUES.value)
+
+
+@pytest.mark.parametrize(('submissions_path', 'issues_column'), REPORTS_DATA)
+def test_run_benchmark(submissions_path: Path, issues_column: str):
+    timings = run_benchmark(read_str_reports(submissions_path, issues_column), issues_column, repeat=1)
+
+    assert list(timings) == ['dataclasses_json', 'decoder', 'json_loads', 'orjson_loads']
+    assert all(timing > 0 for timing in timings.values())
@@ -0,0 +1,23 @@
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.data_analysis.utils.report_utils import clear_report_cache, get_report_cache_info, \
+    parse_str_report
+from analysis.src.python.utils.df_utils import read_df
+from analysis.test.python.data_analysis import HYPERSTYLE_SUBMISSIONS_PATH
+
+ISSUES_COLUMN = SubmissionColumns.HYPERSTYLE_ISSUES.value
+
+
+def test_parse_report_once():
+    str_reports = read_df(HYPERSTYLE_SUBMISSIONS_PATH)[ISSUES_COLUMN].tolist()
+    clear_report_cache()
+
+    reports = [parse_str_report(str_report, ISSUES_COLUMN) for str_report in str_reports]
+    # Equal strings which are different objects hit the cache too
+    copied_reports = [parse_str_report(''.join(list(str_report)), ISSUES_COLUMN) for str_report in str_reports]
+
+    assert all(report is copied_report for report, copied_report in zip(reports, copied_reports))
+    cache_info = get_report_cache_info()
+    assert cache_info.misses == len(set(str_reports))
+    assert cache_info.hits == 2 * len(str_reports) - len(set(str_reports))
+    clear_report_cache()
+    assert get_report_cache_info().currsize == 0
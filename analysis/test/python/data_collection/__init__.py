@@ -0,0 +1,3 @@
+from analysis.test.python import TEST_DATA_FOLDER
+
+DATA_COLLECTION_TEST_DATA_FOLDER = TEST_DATA_FOLDER / 'data_collection'
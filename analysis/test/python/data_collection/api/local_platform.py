@@ -0,0 +1,186 @@
+import gzip
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Set
+from urllib.parse import parse_qs, urlparse
+
+from analysis.src.python.data_collection.api.platform_auth import PlatformToken
+from analysis.src.python.data_collection.api.platform_client import PlatformClient
+from analysis.src.python.data_collection.api.platform_objects import BaseRequestParams, Object, ObjectResponse
+
+OBJECT_CLASS = 'number'
+
+
+@dataclass(frozen=True)
+class Number(Object):
+    id: int
+
+
+@dataclass(frozen=True)
+class NumbersResponse(ObjectResponse[Number]):
+    numbers: List[Number]
+
+    def get_objects(self) -> List[Number]:
+        return self.numbers
+
+
+class LocalPlatformHandler(BaseHTTPRequestHandler):
+    """
+    Serves `numbers` objects from 1 to `server.n_objects` page by page like platforms API does.
+    Objects for `/numbers/<id>` are shifted by id * 1000. If `ids` param is given (as comma separated list or
+    repeated `ids[]` param), only these objects are served.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # noqa: N802
+        path = urlparse(self.path)
+        query = parse_qs(path.query)
+        page = int(query.get('page', ['1'])[0])
+        page_size = int(query.get('page_size', ['1000'])[0])
+        obj_id = path.path.split('/')[-1]
+        shift = int(obj_id) * 1000 if obj_id.isdigit() else 0
+
+        with self.server.lock:
+            self.server.connections.add(self.client_address)
+            self.server.requests.append((path.path, {
+                # Repeated params are kept as list
+                key: values if key.endswith('[]') else values[0] for key, values in query.items()
+            }))
+            self.server.headers.append(dict(self.headers))
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.active -= 1
+            failure_status = self.server.failure_statuses.pop(0) if self.server.failure_statuses else None
+
+        if failure_status is not None:
+            self.send_response(failure_status)
+            if self.server.retry_after is not None:
+                self.send_header('Retry-After', self.server.retry_after)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if self.server.valid_tokens is not None and \
+                self.headers.get('Authorization') not in {f'Bearer {token}' for token in self.server.valid_tokens}:
+            self.send_response(401)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if 'ids' in query:
+            all_ids = [int(obj_id) for obj_id in query['ids'][0].split(',')]
+        elif 'ids[]' in query:
+            all_ids = [int(obj_id) for obj_id in query['ids[]']]
+        else:
+            all_ids = [shift + i for i in range(1, self.server.n_objects + 1)]
+            if self.server.newest_first:
+                all_ids.reverse()
+        ids = all_ids[(page - 1) * page_size:page * page_size]
+        body = json.dumps({
+            'meta': {'page': page, 'has-next': page * page_size < len(all_ids), 'has-previous': page > 1},
+            'numbers': [{'id': obj_id} for obj_id in ids],
+        }).encode()
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # noqa: N802
+        """ Issue new token for any token request. """
+
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0))).decode()
+        with self.server.lock:
+            self.server.token_requests.append(parse_qs(body)['grant_type'][0])
+            token = f'token-{len(self.server.token_requests)}'
+            if self.server.valid_tokens is not None:
+                self.server.valid_tokens.add(token)
+
+        body = json.dumps({
+            'access_token': token,
+            'expires_in': self.server.token_expires_in,
+            'refresh_token': f'refresh-{token}',
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalPlatformServer(ThreadingHTTPServer):
+    """ Stand-in for educational platform, which records requests and client connections. """
+
+    def __init__(self, n_objects: int, delay: float = 0,
+                 failure_statuses: Optional[List[int]] = None, retry_after: Optional[str] = None,
+                 newest_first: bool = False, check_tokens: bool = False, token_expires_in: int = 3600):
+        super().__init__(('localhost', 0), LocalPlatformHandler)
+        self.n_objects = n_objects
+        self.delay = delay
+        # Statuses of the first responses, which are returned instead of objects
+        self.failure_statuses = list(failure_statuses or [])
+        self.retry_after = retry_after
+        self.newest_first = newest_first
+        # Tokens issued by token requests, requests with other tokens are rejected if tokens are checked
+        self.valid_tokens: Optional[Set[str]] = set() if check_tokens else None
+        self.token_expires_in = token_expires_in
+        self.token_requests: List[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.connections = set()
+        self.requests = []
+        self.headers: List[Dict[str, str]] = []
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return f'http://localhost:{self.server_address[1]}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        self.server_close()
+
+
+class LocalPlatformClient(PlatformClient):
+    """ Client for local platform stand-in, which does not run interactive authorization. """
+
+    def __init__(self, host: str, token: Optional[str] = None, page_size: int = 1000, **kwargs):
+        self.local_token = token
+        self.page_size = page_size
+        super().__init__(host, 'client_id', 'client_secret', 0, **kwargs)
+
+    def _get_authentication_code_token(self) -> Optional[PlatformToken]:
+        return PlatformToken(self.local_token) if self.local_token is not None else None
+
+    def get_numbers(self, ids: Optional[List[int]] = None,
+                    count: Optional[int] = None,
+                    page_size: int = 1000) -> List[Number]:
+        return list(self._get_objects(OBJECT_CLASS, NumbersResponse, BaseRequestParams(page_size=page_size, ids=ids),
+                                      count=count))
+
+    def get_numbers_by_ids(self, ids: List[int], count: Optional[int] = None, page_size: int = 1000) -> List[Number]:
+        return list(self._get_objects_by_ids(OBJECT_CLASS, ids, NumbersResponse,
+                                             BaseRequestParams(page_size=page_size), count=count))
+
+    def get_objects(self, obj: str, ids: Optional[List[int]] = None, count: Optional[int] = None) -> Iterator[Number]:
+        return self._get_objects(OBJECT_CLASS, NumbersResponse, BaseRequestParams(page_size=self.page_size, ids=ids),
+                                 count=count)
@@ -0,0 +1,60 @@
+import time
+
+from analysis.src.python.data_collection.api.platform_auth import AuthMode, PlatformToken
+from analysis.src.python.data_collection.api.token_cache import TokenCache
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_collection import DATA_COLLECTION_TEST_DATA_FOLDER
+from analysis.test.python.data_collection.api.local_platform import LocalPlatformClient, LocalPlatformServer
+
+TOKENS_DIR_PATH = DATA_COLLECTION_TEST_DATA_FOLDER / 'tokens'
+TOKEN_CACHE_PATH = TOKENS_DIR_PATH / 'tokens.json'
+
+
+def test_share_cached_token():
+    create_directory(TOKENS_DIR_PATH, clear=True)
+    token_cache = TokenCache(TOKEN_CACHE_PATH)
+
+    with LocalPlatformServer(n_objects=5, check_tokens=True) as server:
+        for _ in range(3):
+            with LocalPlatformClient(server.host, auth_mode=AuthMode.CLIENT_CREDENTIALS,
+                                     token_cache=token_cache) as client:
+                assert len(client.get_numbers()) == 5
+        cached_token = token_cache.get(server.host, 'client_id')
+
+    remove_directory(TOKENS_DIR_PATH)
+
+    assert server.token_requests == ['client_credentials']
+    assert [headers['Authorization'] for headers in server.headers] == ['Bearer token-1'] * 3
+    assert cached_token.access_token == 'token-1'
+    assert cached_token.refresh_token == 'refresh-token-1'
+
+
+def test_refresh_expired_token():
+    create_directory(TOKENS_DIR_PATH, clear=True)
+    token_cache = TokenCache(TOKEN_CACHE_PATH)
+
+    # Tokens expire in 10 seconds, which is less than expiration margin
+    with LocalPlatformServer(n_objects=20, check_tokens=True, token_expires_in=10) as server:
+        token_cache.put(server.host, 'client_id', PlatformToken('token-0', time.time() - 1, 'refresh-token-0'))
+        with LocalPlatformClient(server.host, auth_mode=AuthMode.CLIENT_CREDENTIALS,
+                                 token_cache=token_cache) as client:
+            assert len(client.get_numbers(page_size=10)) == 20
+
+    remove_directory(TOKENS_DIR_PATH)
+
+    # Expired token is refreshed on start and before every request
+    assert server.token_requests == ['refresh_token'] * 3
+    assert [headers['Authorization'] for headers in server.headers] == ['Bearer token-2', 'Bearer token-3']
+
+
+def test_renew_rejected_token():
+    with LocalPlatformServer(n_objects=20, check_tokens=True) as server:
+        with LocalPlatformClient(server.host, auth_mode=AuthMode.CLIENT_CREDENTIALS) as client:
+            assert len(client.get_numbers(page_size=10)) == 20
+            # Token is revoked by platform
+            server.valid_tokens.clear()
+            assert len(client.get_numbers(page_size=10)) == 20
+
+    assert server.token_requests == ['client_credentials', 'refresh_token']
+    assert [headers['Authorization'] for headers in server.headers] == \
+           ['Bearer token-1', 'Bearer token-1', 'Bearer token-1', 'Bearer token-2', 'Bearer token-2']
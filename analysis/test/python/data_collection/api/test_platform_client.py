@@ -0,0 +1,198 @@
+import json
+import math
+import time
+from typing import List, Optional
+
+import pytest
+import requests
+
+from analysis.src.python.data_collection.api.crawl_metrics import get_percentile
+from analysis.src.python.data_collection.api.platform_client import parse_retry_after, split_ids_to_batches
+from analysis.src.python.data_collection.api.rate_limiter import RateLimiter
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_collection import DATA_COLLECTION_TEST_DATA_FOLDER
+from analysis.test.python.data_collection.api.local_platform import LocalPlatformClient, LocalPlatformServer
+
+
+def test_connection_reused_between_pages():
+    with LocalPlatformServer(n_objects=50) as server, LocalPlatformClient(server.host) as client:
+        numbers = client.get_numbers(page_size=10)
+
+    assert [number.id for number in numbers] == list(range(1, 51))
+    assert len(server.requests) == 5
+    assert len(server.connections) == 1
+
+
+def test_session_headers():
+    with LocalPlatformServer(n_objects=5) as server, LocalPlatformClient(server.host, token='token') as client:
+        numbers = client.get_numbers()
+
+    assert len(numbers) == 5
+    assert server.headers[0]['Authorization'] == 'Bearer token'
+    assert 'gzip' in server.headers[0]['Accept-Encoding']
+
+
+def test_timeout():
+    with LocalPlatformServer(n_objects=5) as server, LocalPlatformClient(server.host, timeout=5) as client:
+        assert client.timeout == 5
+        assert len(client.get_numbers()) == 5
+
+
+FETCH_DATA = [
+    (1, None, 10, list(range(1, 36))),
+    (4, None, 10, list(range(1, 36))),
+    (4, 12, 5, list(range(1, 13))),
+    (4, 100, 5, list(range(1, 36))),
+    (8, 35, 7, list(range(1, 36))),
+]
+
+
+@pytest.mark.parametrize(('n_workers', 'count', 'page_size', 'expected_ids'), FETCH_DATA)
+def test_prefetch_pages(n_workers: int, count: Optional[int], page_size: int, expected_ids: List[int]):
+    with LocalPlatformServer(n_objects=35) as server, LocalPlatformClient(server.host, n_workers=n_workers) as client:
+        numbers = client.get_numbers(count=count, page_size=page_size)
+
+    assert [number.id for number in numbers] == expected_ids
+    # Only pages in the prefetch window after the last one are requested in vain
+    assert len(server.requests) < math.ceil(35 / page_size) + n_workers
+
+
+FETCH_BY_IDS_DATA = [
+    (1, None, [3, 1, 2]),
+    (3, None, [3, 1, 2]),
+    (3, 25, [3, 1, 2]),
+    (2, 10, [5, 4, 3, 2, 1]),
+]
+
+
+@pytest.mark.parametrize(('n_workers', 'count', 'ids'), FETCH_BY_IDS_DATA)
+def test_fetch_by_ids(n_workers: int, count: Optional[int], ids: List[int]):
+    with LocalPlatformServer(n_objects=10, delay=0.05) as server, \
+            LocalPlatformClient(server.host, n_workers=n_workers) as client:
+        numbers = client.get_numbers_by_ids(ids, count=count, page_size=4)
+
+    expected_ids = [obj_id * 1000 + i for obj_id in ids for i in range(1, 11)]
+    assert [number.id for number in numbers] == expected_ids[:count]
+    assert server.max_active <= n_workers
+    if n_workers > 1:
+        assert server.max_active > 1
+
+
+SPLIT_IDS_DATA = [
+    ([], 3, 100, []),
+    ([1, 2, 3, 4, 5, 6, 7], 3, 100, [[1, 2, 3], [4, 5, 6], [7]]),
+    ([1, 22, 333, 4444, 5], 10, 6, [[1, 22], [333], [4444, 5]]),
+    ([123456789], 10, 5, [[123456789]]),
+]
+
+
+@pytest.mark.parametrize(('ids', 'batch_size', 'max_length', 'expected_batches'), SPLIT_IDS_DATA)
+def test_split_ids_to_batches(ids: List[int], batch_size: int, max_length: int, expected_batches: List[List[int]]):
+    batches = split_ids_to_batches(ids, batch_size, max_length)
+
+    assert batches == expected_batches
+    assert all(len(','.join(map(str, batch))) <= max_length for batch in batches if len(batch) > 1)
+
+
+@pytest.mark.parametrize(('n_workers', 'count'), [(1, None), (3, None), (3, 45)])
+def test_fetch_ids_by_batches(n_workers: int, count: Optional[int]):
+    ids = list(range(100, 200))
+    with LocalPlatformServer(n_objects=0) as server, LocalPlatformClient(server.host, n_workers=n_workers) as client:
+        numbers = client.get_numbers(ids=ids, count=count, page_size=20)
+
+    assert [number.id for number in numbers] == ids[:count]
+    assert len(server.requests) <= 5
+    assert all(len(params['ids'].split(',')) <= 20 for _, params in server.requests)
+
+
+RETRY_DATA = [
+    ([503, 500], 2, 10, None),
+    ([429], 1, 10, '0'),
+]
+
+
+@pytest.mark.parametrize(('failure_statuses', 'n_retries', 'expected_count', 'retry_after'), RETRY_DATA)
+def test_retry_failed_requests(failure_statuses: List[int], n_retries: int, expected_count: int,
+                               retry_after: Optional[str]):
+    with LocalPlatformServer(n_objects=10, failure_statuses=failure_statuses, retry_after=retry_after) as server, \
+            LocalPlatformClient(server.host, n_retries=n_retries, backoff=0.01) as client:
+        numbers = client.get_numbers()
+
+    assert len(numbers) == expected_count
+    assert len(server.requests) == len(failure_statuses) + 1
+    for status in set(failure_statuses):
+        assert client.metrics.statuses[str(status)] == failure_statuses.count(status)
+
+
+def test_raise_after_last_retry():
+    with LocalPlatformServer(n_objects=10, failure_statuses=[502, 502, 502]) as server, \
+            LocalPlatformClient(server.host, n_retries=2, backoff=0.01) as client:
+        # Failed page is not taken as the end of listing
+        with pytest.raises(requests.HTTPError):
+            client.get_numbers()
+
+    assert len(server.requests) == 3
+    assert client.metrics.statuses == {'502': 3}
+
+
+def test_retry_after_pauses_requests():
+    with LocalPlatformServer(n_objects=10, failure_statuses=[429], retry_after='0.3') as server, \
+            LocalPlatformClient(server.host, backoff=0.01) as client:
+        start_time = time.monotonic()
+        numbers = client.get_numbers()
+
+    assert len(numbers) == 10
+    assert time.monotonic() - start_time >= 0.3
+    assert client.metrics.statuses == {'429': 1, '200': 1}
+
+
+@pytest.mark.parametrize(('value', 'expected_delay'), [(None, None), ('2', 2), ('-1', 0), ('soon', None)])
+def test_parse_retry_after(value: Optional[str], expected_delay: Optional[float]):
+    assert parse_retry_after(value) == expected_delay
+
+
+def test_rate_limiter():
+    rate_limiter = RateLimiter(rate=20)
+    start_time = time.monotonic()
+    for _ in range(30):
+        rate_limiter.acquire()
+
+    # The first 20 requests are a burst, the next 10 are limited by rate
+    assert time.monotonic() - start_time >= 0.45
+
+    rate_limiter.slow_down()
+    assert rate_limiter.rate == 10
+    rate_limiter.speed_up()
+    assert rate_limiter.rate == 11
+
+
+@pytest.mark.parametrize(('values', 'percentile', 'expected_value'),
+                         [([], 50, None), ([1], 99, 1), ([1, 2, 3, 4], 50, 2), ([1, 2, 3, 4], 90, 4)])
+def test_get_percentile(values: List[float], percentile: float, expected_value: Optional[float]):
+    assert get_percentile(values, percentile) == expected_value
+
+
+def test_dump_metrics():
+    metrics_dir_path = create_directory(DATA_COLLECTION_TEST_DATA_FOLDER / 'metrics', clear=True)
+    metrics_path = metrics_dir_path / 'metrics.json'
+
+    with LocalPlatformServer(n_objects=25, failure_statuses=[503], delay=0.01) as server, \
+            LocalPlatformClient(server.host, backoff=0.01, metrics_path=str(metrics_path)) as client:
+        client.metrics.set_expected_objects(50)
+        numbers = client.get_numbers(page_size=10)
+
+    with open(metrics_path) as metrics_file:
+        metrics = json.load(metrics_file)
+    remove_directory(metrics_dir_path)
+
+    assert len(numbers) == 25
+    assert metrics['requests'] == 4
+    assert metrics['retries'] == 1
+    assert metrics['statuses'] == {'200': 3, '503': 1}
+    assert metrics['pages'] == 3
+    assert metrics['objects'] == 25
+    assert metrics['bytes'] > 0
+    assert metrics['latency_p50_ms'] >= 10
+    assert metrics['latency_max_ms'] >= metrics['latency_p99_ms'] >= metrics['latency_p50_ms']
+    # Half of expected objects is collected, so the rest takes about the same time
+    assert metrics['eta_seconds'] == pytest.approx(metrics['elapsed_seconds'], rel=0.1)
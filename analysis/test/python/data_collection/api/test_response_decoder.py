@@ -0,0 +1,71 @@
+import datetime
+
+import pytest
+
+from analysis.src.python.data_collection.api.response_decoder import get_response_decoder
+from analysis.src.python.data_collection.api.response_decoder_benchmark import create_sample, create_sample_page, \
+    decode_with_dacite, RESPONSE_TYPES
+from analysis.src.python.data_collection.hyperskill.api.submissions import Feedback, Submission, SubmissionResponse
+from analysis.test.python.data_collection.api.local_platform import LocalPlatformClient, LocalPlatformServer
+
+
+@pytest.mark.parametrize('response', RESPONSE_TYPES.keys())
+def test_decode_as_dacite(response: str):
+    response_type = RESPONSE_TYPES[response]
+    data = create_sample_page(response_type, page_size=3)
+
+    assert get_response_decoder(response_type)(data) == decode_with_dacite(response_type, data)
+
+
+def test_decode_submission():
+    submission = create_sample(Submission, index=5)
+    submission['time'] = '2021-07-12T07:00:01.5Z'
+    # Optional fields can be missing, keys can be in kebab case
+    del submission['reply']
+    submission['next-free-test-available-at'] = submission.pop('next_free_test_available_at')
+    feedback = submission['feedback']
+    text_submission = dict(submission, id=6, feedback='Wrong answer')
+
+    response = get_response_decoder(SubmissionResponse)({
+        'meta': {'page': 1, 'has-next': False, 'has-previous': False},
+        'submissions': [submission, text_submission],
+    })
+
+    decoded, text_decoded = response.get_objects()
+    assert not response.meta.has_next
+    assert decoded.id == 5
+    assert decoded.url.endswith('/submissions/5')
+    assert decoded.reply is None
+    assert decoded.time == datetime.datetime(2021, 7, 12, 7, 0, 1, 500000)
+    assert decoded.next_free_test_available_at == datetime.datetime(2021, 7, 12, 7, 0, 0)
+    assert decoded.feedback == Feedback(feedback['message'], decoded.feedback.code_style)
+    assert text_decoded.feedback == 'Wrong answer'
+
+
+def test_decode_only_fields():
+    data = create_sample_page(SubmissionResponse, page_size=2)
+
+    submissions = get_response_decoder(SubmissionResponse, only_fields=frozenset(['step', 'time']))(data)
+
+    assert [submission.id for submission in submissions.get_objects()] == [1, 2]
+    assert submissions.get_objects()[0].step == 1
+    assert submissions.get_objects()[0].time == datetime.datetime(2021, 7, 12, 7, 0, 0)
+    assert submissions.get_objects()[0].reply is None
+
+
+def test_decode_raw():
+    data = create_sample_page(SubmissionResponse, page_size=2)
+
+    submissions = get_response_decoder(SubmissionResponse, raw=True)(data)
+    filtered_submissions = get_response_decoder(SubmissionResponse, raw=True, only_fields=frozenset(['step']))(data)
+
+    assert submissions.meta.has_next
+    assert submissions.get_objects() == data['submissions']
+    assert filtered_submissions.get_objects() == [{'id': 1, 'step': 1}, {'id': 2, 'step': 1}]
+
+
+def test_fetch_raw_objects():
+    with LocalPlatformServer(n_objects=15) as server, LocalPlatformClient(server.host, raw=True) as client:
+        numbers = client.get_numbers(page_size=10)
+
+    assert numbers == [{'id': obj_id} for obj_id in range(1, 16)]
@@ -0,0 +1,40 @@
+from typing import List, Optional
+
+from analysis.src.python.data_collection.api.platform_client import MAX_IDS_LENGTH
+from analysis.src.python.data_collection.api.platform_objects import BaseRequestParams
+from analysis.src.python.data_collection.stepik.stepik_client import StepikClient
+from analysis.test.python.data_collection.api.local_platform import LocalPlatformServer, Number, NumbersResponse, \
+    OBJECT_CLASS
+
+
+class LocalStepikClient(StepikClient):
+    """ Stepik client, which sends requests to local platform stand-in and does not run authorization. """
+
+    def __init__(self, host: str, **kwargs):
+        super().__init__(**kwargs)
+        self.host = host
+
+    def _get_authentication_code_token(self) -> Optional[str]:
+        return None
+
+    def get_numbers(self, ids: List[int], page_size: int = 1000) -> List[Number]:
+        return list(self._get_objects(OBJECT_CLASS, NumbersResponse, BaseRequestParams(page_size=page_size, ids=ids)))
+
+
+def test_ids_param_format():
+    with LocalPlatformServer(n_objects=0) as server, LocalStepikClient(server.host) as client:
+        numbers = client.get_numbers(ids=[3, 1, 2])
+
+    assert [number.id for number in numbers] == [3, 1, 2]
+    assert server.requests == [('/api/numbers', {'ids[]': ['3', '1', '2'], 'page': '1', 'page_size': '1000'})]
+
+
+def test_ids_batches_fit_url():
+    ids = list(range(100000, 101000))
+    with LocalPlatformServer(n_objects=0) as server, LocalStepikClient(server.host) as client:
+        numbers = client.get_numbers(ids=ids)
+
+    assert [number.id for number in numbers] == ids
+    assert len(server.requests) > 1
+    # Ids are separated by `&ids[]=` with url encoded brackets
+    assert all(len('&ids%5B%5D='.join(params['ids[]'])) <= MAX_IDS_LENGTH for _, params in server.requests)
@@ -0,0 +1,77 @@
+import json
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from analysis.src.python.data_collection.api.platform_client import PlatformClient
+from analysis.src.python.data_collection.run_sharded_collection import collect_shards, merge_shards, \
+    SHARD_METRICS_FILE, split_to_shards
+from analysis.src.python.data_collection.utils.object_writers import OUTPUT_EXTENSIONS
+from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_collection import DATA_COLLECTION_TEST_DATA_FOLDER
+from analysis.test.python.data_collection.api.local_platform import LocalPlatformClient, LocalPlatformServer, \
+    OBJECT_CLASS
+
+SHARDS_DIR_PATH = DATA_COLLECTION_TEST_DATA_FOLDER / 'sharded_collection'
+
+
+def read_json(path: Path) -> dict:
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def create_unavailable_client() -> PlatformClient:
+    raise ConnectionError('Platform is not available')
+
+
+def test_split_to_shards():
+    shards = split_to_shards(list(range(1, 8)), shard_size=3)
+
+    assert [shard.index for shard in shards] == [0, 1, 2]
+    assert [shard.ids for shard in shards] == [[1, 2, 3], [4, 5, 6], [7]]
+
+
+@pytest.mark.parametrize('extension', OUTPUT_EXTENSIONS)
+def test_collect_shards(extension):
+    create_directory(SHARDS_DIR_PATH, clear=True)
+    shards = split_to_shards(list(range(1, 31)), shard_size=4)
+
+    with LocalPlatformServer(n_objects=30) as server:
+        create_client = partial(LocalPlatformClient, server.host, page_size=10)
+        failed_shards = collect_shards(create_client, OBJECT_CLASS, shards, SHARDS_DIR_PATH, 3, extension)
+        # Ids of every shard are requested by its own process
+        requested_ids = sorted(params['ids'] for _, params in server.requests)
+
+    merged_path = merge_shards(OBJECT_CLASS, shards, SHARDS_DIR_PATH, extension)
+    df_numbers = read_df(merged_path)
+    shards_objects = [read_json(SHARDS_DIR_PATH / 'shards' / f'shard_{shard.index}' / SHARD_METRICS_FILE)['objects']
+                      for shard in shards]
+    remove_directory(SHARDS_DIR_PATH)
+
+    assert failed_shards == []
+    assert shards_objects == [len(shard.ids) for shard in shards]
+    assert requested_ids == sorted(','.join(map(str, shard.ids)) for shard in shards)
+    assert df_numbers['id'].tolist() == list(range(1, 31))
+
+
+def test_resume_collection():
+    create_directory(SHARDS_DIR_PATH, clear=True)
+    shards = split_to_shards(list(range(1, 21)), shard_size=5)
+
+    with LocalPlatformServer(n_objects=20) as server:
+        create_client = partial(LocalPlatformClient, server.host, page_size=10)
+        # Shards of the interrupted run are not marked as done
+        assert collect_shards(create_unavailable_client, OBJECT_CLASS, shards[2:], SHARDS_DIR_PATH, 2) == [2, 3]
+        assert collect_shards(create_client, OBJECT_CLASS, shards[:2], SHARDS_DIR_PATH, 2) == []
+        assert len(server.requests) == 2
+
+        # Only failed shards are collected again
+        assert collect_shards(create_client, OBJECT_CLASS, shards, SHARDS_DIR_PATH, 2) == []
+        assert len(server.requests) == 4
+
+    df_numbers = read_df(merge_shards(OBJECT_CLASS, shards, SHARDS_DIR_PATH))
+    remove_directory(SHARDS_DIR_PATH)
+
+    assert df_numbers['id'].tolist() == list(range(1, 21))
@@ -0,0 +1,91 @@
+from typing import List, Optional
+
+from analysis.src.python.data_collection.api.platform_client import get_listing_key
+from analysis.src.python.data_collection.api.platform_objects import BaseRequestParams
+from analysis.src.python.data_collection.run_data_collection import collect_objects
+from analysis.src.python.data_collection.utils.object_store import ObjectStore
+from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_collection import DATA_COLLECTION_TEST_DATA_FOLDER
+from analysis.test.python.data_collection.api.local_platform import LocalPlatformClient, LocalPlatformServer, Number, \
+    OBJECT_CLASS
+
+STORE_DIR_PATH = DATA_COLLECTION_TEST_DATA_FOLDER / 'object_store'
+STORE_PATH = STORE_DIR_PATH / 'store.sqlite'
+
+
+LISTING = get_listing_key(BaseRequestParams())
+OTHER_LISTING = get_listing_key(BaseRequestParams(), obj_id=1)
+
+
+def test_put_objects():
+    create_directory(STORE_DIR_PATH, clear=True)
+
+    with ObjectStore(STORE_PATH) as store:
+        assert store.get_watermark(OBJECT_CLASS, LISTING) is None
+        assert store.put(OBJECT_CLASS, [Number(3), Number(1)]) == (2, 0)
+        assert store.put(OBJECT_CLASS, [Number(1), Number(2)]) == (1, 0)
+        assert store.get_new_ids(OBJECT_CLASS, [4, 3, 5]) == [4, 5]
+        store.set_watermark(OBJECT_CLASS, LISTING, 3)
+        store.set_watermark(OBJECT_CLASS, LISTING, 2)
+        # Marks are changed for the next runs only
+        assert store.get_watermark(OBJECT_CLASS, LISTING) is None
+
+    with ObjectStore(STORE_PATH) as store:
+        assert store.get_watermark(OBJECT_CLASS, LISTING) == 3
+        assert store.get_watermark(OBJECT_CLASS, OTHER_LISTING) is None
+        assert list(store.get_objects(OBJECT_CLASS)) == [{'id': 1}, {'id': 2}, {'id': 3}]
+        assert list(store.get_objects(OBJECT_CLASS, [3, 1, 4])) == [{'id': 1}, {'id': 3}]
+        assert store.is_known_page(OBJECT_CLASS, LISTING, [Number(3), Number(2)])
+        assert not store.is_known_page(OBJECT_CLASS, LISTING, [Number(4), Number(3)])
+        assert not store.is_known_page(OBJECT_CLASS, OTHER_LISTING, [Number(3), Number(2)])
+
+    remove_directory(STORE_DIR_PATH)
+
+
+def collect_with_store(server: LocalPlatformServer, ids: Optional[List[int]] = None, count: Optional[int] = None,
+                       refresh: bool = False) -> List[int]:
+    """ Run collection with store and return ids of written objects. """
+
+    server.requests.clear()
+    with ObjectStore(STORE_PATH) as store, LocalPlatformClient(server.host, page_size=10, store=store) as client:
+        collect_objects(client, OBJECT_CLASS, ids, count, STORE_DIR_PATH, store, refresh=refresh)
+    return read_df(STORE_DIR_PATH / f'{OBJECT_CLASS}s.csv')['id'].tolist()
+
+
+def test_collect_only_new_objects():
+    create_directory(STORE_DIR_PATH, clear=True)
+
+    with LocalPlatformServer(n_objects=25, newest_first=True) as server:
+        # Interrupted listing does not mark collected objects
+        assert collect_with_store(server, count=15) == list(range(25, 10, -1))
+        assert len(server.requests) == 2
+
+        assert collect_with_store(server) == list(range(25, 0, -1))
+        assert len(server.requests) == 3
+
+        server.n_objects = 32
+        # The second page contains only collected objects
+        assert collect_with_store(server) == list(range(32, 12, -1))
+        assert len(server.requests) == 2
+
+        # Stored objects are not requested again
+        assert collect_with_store(server, ids=[30, 40, 41]) == [30, 40, 41]
+        assert [params['ids'] for _, params in server.requests] == ['40,41']
+
+        assert collect_with_store(server, ids=[30, 40], refresh=True) == [30, 40]
+        assert [params['ids'] for _, params in server.requests] == ['30,40']
+
+    remove_directory(STORE_DIR_PATH)
+
+
+def test_collect_not_ordered_objects():
+    create_directory(STORE_DIR_PATH, clear=True)
+
+    with LocalPlatformServer(n_objects=25) as server:
+        collect_with_store(server)
+        # Objects are listed from the oldest ones, so all pages are requested again
+        assert collect_with_store(server) == list(range(1, 26))
+        assert len(server.requests) == 3
+
+    remove_directory(STORE_DIR_PATH)
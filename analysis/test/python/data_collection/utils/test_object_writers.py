@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+import pytest
+
+from analysis.src.python.data_collection.api.platform_objects import Object
+from analysis.src.python.data_collection.utils import object_writers
+from analysis.src.python.data_collection.utils.object_writers import create_object_writer, ObjectWriter, \
+    OUTPUT_EXTENSIONS
+from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.data_collection import DATA_COLLECTION_TEST_DATA_FOLDER
+
+WRITERS_DIR_PATH = DATA_COLLECTION_TEST_DATA_FOLDER / 'object_writers'
+OBJECT_CLASS = 'measure'
+
+
+@dataclass(frozen=True)
+class Measure(Object):
+    id: int
+    value: float
+    unit: Optional[str]
+    tags: List[str]
+
+
+def get_measures(n: int) -> Iterator[Measure]:
+    for i in range(1, n + 1):
+        # Values of the same field differ in python type (int or float) and may be missing
+        yield Measure(id=i, value=i if i % 2 else i / 2, unit='m' if i % 3 else None, tags=['a'] * (i % 2))
+
+
+@pytest.mark.parametrize('extension', OUTPUT_EXTENSIONS)
+def test_write_objects(extension, monkeypatch):
+    monkeypatch.setattr(object_writers, 'WRITE_BATCH_SIZE', 2)
+    create_directory(WRITERS_DIR_PATH, clear=True)
+
+    with create_object_writer(WRITERS_DIR_PATH, OBJECT_CLASS, extension) as writer:
+        writer.write(get_measures(5))
+    assert writer.written == 5
+
+    df_measures = read_df(WRITERS_DIR_PATH / f'{OBJECT_CLASS}s{extension.value}')
+    remove_directory(WRITERS_DIR_PATH)
+
+    assert df_measures['id'].tolist() == [1, 2, 3, 4, 5]
+    assert df_measures['value'].tolist() == [1.0, 1.0, 3.0, 2.0, 5.0]
+    assert df_measures['unit'].isna().tolist() == [False, False, True, False, False]
+    assert df_measures['tags'].astype(str).tolist() == ["['a']", '[]', "['a']", '[]', "['a']"]
+
+
+def test_flush_every_batch(monkeypatch):
+    monkeypatch.setattr(object_writers, 'WRITE_BATCH_SIZE', 2)
+    create_directory(WRITERS_DIR_PATH, clear=True)
+    output_path = WRITERS_DIR_PATH / f'{OBJECT_CLASS}s.csv'
+
+    def get_checked_measures() -> Iterator[Measure]:
+        for measure in get_measures(5):
+            # Objects of all previous batches are already in the file
+            if measure.id > 2:
+                assert len(read_df(output_path)) == (measure.id - 1) // 2 * 2
+            yield measure
+
+    with create_object_writer(WRITERS_DIR_PATH, OBJECT_CLASS, OUTPUT_EXTENSIONS[0]) as writer:
+        writer.write(get_checked_measures())
+
+    remove_directory(WRITERS_DIR_PATH)
+
+
+@pytest.mark.parametrize('extension', OUTPUT_EXTENSIONS)
+def test_read_after_partial_collection(extension, monkeypatch):
+    monkeypatch.setattr(object_writers, 'WRITE_BATCH_SIZE', 2)
+    create_directory(WRITERS_DIR_PATH, clear=True)
+
+    def get_failing_measures() -> Iterator[Measure]:
+        yield from get_measures(5)
+        raise ConnectionError('Platform is not available')
+
+    with pytest.raises(ConnectionError):
+        with create_object_writer(WRITERS_DIR_PATH, OBJECT_CLASS, extension) as writer:
+            writer.write(get_failing_measures())
+
+    df_measures = read_df(WRITERS_DIR_PATH / f'{OBJECT_CLASS}s{extension.value}')
+    remove_directory(WRITERS_DIR_PATH)
+
+    # Only the last incomplete batch is lost
+    assert df_measures['id'].tolist() == [1, 2, 3, 4]
+
+
+def test_writer_without_rows_writing():
+    class WriterWithoutRows(ObjectWriter):
+        pass
+
+    with pytest.raises(TypeError):
+        WriterWithoutRows(str(DATA_COLLECTION_TEST_DATA_FOLDER), 'number', OUTPUT_EXTENSIONS[0])
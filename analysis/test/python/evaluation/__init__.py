@@ -14,3 +14,5 @@ INSPECTORS_DIR_PATH = CURRENT_TEST_DATA_FOLDER / 'inspectors'
 ISSUES_STATISTICS_DIR_PATH = CURRENT_TEST_DATA_FOLDER / 'issues_statistics'
 
 TOOLS_DIR_PATH = CURRENT_TEST_DATA_FOLDER / 'tools'
+
+BATCHING_DIR_PATH = CURRENT_TEST_DATA_FOLDER / 'batching'
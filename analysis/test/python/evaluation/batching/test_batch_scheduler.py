@@ -0,0 +1,136 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.evaluation.batching.batch_config import BatchConfig
+from analysis.src.python.evaluation.batching.batch_processing import merge_batch_results, MERGE_EXTENSIONS, \
+    run_batching, split_to_batches, split_to_batches_by_index
+from analysis.src.python.evaluation.batching.batch_scheduler import BatchScheduler, BatchStatus, \
+    BatchStatusStorage, STATUS_FILE_NAME
+from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.extension_utils import AnalysisExtension
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.evaluation import BATCHING_DIR_PATH, TOOLS_DIR_PATH
+
+INPUT_PATH = TOOLS_DIR_PATH / 'hyperstyle' / 'docker_evaluation' / 'in_3.csv'
+
+TMP_DIR_PATH = BATCHING_DIR_PATH / 'tmp'
+
+
+def get_config(fail_times: int) -> BatchConfig:
+    return BatchConfig(project_path=str(BATCHING_DIR_PATH),
+                       script_path='copy_script.py',
+                       script_args=[],
+                       script_flags=[f'--fail-times={fail_times}'])
+
+
+BATCHING_DATA = [
+    (5, 1, 0, 0),
+    (5, 3, 0, 0),
+    (2, 4, 1, 1),
+    (1, 4, 2, 3),
+]
+
+
+@pytest.mark.parametrize(('batch_size', 'n_workers', 'fail_times', 'n_retries'), BATCHING_DATA)
+def test_run_batches(batch_size: int, n_workers: int, fail_times: int, n_retries: int):
+    output_path = create_directory(TMP_DIR_PATH, clear=True)
+    batch_paths = split_to_batches(str(INPUT_PATH), str(output_path), batch_size)
+    status_storage = BatchStatusStorage(output_path / STATUS_FILE_NAME, batch_size)
+
+    scheduler = BatchScheduler(get_config(fail_times), status_storage, n_workers=n_workers, n_retries=n_retries)
+    assert scheduler.run(batch_paths)
+
+    statuses = BatchStatusStorage(output_path / STATUS_FILE_NAME, batch_size)
+    assert all(statuses.get(batch.index) == BatchStatus.DONE for batch in batch_paths)
+
+    merge_batch_results(batch_paths, str(output_path))
+    pd.testing.assert_frame_equal(read_df(output_path / INPUT_PATH.name), read_df(INPUT_PATH))
+
+    remove_directory(TMP_DIR_PATH)
+
+
+def test_resume_failed_batches():
+    batch_size = 5
+    output_path = create_directory(TMP_DIR_PATH, clear=True)
+    batch_paths = split_to_batches(str(INPUT_PATH), str(output_path), batch_size)
+
+    status_storage = BatchStatusStorage(output_path / STATUS_FILE_NAME, batch_size)
+    assert not BatchScheduler(get_config(fail_times=1), status_storage, n_workers=2).run(batch_paths[:2])
+    assert BatchScheduler(get_config(fail_times=0), status_storage, n_workers=2).run(batch_paths[2:])
+
+    status_storage = BatchStatusStorage(output_path / STATUS_FILE_NAME, batch_size)
+    assert [status_storage.get(batch.index) for batch in batch_paths] == \
+           [BatchStatus.FAILED, BatchStatus.FAILED, BatchStatus.DONE]
+
+    # Failed batches succeed on the second attempt, done batch is not restarted
+    scheduler = BatchScheduler(get_config(fail_times=1), status_storage, n_workers=2)
+    assert scheduler.run(batch_paths)
+    assert (output_path / 'output' / 'batch_2' / 'attempts').read_text() == '1'
+
+    # Statuses of other batch size are ignored
+    assert BatchStatusStorage(output_path / STATUS_FILE_NAME, batch_size + 1).get(0) == BatchStatus.PENDING
+
+    remove_directory(TMP_DIR_PATH)
+
+
+@pytest.mark.parametrize('merge_extension', MERGE_EXTENSIONS)
+def test_merge_batch_results(merge_extension: AnalysisExtension):
+    output_path = create_directory(TMP_DIR_PATH, clear=True)
+    batch_paths = split_to_batches(str(INPUT_PATH), str(output_path), 5)
+    status_storage = BatchStatusStorage(output_path / STATUS_FILE_NAME, 5)
+    BatchScheduler(get_config(fail_times=0), status_storage, n_workers=3).run(batch_paths)
+
+    merge_batch_results(batch_paths, str(output_path), merge_extension)
+
+    merged_path = (output_path / INPUT_PATH.name).with_suffix(merge_extension.value)
+    if merge_extension == AnalysisExtension.CSV:
+        merged_df = read_df(merged_path)
+    elif merge_extension == AnalysisExtension.PARQUET:
+        merged_df = pd.read_parquet(merged_path)
+    else:
+        merged_df = pd.read_feather(merged_path)
+    # Arrow formats keep inferred column types (e.x. timestamps), so only not converted columns are compared
+    columns = [SubmissionColumns.ID.value, SubmissionColumns.LANG.value, SubmissionColumns.CODE.value]
+    pd.testing.assert_frame_equal(merged_df[columns], read_df(INPUT_PATH)[columns], check_dtype=False)
+
+    remove_directory(TMP_DIR_PATH)
+
+
+@pytest.mark.parametrize('batch_size', [1, 5, 20])
+def test_run_batches_by_index(batch_size: int):
+    output_path = create_directory(TMP_DIR_PATH, clear=True)
+    batches = split_to_batches_by_index(str(INPUT_PATH), str(output_path), batch_size)
+    assert not (output_path / 'input').exists()
+
+    config = BatchConfig(project_path=str(BATCHING_DIR_PATH),
+                         script_path='slice_script.py',
+                         script_args=[],
+                         script_flags=[])
+    status_storage = BatchStatusStorage(output_path / STATUS_FILE_NAME, batch_size)
+    assert BatchScheduler(config, status_storage, n_workers=2).run(batches)
+
+    merge_batch_results(batches, str(output_path))
+    pd.testing.assert_frame_equal(read_df(output_path / INPUT_PATH.name), read_df(INPUT_PATH))
+
+    remove_directory(TMP_DIR_PATH)
+
+
+def test_exit_code_of_failed_batching(monkeypatch):
+    output_path = create_directory(TMP_DIR_PATH, clear=True)
+    config_path = output_path / 'config.yaml'
+    config_path.write_text(f'project_path: {BATCHING_DIR_PATH}\n'
+                           f'script_path: copy_script.py\n'
+                           f'script_flags:\n'
+                           f'  fail-times: 1\n')
+
+    monkeypatch.setattr(sys, 'argv', ['batch_processing.py', str(INPUT_PATH), str(output_path), str(config_path),
+                                      '--batch-size=5'])
+    with pytest.raises(SystemExit) as exit_info:
+        run_batching()
+    assert exit_info.value.code == 1
+    assert not (output_path / INPUT_PATH.name).exists()
+
+    remove_directory(TMP_DIR_PATH)
@@ -1,9 +1,16 @@
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
+import pandas as pd
+from hyperstyle.src.python.review.application_config import LanguageVersion
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
 from analysis.src.python.evaluation.tools.hyperstyle.evaluation_config import HYPERSTYLE_DOCKER_PATH, \
     HYPERSTYLE_TOOL_PATH, HyperstyleEvaluationConfig
+from analysis.src.python.evaluation.tools.model.evaluation_config import EvaluationConfig
 from analysis.src.python.evaluation.tools.qodana.evaluation_config import QodanaEvaluationConfig
+from analysis.src.python.evaluation.tools.utils.executors import Executor
+from analysis.src.python.evaluation.tools.utils.saving_utils import get_solution_id_by_file_path
 from analysis.test.python.evaluation.tools import TMP_DIR_PATH
 
 
@@ -25,3 +32,49 @@ def get_default_qodana_config(tmp_path: Path = TMP_DIR_PATH,
                               with_custom_profile: bool = False) -> QodanaEvaluationConfig:
     return QodanaEvaluationConfig(tmp_path=tmp_path,
                                   with_custom_profile=with_custom_profile)
+
+
+LOCAL_RESULT_COLUMN = 'code_length'
+
+
+class LocalEvaluationConfig(EvaluationConfig):
+    """ Stand-in for docker based tools: copies solutions to the output directory instead of analysing them. """
+
+    def __init__(self,
+                 tmp_path: Path = TMP_DIR_PATH,
+                 n_workers: int = 1,
+                 shard_size: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        super().__init__(tmp_path=tmp_path / 'local',
+                         result_path=Path(),
+                         with_template=False,
+                         n_workers=n_workers,
+                         shard_size=shard_size,
+                         executor=executor)
+
+    def build_command(self,
+                      input_path: Union[Path, str],
+                      output_path: Union[Path, str],
+                      language_version: LanguageVersion) -> List[str]:
+        return ['/bin/bash', '-c', f'cp -r {input_path}/. {output_path}']
+
+
+def parse_local_result(results_path: Path) -> pd.DataFrame:
+    """ Parse results of `LocalEvaluationConfig` run: code length of every solution. """
+
+    results_dict = {
+        SubmissionColumns.ID.value: [],
+        LOCAL_RESULT_COLUMN: [],
+    }
+
+    for solution_file_path in sorted(results_path.glob('solution_*/*')):
+        results_dict[SubmissionColumns.ID.value].append(get_solution_id_by_file_path(str(solution_file_path)))
+        results_dict[LOCAL_RESULT_COLUMN].append(len(solution_file_path.read_text()))
+
+    return pd.DataFrame.from_dict(results_dict)
+
+
+def parse_local_solution_result(results_path: Path) -> pd.Series:
+    """ Parse result of `LocalEvaluationConfig` run for single solution. """
+
+    return parse_local_result(results_path).drop(columns=SubmissionColumns.ID.value).iloc[0]
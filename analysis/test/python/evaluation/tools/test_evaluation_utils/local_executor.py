@@ -0,0 +1,28 @@
+import threading
+from collections import Counter
+from typing import List
+
+from analysis.src.python.evaluation.tools.utils.executors import ContainerPoolExecutor
+
+
+class LocalPoolExecutor(ContainerPoolExecutor):
+    """ Stand-in for docker pool: containers are just names, commands are run locally and counted per container. """
+
+    def __init__(self, n_containers: int = 1):
+        super().__init__(n_containers)
+        self.started = 0
+        self.stopped = 0
+        self.executed = Counter()
+        self.lock = threading.Lock()
+
+    def start_container(self) -> str:
+        self.started += 1
+        return f'container_{self.started}'
+
+    def stop_container(self, container: str):
+        self.stopped += 1
+
+    def build_container_command(self, container: str, command: List[str]) -> List[str]:
+        with self.lock:
+            self.executed[container] += 1
+        return command
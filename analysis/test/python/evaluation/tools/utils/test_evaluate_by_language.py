@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+import pytest
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.evaluation.tools.utils.evaluation_utils import deduplicate_solutions, \
+    evaluate_by_language, evaluate_by_solution, split_to_shards
+from analysis.src.python.utils.df_utils import read_df
+from analysis.test.python.evaluation.tools import HYPERSTYLE_DIR_PATH
+from analysis.test.python.evaluation.tools.test_evaluation_utils.evaluation_configs import LOCAL_RESULT_COLUMN, \
+    LocalEvaluationConfig, parse_local_result, parse_local_solution_result
+
+RESOURCES_PATH = HYPERSTYLE_DIR_PATH / 'docker_evaluation'
+
+SHARDS_DATA = [
+    ('in_3.csv', None, [3, 3, 3, 3]),
+    ('in_3.csv', 2, [2, 1, 2, 1, 2, 1, 2, 1]),
+    ('in_3.csv', 5, [3, 3, 3, 3]),
+    ('in_2.csv', 1, [1, 1, 1, 1, 1]),
+]
+
+
+@pytest.mark.parametrize(('in_file', 'shard_size', 'shard_sizes'), SHARDS_DATA)
+def test_split_to_shards(in_file: str, shard_size: Optional[int], shard_sizes: List[int]):
+    df_solutions = read_df(RESOURCES_PATH / in_file)
+    shards = split_to_shards(df_solutions, shard_size)
+
+    assert [shard.shape[0] for shard in shards] == shard_sizes
+    for shard in shards:
+        assert shard[SubmissionColumns.LANG.value].nunique() == 1
+    assert sorted(id for shard in shards for id in shard[SubmissionColumns.ID.value]) == \
+           sorted(df_solutions[SubmissionColumns.ID.value])
+
+
+EVALUATION_DATA = [
+    ('in_3.csv', 1, None),
+    ('in_3.csv', 4, None),
+    ('in_3.csv', 4, 2),
+    ('in_2.csv', 3, 1),
+]
+
+
+@pytest.mark.parametrize(('in_file', 'n_workers', 'shard_size'), EVALUATION_DATA)
+def test_evaluate_by_language(in_file: Path, n_workers: int, shard_size: Optional[int]):
+    df_solutions = read_df(RESOURCES_PATH / in_file)
+    config = LocalEvaluationConfig(n_workers=n_workers, shard_size=shard_size)
+
+    df_results = evaluate_by_language(df_solutions, config, parse_local_result)
+
+    assert df_results[SubmissionColumns.ID.value].tolist() == df_solutions[SubmissionColumns.ID.value].tolist()
+    assert df_results[LOCAL_RESULT_COLUMN].tolist() == df_solutions[SubmissionColumns.CODE.value].str.len().tolist()
+
+
+def get_solutions_with_duplicates(in_file: str, n_copies: int) -> pd.DataFrame:
+    df_solutions = read_df(RESOURCES_PATH / in_file)
+    copies = []
+    for i in range(n_copies):
+        df_copy = df_solutions.copy()
+        df_copy[SubmissionColumns.ID.value] += i
+        copies.append(df_copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+DEDUPLICATION_DATA = [
+    ('in_3.csv', 1, 12),
+    ('in_3.csv', 3, 12),
+    ('in_2.csv', 2, 5),
+]
+
+
+@pytest.mark.parametrize(('in_file', 'n_copies', 'n_unique'), DEDUPLICATION_DATA)
+def test_deduplicate_solutions(in_file: str, n_copies: int, n_unique: int):
+    df_solutions = get_solutions_with_duplicates(in_file, n_copies)
+
+    df_unique_solutions, representative_ids = deduplicate_solutions(df_solutions)
+
+    assert df_unique_solutions.shape[0] == n_unique
+    assert set(representative_ids) == set(df_unique_solutions[SubmissionColumns.ID.value])
+    representative_codes = df_unique_solutions.set_index(SubmissionColumns.ID.value)[SubmissionColumns.CODE.value]
+    assert representative_codes[representative_ids].tolist() == df_solutions[SubmissionColumns.CODE.value].tolist()
+
+
+@pytest.mark.parametrize(('in_file', 'n_copies', 'n_unique'), DEDUPLICATION_DATA)
+def test_evaluate_with_duplicates(in_file: str, n_copies: int, n_unique: int):
+    df_solutions = get_solutions_with_duplicates(in_file, n_copies)
+    config = LocalEvaluationConfig()
+
+    for df_results in [evaluate_by_language(df_solutions, config, parse_local_result),
+                       evaluate_by_solution(df_solutions, config, parse_local_solution_result)]:
+        assert df_results[SubmissionColumns.ID.value].tolist() == df_solutions[SubmissionColumns.ID.value].tolist()
+        assert df_results[LOCAL_RESULT_COLUMN].tolist() == \
+               df_solutions[SubmissionColumns.CODE.value].str.len().tolist()
@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.evaluation.tools.utils.cache_utils import EvaluationCache, invalidate_cache_versions
+from analysis.src.python.evaluation.tools.utils.evaluation_utils import evaluate_by_language
+from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.evaluation.tools import HYPERSTYLE_DIR_PATH, TMP_DIR_PATH
+from analysis.test.python.evaluation.tools.test_evaluation_utils.evaluation_configs import LOCAL_RESULT_COLUMN, \
+    LocalEvaluationConfig, parse_local_result
+
+RESOURCES_PATH = HYPERSTYLE_DIR_PATH / 'docker_evaluation'
+
+CACHE_PATH = TMP_DIR_PATH / 'cache'
+
+TOOL_VERSION = 'local:1.0'
+
+
+def create_cache(config: LocalEvaluationConfig, tool_version: str = TOOL_VERSION) -> EvaluationCache:
+    return EvaluationCache(CACHE_PATH, config.get_tool_settings(), tool_version)
+
+
+@pytest.mark.parametrize('in_file', ['in_2.csv', 'in_3.csv'])
+def test_evaluate_with_cache(in_file: Path):
+    create_directory(CACHE_PATH, clear=True)
+    df_solutions = read_df(RESOURCES_PATH / in_file)
+    config = LocalEvaluationConfig()
+
+    cache = create_cache(config)
+    df_results = evaluate_by_language(df_solutions, config, parse_local_result, cache)
+    assert (cache.hits, cache.misses) == (0, df_solutions.shape[0])
+
+    cache = create_cache(config)
+    df_cached_results = evaluate_by_language(df_solutions, config, parse_local_result, cache)
+    assert (cache.hits, cache.misses) == (df_solutions.shape[0], 0)
+
+    assert df_cached_results[SubmissionColumns.ID.value].tolist() == df_results[SubmissionColumns.ID.value].tolist()
+    assert df_cached_results[LOCAL_RESULT_COLUMN].tolist() == df_results[LOCAL_RESULT_COLUMN].tolist()
+
+    remove_directory(CACHE_PATH)
+
+
+def test_cache_key():
+    df_solutions = read_df(RESOURCES_PATH / 'in_3.csv')
+    solution = df_solutions.iloc[0]
+    config = LocalEvaluationConfig()
+
+    cache = create_cache(config)
+    other_settings_cache = EvaluationCache(CACHE_PATH, {'with_template': True}, TOOL_VERSION)
+
+    other_id_solution = solution.copy()
+    other_id_solution[SubmissionColumns.ID.value] = -1
+    other_code_solution = solution.copy()
+    other_code_solution[SubmissionColumns.CODE.value] += '\n'
+
+    assert cache.get_key(solution) == cache.get_key(other_id_solution)
+    assert cache.get_key(solution) != cache.get_key(other_code_solution)
+    assert cache.get_key(solution) != other_settings_cache.get_key(solution)
+
+    remove_directory(CACHE_PATH)
+
+
+def test_invalidate_cache_versions():
+    create_directory(CACHE_PATH, clear=True)
+    df_solutions = read_df(RESOURCES_PATH / 'in_3.csv')
+    config = LocalEvaluationConfig()
+
+    evaluate_by_language(df_solutions, config, parse_local_result, create_cache(config))
+    evaluate_by_language(df_solutions, config, parse_local_result, create_cache(config, 'local:2.0'))
+
+    invalidate_cache_versions(CACHE_PATH, [TOOL_VERSION])
+
+    cache = create_cache(config)
+    cache.split_by_cached(df_solutions)
+    assert cache.hits == 0
+
+    cache = create_cache(config, 'local:2.0')
+    cache.split_by_cached(df_solutions)
+    assert cache.misses == 0
+
+    remove_directory(CACHE_PATH)
+
+
+def test_evict():
+    create_directory(CACHE_PATH, clear=True)
+    df_solutions = read_df(RESOURCES_PATH / 'in_3.csv')
+    config = LocalEvaluationConfig()
+
+    cache = create_cache(config)
+    evaluate_by_language(df_solutions, config, parse_local_result, cache)
+
+    entry_size = max(path.stat().st_size for path in CACHE_PATH.glob('*/*/*.json'))
+    cache.max_size = entry_size * 2
+    cache.evict()
+
+    cache = create_cache(config)
+    cache.split_by_cached(df_solutions)
+    assert cache.hits <= 2
+    assert cache.hits + cache.misses == df_solutions.shape[0]
+
+    remove_directory(CACHE_PATH)
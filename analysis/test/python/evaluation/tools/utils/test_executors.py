@@ -0,0 +1,83 @@
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+from hyperstyle.src.python.review.application_config import LanguageVersion
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.evaluation.tools.hyperstyle.evaluation_config import HYPERSTYLE_DOCKER_PATH, \
+    HYPERSTYLE_TOOL_PATH, HyperstyleEvaluationConfig
+from analysis.src.python.evaluation.tools.utils.evaluation_utils import evaluate_by_language, split_to_shards
+from analysis.src.python.evaluation.tools.utils.executors import ContainerPoolExecutor, create_executor, \
+    DockerPoolExecutor, ExecutorType
+from analysis.src.python.utils.df_utils import read_df
+from analysis.test.python.evaluation.tools import HYPERSTYLE_DIR_PATH, TMP_DIR_PATH
+from analysis.test.python.evaluation.tools.test_evaluation_utils.evaluation_configs import LOCAL_RESULT_COLUMN, \
+    LocalEvaluationConfig, parse_local_result
+from analysis.test.python.evaluation.tools.test_evaluation_utils.local_executor import LocalPoolExecutor
+
+RESOURCES_PATH = HYPERSTYLE_DIR_PATH / 'docker_evaluation'
+
+POOL_DATA = [
+    ('in_3.csv', 1, 1, None),
+    ('in_3.csv', 2, 4, 2),
+    ('in_3.csv', 4, 4, 1),
+    ('in_2.csv', 3, 2, None),
+]
+
+
+@pytest.mark.parametrize(('in_file', 'n_containers', 'n_workers', 'shard_size'), POOL_DATA)
+def test_evaluate_in_container_pool(in_file: str, n_containers: int, n_workers: int, shard_size: Optional[int]):
+    df_solutions = read_df(RESOURCES_PATH / in_file)
+    executor = LocalPoolExecutor(n_containers)
+    config = LocalEvaluationConfig(n_workers=n_workers, shard_size=shard_size, executor=executor)
+
+    with executor:
+        df_results = evaluate_by_language(df_solutions, config, parse_local_result)
+
+    assert executor.started == n_containers
+    assert executor.stopped == n_containers
+    assert set(executor.executed.keys()) <= {f'container_{i + 1}' for i in range(n_containers)}
+    assert sum(executor.executed.values()) == len(split_to_shards(df_solutions, shard_size))
+
+    assert df_results[SubmissionColumns.ID.value].tolist() == df_solutions[SubmissionColumns.ID.value].tolist()
+    assert df_results[LOCAL_RESULT_COLUMN].tolist() == df_solutions[SubmissionColumns.CODE.value].str.len().tolist()
+
+
+def test_not_started_pool():
+    with pytest.raises(RuntimeError):
+        LocalPoolExecutor().execute(['true'])
+
+
+def test_pool_without_containers():
+    class PoolWithoutContainers(ContainerPoolExecutor):
+        def build_container_command(self, container: str, command: List[str]) -> List[str]:
+            return command
+
+    # Missing override is found on creation instead of on start
+    with pytest.raises(TypeError):
+        PoolWithoutContainers()
+
+
+@pytest.mark.parametrize('runs_in_container', [False, True])
+def test_hyperstyle_command(runs_in_container: bool):
+    executor = LocalPoolExecutor() if runs_in_container else None
+    config = HyperstyleEvaluationConfig(docker_path=HYPERSTYLE_DOCKER_PATH,
+                                        tool_path=HYPERSTYLE_TOOL_PATH,
+                                        allow_duplicates=False,
+                                        with_all_categories=False,
+                                        new_format=True,
+                                        tmp_path=TMP_DIR_PATH,
+                                        executor=executor)
+
+    command = config.build_command(Path('input'), Path('output'), LanguageVersion.PYTHON_3)
+
+    assert (command[0] == 'docker') != runs_in_container
+
+
+def test_create_executor():
+    assert not create_executor(ExecutorType.SUBPROCESS, None, TMP_DIR_PATH, 1).runs_in_container
+    assert isinstance(create_executor(ExecutorType.DOCKER_POOL, HYPERSTYLE_DOCKER_PATH, TMP_DIR_PATH, 2),
+                      DockerPoolExecutor)
+    with pytest.raises(ValueError):
+        create_executor(ExecutorType.DOCKER_POOL, None, TMP_DIR_PATH, 2)
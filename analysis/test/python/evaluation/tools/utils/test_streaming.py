@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+
+from analysis.src.python.data_analysis.model.column_name import SubmissionColumns
+from analysis.src.python.evaluation.tools.utils.evaluation_utils import evaluate_by_language
+from analysis.src.python.evaluation.tools.utils.streaming_utils import evaluate_in_chunks, EvaluationCheckpoint
+from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.file_utils import create_directory, remove_directory
+from analysis.test.python.evaluation.tools import HYPERSTYLE_DIR_PATH, TMP_DIR_PATH
+from analysis.test.python.evaluation.tools.test_evaluation_utils.evaluation_configs import LOCAL_RESULT_COLUMN, \
+    LocalEvaluationConfig, parse_local_result
+
+RESOURCES_PATH = HYPERSTYLE_DIR_PATH / 'docker_evaluation'
+
+OUTPUT_DIR_PATH = TMP_DIR_PATH / 'streaming'
+
+
+class EvaluationCrash(Exception):
+    pass
+
+
+def evaluate_chunk(df_chunk: pd.DataFrame) -> pd.DataFrame:
+    return evaluate_by_language(df_chunk, LocalEvaluationConfig(), parse_local_result)
+
+
+def crashing_evaluate_chunk(n_chunks: int):
+    evaluated_chunks = []
+
+    def evaluate(df_chunk: pd.DataFrame) -> pd.DataFrame:
+        if len(evaluated_chunks) == n_chunks:
+            raise EvaluationCrash()
+        evaluated_chunks.append(df_chunk)
+        return evaluate_chunk(df_chunk)
+
+    return evaluate
+
+
+def check_results(in_file: str, df_results: pd.DataFrame):
+    df_solutions = read_df(RESOURCES_PATH / in_file)
+
+    assert df_results[SubmissionColumns.ID.value].tolist() == df_solutions[SubmissionColumns.ID.value].tolist()
+    assert df_results[LOCAL_RESULT_COLUMN].tolist() == df_solutions[SubmissionColumns.CODE.value].str.len().tolist()
+
+
+@pytest.mark.parametrize(('in_file', 'chunk_size'), [('in_3.csv', 1), ('in_3.csv', 5), ('in_2.csv', 10)])
+def test_evaluate_in_chunks(in_file: str, chunk_size: int):
+    output_path = create_directory(OUTPUT_DIR_PATH, clear=True) / 'out.csv'
+
+    evaluate_in_chunks(RESOURCES_PATH / in_file, output_path, evaluate_chunk, chunk_size)
+
+    check_results(in_file, read_df(output_path))
+    remove_directory(OUTPUT_DIR_PATH)
+
+
+@pytest.mark.parametrize(('chunk_size', 'n_chunks'), [(1, 0), (2, 3), (5, 2)])
+def test_resume_after_crash(chunk_size: int, n_chunks: int):
+    output_path = create_directory(OUTPUT_DIR_PATH, clear=True) / 'out.csv'
+    solutions_path = RESOURCES_PATH / 'in_3.csv'
+
+    with pytest.raises(EvaluationCrash):
+        evaluate_in_chunks(solutions_path, output_path, crashing_evaluate_chunk(n_chunks), chunk_size)
+
+    evaluated_ids = []
+
+    def recording_evaluate_chunk(df_chunk: pd.DataFrame) -> pd.DataFrame:
+        evaluated_ids.extend(df_chunk[SubmissionColumns.ID.value])
+        return evaluate_chunk(df_chunk)
+
+    evaluate_in_chunks(solutions_path, output_path, recording_evaluate_chunk, chunk_size)
+
+    check_results('in_3.csv', read_df(output_path))
+    assert len(evaluated_ids) == read_df(solutions_path).shape[0] - n_chunks * chunk_size
+    remove_directory(OUTPUT_DIR_PATH)
+
+
+def test_drop_partially_written_chunk():
+    output_path = create_directory(OUTPUT_DIR_PATH, clear=True) / 'out.csv'
+    solutions_path = RESOURCES_PATH / 'in_3.csv'
+
+    with pytest.raises(EvaluationCrash):
+        evaluate_in_chunks(solutions_path, output_path, crashing_evaluate_chunk(2), 3)
+
+    with open(output_path, 'a') as output_file:
+        output_file.write('1,partially,written')
+
+    completed_ids = EvaluationCheckpoint(output_path).restore()
+    assert len(completed_ids) == 6
+    assert read_df(output_path).shape[0] == 6
+
+    evaluate_in_chunks(solutions_path, output_path, evaluate_chunk, 3)
+
+    check_results('in_3.csv', read_df(output_path))
+    remove_directory(OUTPUT_DIR_PATH)
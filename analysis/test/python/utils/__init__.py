@@ -5,3 +5,5 @@ CURRENT_TEST_DATA_FOLDER = TEST_DATA_FOLDER / 'utils'
 DF_UTILS_DATA_FOLDER = CURRENT_TEST_DATA_FOLDER / 'df_utils'
 
 PARALLEL_UTILS_DATA_FOLDER = CURRENT_TEST_DATA_FOLDER / 'parallel_utils'
+
+CSV_UTILS_DATA_FOLDER = CURRENT_TEST_DATA_FOLDER / 'csv_utils'
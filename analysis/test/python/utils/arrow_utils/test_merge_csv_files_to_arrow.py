@@ -0,0 +1,71 @@
+from typing import List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from analysis.src.python.utils.arrow_utils import get_merged_schema, merge_csv_files_to_arrow, unify_types
+from analysis.src.python.utils.file_utils import remove_file
+from analysis.test.python.utils import CSV_UTILS_DATA_FOLDER
+
+MERGE_DATA = [
+    (['in_1.csv'], '.parquet'),
+    (['in_1.csv', 'in_2.csv'], '.parquet'),
+    (['in_2.csv', 'in_1.csv', 'in_3.csv'], '.feather'),
+    (['in_3.csv', 'in_2.csv', 'in_2.csv'], '.feather'),
+]
+
+
+@pytest.mark.parametrize(('in_files', 'extension'), MERGE_DATA)
+def test_merge_csv_files_to_arrow(in_files: List[str], extension: str):
+    in_paths = [CSV_UTILS_DATA_FOLDER / in_file for in_file in in_files]
+    tmp_file_path = CSV_UTILS_DATA_FOLDER / f'tmp{extension}'
+
+    merge_csv_files_to_arrow(in_paths, tmp_file_path)
+    out_df = pd.read_parquet(tmp_file_path) if extension == '.parquet' else pd.read_feather(tmp_file_path)
+    remove_file(tmp_file_path)
+
+    expected_df = pd.concat([pd.read_csv(in_path) for in_path in in_paths], ignore_index=True)
+    pd.testing.assert_frame_equal(out_df, expected_df, check_dtype=False)
+
+
+def test_merge_different_columns():
+    with pytest.raises(ValueError):
+        merge_csv_files_to_arrow([CSV_UTILS_DATA_FOLDER / 'in_1.csv', CSV_UTILS_DATA_FOLDER / 'in_4.csv'],
+                                 CSV_UTILS_DATA_FOLDER / 'tmp.parquet')
+
+
+def test_merge_values_out_of_sample():
+    tmp_csv_path = CSV_UTILS_DATA_FOLDER / 'tmp.csv'
+    tmp_file_path = CSV_UTILS_DATA_FOLDER / 'tmp.parquet'
+    # Types are inferred from the first rows, the last row has float and string values
+    rows = [f'{i},{i},{i}' for i in range(100)] + ['1.5,x,']
+    tmp_csv_path.write_text('\n'.join(['a,b,c'] + rows) + '\n')
+
+    assert get_merged_schema([tmp_csv_path], sample_size=64) == \
+           pa.schema([('a', pa.int64()), ('b', pa.int64()), ('c', pa.int64())])
+    merge_csv_files_to_arrow([tmp_csv_path], tmp_file_path, sample_size=64)
+    out_schema = pq.read_schema(tmp_file_path)
+    out_df = pd.read_parquet(tmp_file_path)
+    expected_df = pd.read_csv(tmp_csv_path)
+    remove_file(tmp_csv_path)
+    remove_file(tmp_file_path)
+
+    assert out_schema.types == [pa.float64(), pa.string(), pa.int64()]
+    assert out_df['a'].tolist() == expected_df['a'].tolist()
+    assert out_df['b'].tolist() == expected_df['b'].astype(str).tolist()
+
+
+UNIFY_DATA = [
+    ([pa.int64()], pa.int64()),
+    ([pa.null(), pa.string()], pa.string()),
+    ([pa.int64(), pa.float64(), pa.null()], pa.float64()),
+    ([pa.int64(), pa.string()], pa.string()),
+    ([pa.null()], pa.string()),
+]
+
+
+@pytest.mark.parametrize(('types', 'expected_type'), UNIFY_DATA)
+def test_unify_types(types: List[pa.DataType], expected_type: pa.DataType):
+    assert unify_types(types) == expected_type
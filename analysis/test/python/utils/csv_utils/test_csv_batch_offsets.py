@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from analysis.src.python.utils.csv_utils import build_csv_batch_offsets
+from analysis.src.python.utils.df_utils import read_df, read_df_in_chunks
+from analysis.test.python.utils import CSV_UTILS_DATA_FOLDER
+
+OFFSETS_DATA = [
+    ('in_1.csv', 1, [1, 1]),
+    ('in_1.csv', 2, [2]),
+    ('in_2.csv', 1, [1, 1]),
+    ('in_2.csv', 5, [2]),
+    ('in_3.csv', 1, []),
+]
+
+
+@pytest.mark.parametrize(('in_file', 'batch_size', 'batch_sizes'), OFFSETS_DATA)
+def test_build_csv_batch_offsets(in_file: str, batch_size: int, batch_sizes: int):
+    in_path = CSV_UTILS_DATA_FOLDER / in_file
+    batch_offsets = build_csv_batch_offsets(in_path, batch_size)
+
+    batches = [read_df(in_path, start_offset, end_offset) for start_offset, end_offset in batch_offsets]
+    assert [batch.shape[0] for batch in batches] == batch_sizes
+
+    if batches:
+        pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), read_df(in_path), check_dtype=False)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2])
+def test_read_df_in_chunks_with_offsets(chunk_size: int):
+    in_path = CSV_UTILS_DATA_FOLDER / 'in_2.csv'
+    start_offset, end_offset = build_csv_batch_offsets(in_path, 1)[1]
+
+    chunks = list(read_df_in_chunks(in_path, chunk_size, start_offset, end_offset))
+
+    assert len(chunks) == 1
+    pd.testing.assert_frame_equal(chunks[0], read_df(in_path).iloc[1:].reset_index(drop=True), check_dtype=False)
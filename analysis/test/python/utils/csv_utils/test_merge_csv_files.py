@@ -0,0 +1,39 @@
+from typing import List
+
+import pandas as pd
+import pytest
+
+from analysis.src.python.utils.csv_utils import merge_csv_files, read_csv_header
+from analysis.src.python.utils.file_utils import remove_file
+from analysis.test.python.utils import CSV_UTILS_DATA_FOLDER
+
+TMP_FILE_PATH = CSV_UTILS_DATA_FOLDER / 'tmp.csv'
+
+MERGE_DATA = [
+    ['in_1.csv'],
+    ['in_1.csv', 'in_2.csv'],
+    ['in_2.csv', 'in_1.csv', 'in_3.csv'],
+    ['in_3.csv', 'in_2.csv', 'in_2.csv'],
+]
+
+
+@pytest.mark.parametrize('in_files', MERGE_DATA)
+def test_merge_csv_files(in_files: List[str]):
+    in_paths = [CSV_UTILS_DATA_FOLDER / in_file for in_file in in_files]
+
+    merge_csv_files(in_paths, TMP_FILE_PATH)
+    out_df = pd.read_csv(TMP_FILE_PATH)
+    remove_file(TMP_FILE_PATH)
+
+    expected_df = pd.concat([pd.read_csv(in_path) for in_path in in_paths], ignore_index=True)
+    pd.testing.assert_frame_equal(out_df, expected_df, check_dtype=False)
+
+
+def test_merge_different_columns():
+    with pytest.raises(ValueError):
+        merge_csv_files([CSV_UTILS_DATA_FOLDER / 'in_1.csv', CSV_UTILS_DATA_FOLDER / 'in_4.csv'], TMP_FILE_PATH)
+    remove_file(TMP_FILE_PATH)
+
+
+def test_read_csv_header():
+    assert read_csv_header(CSV_UTILS_DATA_FOLDER / 'in_4.csv') == ['id', 'code', 'lang', 'grade']
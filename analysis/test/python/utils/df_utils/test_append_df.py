@@ -1,8 +1,11 @@
+import os
 from pathlib import Path
 
+import pyarrow as pa
 import pytest
+from pyarrow import ipc, parquet as pq
 
-from analysis.src.python.utils.df_utils import append_df, equal_df, read_df, write_df
+from analysis.src.python.utils.df_utils import append_df, equal_df, read_df, read_df_in_chunks, write_df
 from analysis.src.python.utils.extension_utils import AnalysisExtension, get_restricted_extension
 from analysis.src.python.utils.file_utils import remove_file
 from analysis.test.python.utils import DF_UTILS_DATA_FOLDER
@@ -10,6 +13,13 @@ from analysis.test.python.utils import DF_UTILS_DATA_FOLDER
 RESOURCES_PATH = DF_UTILS_DATA_FOLDER / 'append_df'
 
 
+def get_row_groups_number(path: Path, ext: AnalysisExtension) -> int:
+    if ext == AnalysisExtension.PARQUET:
+        return pq.ParquetFile(str(path)).num_row_groups
+    with pa.memory_map(str(path)) as source:
+        return ipc.open_file(source).num_record_batches
+
+
 @pytest.mark.parametrize('in_file', ['in_1.csv', 'in_2.xlsx'])
 def test(in_file: Path):
     in_df = read_df(RESOURCES_PATH / in_file)
@@ -25,3 +35,39 @@ def test(in_file: Path):
     assert in_df.shape[0] * 2 == out_df.shape[0]
     assert equal_df(in_df, out_df.head(in_df.shape[0]))
     assert equal_df(in_df, out_df.tail(in_df.shape[0]))
+
+
+@pytest.mark.parametrize('ext', [AnalysisExtension.PARQUET, AnalysisExtension.FEATHER])
+def test_append_row_group(ext: AnalysisExtension):
+    in_df = read_df(RESOURCES_PATH / 'in_1.csv')
+    tmp_file_path = RESOURCES_PATH / f'tmp{ext.value}'
+    remove_file(tmp_file_path)
+    n_appends = 12
+    for _ in range(n_appends):
+        append_df(in_df, tmp_file_path)
+    out_df = read_df(tmp_file_path)
+    chunks = list(read_df_in_chunks(tmp_file_path, in_df.shape[0] * 2))
+    is_file = os.path.isfile(tmp_file_path)
+    n_row_groups = get_row_groups_number(tmp_file_path, ext)
+    remove_file(tmp_file_path)
+
+    assert in_df.shape[0] * n_appends == out_df.shape[0]
+    assert equal_df(in_df, out_df.head(in_df.shape[0]))
+    assert equal_df(in_df, out_df.tail(in_df.shape[0]))
+    # Every appended dataframe is written to a separate row group of the same file
+    assert is_file
+    assert n_row_groups == n_appends
+    assert [chunk.shape[0] for chunk in chunks] == [in_df.shape[0]] * n_appends
+
+
+@pytest.mark.parametrize('ext', [AnalysisExtension.PARQUET, AnalysisExtension.FEATHER])
+def test_write_after_append(ext: AnalysisExtension):
+    in_df = read_df(RESOURCES_PATH / 'in_1.csv')
+    tmp_file_path = RESOURCES_PATH / f'tmp{ext.value}'
+    write_df(in_df, tmp_file_path)
+    append_df(in_df, tmp_file_path)
+    write_df(in_df, tmp_file_path)
+    out_df = read_df(tmp_file_path)
+    remove_file(tmp_file_path)
+
+    assert equal_df(in_df, out_df)
@@ -3,7 +3,9 @@ from typing import Optional, Tuple
 
 import pytest
 
-from analysis.src.python.utils.df_utils import read_df
+from analysis.src.python.utils.df_utils import equal_df, read_df, write_df
+from analysis.src.python.utils.extension_utils import AnalysisExtension
+from analysis.src.python.utils.file_utils import remove_file
 from analysis.test.python.utils import DF_UTILS_DATA_FOLDER
 
 RESOURCES_PATH = DF_UTILS_DATA_FOLDER / 'read_df'
@@ -23,3 +25,17 @@ def test(in_file: Path, shape: Optional[Tuple[int, int]]):
     else:
         with pytest.raises(ValueError):
             read_df(RESOURCES_PATH / in_file)
+
+
+@pytest.mark.parametrize('ext', [AnalysisExtension.CSV, AnalysisExtension.PARQUET, AnalysisExtension.FEATHER])
+def test_read_columns_with_filters(ext: AnalysisExtension):
+    in_df = read_df(RESOURCES_PATH / 'in_1.csv')
+    tmp_file_path = RESOURCES_PATH / f'tmp{ext.value}'
+    remove_file(tmp_file_path)
+    write_df(in_df, tmp_file_path)
+
+    code = in_df['code'][1]
+    out_df = read_df(tmp_file_path, columns=['id', 'lang'], filters=[('code', '==', code)])
+    remove_file(tmp_file_path)
+
+    assert equal_df(in_df.loc[in_df['code'] == code, ['id', 'lang']], out_df)
@@ -0,0 +1,22 @@
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+# Test script for batching: copies input file to the output directory.
+# With `--fail-times` fails given number of times for every batch before success.
+
+parser = argparse.ArgumentParser()
+parser.add_argument('input_path', type=Path)
+parser.add_argument('-o', '--output-path', type=Path)
+parser.add_argument('--fail-times', default=0, type=int)
+args = parser.parse_args()
+
+attempts_path = args.output_path / 'attempts'
+attempts = int(attempts_path.read_text()) if attempts_path.exists() else 0
+attempts_path.write_text(str(attempts + 1))
+
+if attempts < args.fail_times:
+    sys.exit(1)
+
+shutil.copy(args.input_path, args.output_path / args.input_path.name)
@@ -0,0 +1,17 @@
+import argparse
+from pathlib import Path
+
+# Test script for batching by index: writes header and rows between given offsets of input file
+# to the output directory.
+
+parser = argparse.ArgumentParser()
+parser.add_argument('input_path', type=Path)
+parser.add_argument('-o', '--output-path', type=Path)
+parser.add_argument('--start-offset', type=int)
+parser.add_argument('--end-offset', type=int)
+args = parser.parse_args()
+
+with open(args.input_path, 'rb') as input_file, open(args.output_path / args.input_path.name, 'wb') as output_file:
+    output_file.write(input_file.readline())
+    input_file.seek(args.start_offset)
+    output_file.write(input_file.read(args.end_offset - args.start_offset))